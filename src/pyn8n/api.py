@@ -12,27 +12,39 @@ from pyn8n.n8n_decorator import router as n8n_router
 from fastapi.middleware.cors import CORSMiddleware
 
 
-import coloredlogs
 from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
 
-import pyn8n.n8n_nodes  # noqa: F401
+from pyn8n.api_metrics import MetricsMiddleware, monitor_loop_lag, registry
+from pyn8n.generation import GenerationService
+from pyn8n.hot_nodes import NodeDeployer
+from pyn8n.log import configure_logging
+from pyn8n.node_registry import add_node_schemas, load_nodes
+from pyn8n.watchdog import BlockEvent, Watchdog, WatchdogMiddleware, WatchdogSettings
+
+logger = logging.getLogger(__name__)
+
+watchdog_settings = WatchdogSettings()
+watchdog = Watchdog(watchdog_settings.threshold, watchdog_settings.history) if watchdog_settings.enabled else None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Handle FastAPI startup and shutdown events."""
     # Startup events:
-    # - Remove all handlers associated with the root logger object.
-    for handler in logging.root.handlers:
-        logging.root.removeHandler(handler)
-    # - Add coloredlogs' colored StreamHandler to the root logger.
-    coloredlogs.install()
+    # - Replace the root logger's handlers with the queued, non-blocking writer.
+    configure_logging()
 
-    # print(n8n_router.routes)
     for route in app.routes:
-        print(f"Route path: {route.path}, methods: {route.methods}")
+        logger.debug("Route path: %s, methods: %s", route.path, getattr(route, "methods", None))
+    lag_monitor = asyncio.create_task(monitor_loop_lag())
+    if watchdog is not None:
+        watchdog.start()
     yield
     # Shutdown events.
+    lag_monitor.cancel()
+    if watchdog is not None:
+        watchdog.stop()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -46,8 +58,33 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
-# Include the n8n router
+app.add_middleware(MetricsMiddleware)
+if watchdog is not None:
+    app.add_middleware(WatchdogMiddleware, watchdog=watchdog)
+
+# Register discovered nodes (imported lazily on first call) and include the n8n router
+load_nodes(n8n_router)
 app.include_router(n8n_router, prefix="/nodes")
+add_node_schemas(app)
+
+# Generated nodes are deployed into this process at runtime through node_deployer.deploy().
+node_deployer = NodeDeployer(app)
+
+generation = GenerationService()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> str:
+    """Expose request, node and event-loop metrics in the Prometheus text format."""
+    return registry.render()
+
+
+if watchdog is not None:
+
+    @app.get("/debug/blocking")
+    async def blocking_calls() -> list[BlockEvent]:
+        """Recent event-loop stalls with the route and stack that caused them, newest first."""
+        return list(reversed(watchdog.events))
 
 
 @app.get("/compute")
@@ -80,7 +117,7 @@ class VoiceResponse(AgentModel):
 @app.post("/voice")
 async def voice_endpoint(payload: VoicePayload):
     """Echo the text from the payload"""
-    print(f"Received payload: {payload}")
+    logger.info("Received payload: %s", payload, extra={"sample": True})
     prompt = f"""Routes to navigate to [
       "/agent",
       "/agents",
@@ -111,8 +148,9 @@ async def voice_endpoint(payload: VoicePayload):
     ]
     {payload.text}
     """
-    resp = await VoiceResponse.from_prompt(prompt, model="groq:llama3-groq-8b-8192-tool-use-preview")
-    print(f"Response: {resp}")
+    # Not cached (answers depend on the moment), but bounded, rate limited and deduplicated.
+    resp = await generation.generate(VoiceResponse, prompt, cache=False)
+    logger.info("Response: %s", resp, extra={"sample": True})
     return resp
 
 
@@ -0,0 +1,103 @@
+"""
+Prometheus metrics for the pyn8n REST API.
+
+``MetricsMiddleware`` times every HTTP request and labels it with the matched
+route template (``/nodes/compute_factorial``, not the raw URL), so each
+registered ``@n8n_node`` gets its own request count, error count and latency
+histogram. The node endpoints add handler and model-validation time (for
+routes declared with ``@n8n_node`` directly, FastAPI validates the request
+body before the endpoint runs, so only output validation is timed there).
+``monitor_loop_lag`` samples how late the event loop wakes up from a sleep,
+which is the first number to look at when deciding whether a worker is
+saturated.
+
+Metrics are per process: with several gunicorn workers every worker serves
+its own ``/metrics``.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, MutableMapping
+
+from pyn8n.metrics import MetricsRegistry
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class ApiMetrics:
+    """The metric families served by ``/metrics``."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.requests = registry.counter(
+            "pyn8n_http_requests_total", "HTTP requests by route, method and status.", ["route", "method", "status"]
+        )
+        self.latency = registry.histogram(
+            "pyn8n_http_request_duration_seconds", "HTTP request latency by route.", ["route", "method"]
+        )
+        self.in_flight = registry.gauge("pyn8n_http_requests_in_flight", "HTTP requests currently being served.")
+        self.node_handler = registry.histogram(
+            "pyn8n_node_handler_seconds", "Time spent in the registered node function.", ["node"]
+        )
+        self.node_validation = registry.histogram(
+            "pyn8n_node_validation_seconds", "Time spent validating node input and output models.", ["node"]
+        )
+        self.node_errors = registry.counter("pyn8n_node_errors_total", "Node functions that raised.", ["node"])
+        self.loop_lag = registry.gauge("pyn8n_event_loop_lag_seconds", "Most recent event-loop lag sample.")
+        self.loop_lag_histogram = registry.histogram(
+            "pyn8n_event_loop_lag_distribution_seconds", "Event-loop lag samples.", buckets=LAG_BUCKETS
+        )
+
+
+registry = MetricsRegistry()
+metrics = ApiMetrics(registry)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request counts, latency and concurrency."""
+
+    def __init__(self, app: ASGIApp, api_metrics: ApiMetrics = metrics):
+        self.app = app
+        self.metrics = api_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.metrics.in_flight.labels().inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.metrics.in_flight.labels().dec()
+            # The router stores the matched route in the (shared) scope.
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            self.metrics.requests.labels(path, scope["method"], status).inc()
+            self.metrics.latency.labels(path, scope["method"]).observe(elapsed)
+
+
+async def monitor_loop_lag(interval: float = 0.5, api_metrics: ApiMetrics = metrics) -> None:
+    """Sample event-loop lag every ``interval`` seconds until cancelled."""
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = max(0.0, time.perf_counter() - started - interval)
+        api_metrics.loop_lag.labels().set(lag)
+        api_metrics.loop_lag_histogram.labels().observe(lag)
+
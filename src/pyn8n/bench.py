@@ -0,0 +1,168 @@
+"""
+Benchmarks for the N8nClient hot paths, run against the in-process fake API.
+
+Each scenario records throughput and latency percentiles. Results are written
+as JSON and can be compared against a stored baseline, flagging any scenario
+whose median latency or throughput got worse by more than a tolerance::
+
+    pyn8n bench --output bench.json --baseline baseline.json
+"""
+import asyncio
+import json
+import platform
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+
+from pyn8n.fake_n8n import FakeN8n, create_app
+from pyn8n.models import Workflow, WorkflowNode
+from pyn8n.n8n_client import N8nClient
+
+BASE_URL = "http://n8n/api/v1"
+
+
+class BenchResult(BaseModel):
+    name: str = Field(..., description="Scenario name.")
+    operations: int = Field(..., description="Operations measured.")
+    seconds: float = Field(..., description="Total wall-clock time.")
+    ops_per_second: float = Field(..., description="Throughput.")
+    p50_ms: float = Field(..., description="Median latency.")
+    p95_ms: float = Field(..., description="95th percentile latency.")
+    p99_ms: float = Field(..., description="99th percentile latency.")
+
+
+def summarize(name: str, latencies: List[float], seconds: float) -> BenchResult:
+    ordered = sorted(latencies)
+
+    def percentile(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+    return BenchResult(
+        name=name,
+        operations=len(ordered),
+        seconds=seconds,
+        ops_per_second=len(ordered) / seconds if seconds else 0.0,
+        p50_ms=percentile(0.5),
+        p95_ms=percentile(0.95),
+        p99_ms=percentile(0.99),
+    )
+
+
+async def measure(
+    name: str, operation: Callable[[], Awaitable[Any]], iterations: int, concurrency: int = 1
+) -> BenchResult:
+    """Run ``operation`` ``iterations`` times, ``concurrency`` at a time, timing each call."""
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await operation()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed() for _ in range(iterations)))
+    return summarize(name, latencies, time.perf_counter() - started)
+
+
+def make_workflow(node_count: int, name: str = "bench") -> Workflow:
+    nodes = [
+        WorkflowNode(
+            id=f"node-{index}",
+            name=f"Node {index}",
+            type="n8n-nodes-base.manualTrigger" if index == 0 else "n8n-nodes-base.set",
+            typeVersion=1,
+            position=[index * 200, 0],
+            parameters={"values": {"string": [{"name": "field", "value": str(index)}]}},
+        )
+        for index in range(node_count)
+    ]
+    connections = {
+        f"Node {index}": {"main": [[{"node": f"Node {index + 1}", "type": "main", "index": 0}]]}
+        for index in range(node_count - 1)
+    }
+    return Workflow(name=name, nodes=nodes, connections=connections, settings={})
+
+
+def fake_client(state: FakeN8n, app: Optional[Callable[..., Awaitable[None]]] = None, **options: Any) -> N8nClient:
+    """
+    A client served in-process by ``state``, without a network.
+
+    ``app`` replaces ``create_app(state)``, e.g. to wrap it with fault injection;
+    ``options`` are passed on to N8nClient.
+    """
+    app = create_app(state) if app is None else app
+    return N8nClient(base_url=BASE_URL, transport=httpx.ASGITransport(app=app), **options)
+
+
+async def run_benchmarks(iterations: int = 200, workflows: int = 500) -> List[BenchResult]:
+    """Run every scenario against a freshly seeded fake instance."""
+    state = FakeN8n()
+    state.seed(workflows=workflows, nodes_per_workflow=10)
+    client = fake_client(state)
+    results: List[BenchResult] = []
+    try:
+        for page_size in (10, 100, 250):
+            results.append(
+                await measure(f"get_workflows[limit={page_size}]", lambda: client.get_workflows(limit=page_size), iterations)
+            )
+
+        for node_count in (10, 100, 1000):
+            workflow = make_workflow(node_count)
+            runs = max(5, iterations // (node_count // 10))
+            results.append(
+                await measure(f"create_workflow[nodes={node_count}]", lambda: client.create_workflow(workflow), runs)
+            )
+
+        workflow_ids = list(state.workflows.items)
+        for concurrency in (1, 16, 64):
+            ids = iter(workflow_ids * (iterations // len(workflow_ids) + 1))
+            results.append(
+                await measure(
+                    f"get_workflow[concurrency={concurrency}]",
+                    lambda: client.get_workflow(str(next(ids))),
+                    iterations,
+                    concurrency=concurrency,
+                )
+            )
+
+        for node_count in (10, 100, 1000):
+            payload = make_workflow(node_count).model_dump()
+
+            async def parse() -> Workflow:
+                return Workflow.model_validate(payload)
+
+            results.append(await measure(f"parse_workflow[nodes={node_count}]", parse, iterations))
+    finally:
+        await client.shutdown()
+    return results
+
+
+def write_results(results: List[BenchResult], path: Path) -> None:
+    document = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.time(),
+        "results": {result.name: result.model_dump(exclude={"name"}) for result in results},
+    }
+    path.write_text(json.dumps(document, indent=2))
+
+
+def compare(results: List[BenchResult], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[str]:
+    """Describe every scenario that is slower than ``baseline`` by more than ``tolerance``."""
+    regressions = []
+    for result in results:
+        previous = baseline.get("results", {}).get(result.name)
+        if previous is None:
+            continue
+        if result.p50_ms > previous["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{result.name}: p50 {previous['p50_ms']:.2f}ms -> {result.p50_ms:.2f}ms")
+        if result.ops_per_second < previous["ops_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}: {previous['ops_per_second']:.0f}/s -> {result.ops_per_second:.0f}/s"
+            )
+    return regressions
@@ -0,0 +1,207 @@
+"""
+Fluent construction of workflows.
+
+>>> wf = WorkflowBuilder("Webhook to Slack")
+>>> check = wf.add("n8n-nodes-base.webhook", parameters={"path": "in"}).then("n8n-nodes-base.if", name="Check")
+>>> ok, failed = check.branch("n8n-nodes-base.slack", "n8n-nodes-base.noOp")
+>>> workflow = wf.build()
+>>> [node.name for node in workflow.nodes]
+['Webhook', 'Check', 'Slack', 'NoOp']
+>>> workflow.connections["Check"]["main"][1]
+[{'node': 'NoOp', 'type': 'main', 'index': 0}]
+
+Connections are kept in n8n's own shape (source name -> type -> output ->
+targets) as they are added, so ``build()`` only has to check that every target
+exists, lay out nodes that have no explicit position, and create the models:
+O(nodes + connections) in total.
+"""
+import uuid
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pyn8n.models import Workflow, WorkflowNode, WorkflowSettings
+
+NodeRef = Union["NodeHandle", WorkflowNode, str]
+
+
+class WorkflowBuildError(ValueError):
+    pass
+
+
+class NodeHandle:
+    """A node added to a ``WorkflowBuilder``; chaining methods connect from it."""
+
+    __slots__ = ("builder", "name")
+
+    def __init__(self, builder: "WorkflowBuilder", name: str):
+        self.builder = builder
+        self.name = name
+
+    def then(self, node: NodeRef, output: int = 0, input_index: int = 0, **fields: Any) -> "NodeHandle":
+        """Connect ``output`` of this node to input ``input_index`` of ``node`` (added if new) and return the target."""
+        target = self.builder.resolve(node, **fields)
+        self.builder.connect(self, target, output=output, input_index=input_index)
+        return target
+
+    def to(self, *nodes: NodeRef, output: int = 0) -> List["NodeHandle"]:
+        """Fan ``output`` of this node out to several nodes."""
+        return [self.then(node, output=output) for node in nodes]
+
+    def branch(self, *nodes: Optional[NodeRef]) -> List[Optional["NodeHandle"]]:
+        """Connect output ``i`` to ``nodes[i]`` (e.g. the true/false outputs of an IF); ``None`` leaves an output open."""
+        return [None if node is None else self.then(node, output=index) for index, node in enumerate(nodes)]
+
+    def __repr__(self) -> str:
+        return f"NodeHandle({self.name!r})"
+
+
+class WorkflowBuilder:
+    """Accumulates nodes and connections and emits a ``Workflow``."""
+
+    def __init__(
+        self,
+        name: str,
+        settings: Optional[WorkflowSettings] = None,
+        spacing: Tuple[int, int] = (220, 160),
+    ):
+        self.name = name
+        self.settings = settings or WorkflowSettings()
+        self.spacing = spacing
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.connections: Dict[str, Dict[str, List[List[Dict[str, Any]]]]] = {}
+        self.outgoing: Dict[str, List[str]] = {}
+        self.name_counts: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def unique_name(self, base: str) -> str:
+        count = self.name_counts.get(base, 0)
+        name = base if count == 0 else f"{base}{count}"
+        while name in self.nodes:
+            count += 1
+            name = f"{base}{count}"
+        self.name_counts[base] = count + 1
+        return name
+
+    def add(
+        self,
+        node: Union[WorkflowNode, str],
+        name: Optional[str] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        type_version: float = 1,
+        **fields: Any,
+    ) -> NodeHandle:
+        """
+        Add a node, given either as a ``WorkflowNode`` or a node type such as
+        ``"n8n-nodes-base.set"``. Names default to the type's short name,
+        numbered like the n8n editor does (``Set``, ``Set1``, ...).
+        """
+        if isinstance(node, WorkflowNode):
+            data = node.model_dump(exclude_unset=True)
+            if name is not None:
+                data["name"] = name
+        else:
+            base = node.rsplit(".", 1)[-1]
+            data = {
+                "name": name or self.unique_name(base[:1].upper() + base[1:]),
+                "type": node,
+                "typeVersion": type_version,
+                "parameters": parameters or {},
+                **fields,
+            }
+        if data["name"] in self.nodes:
+            raise WorkflowBuildError(f"duplicate node name: {data['name']}")
+        self.nodes[data["name"]] = data
+        return NodeHandle(self, data["name"])
+
+    def resolve(self, node: NodeRef, **fields: Any) -> NodeHandle:
+        """A handle for an existing node (handle or name) or a newly added one."""
+        if isinstance(node, NodeHandle):
+            return node
+        if isinstance(node, str) and node in self.nodes and not fields:
+            return NodeHandle(self, node)
+        return self.add(node, **fields)
+
+    def connect(
+        self, source: Union[NodeHandle, str], target: Union[NodeHandle, str], output: int = 0, input_index: int = 0,
+        connection_type: str = "main",
+    ) -> None:
+        """Connect ``output`` of ``source`` to input ``input_index`` of ``target``; either may be added later."""
+        source_name = source.name if isinstance(source, NodeHandle) else source
+        target_name = target.name if isinstance(target, NodeHandle) else target
+        outputs = self.connections.setdefault(source_name, {}).setdefault(connection_type, [])
+        while len(outputs) <= output:
+            outputs.append([])
+        outputs[output].append({"node": target_name, "type": connection_type, "index": input_index})
+        self.outgoing.setdefault(source_name, []).append(target_name)
+
+    def merge(self, *sources: Union[NodeHandle, str], into: NodeRef = "n8n-nodes-base.merge", **fields: Any) -> NodeHandle:
+        """Connect each source to the next input of a merge node (added if new) and return it."""
+        target = self.resolve(into, **fields)
+        for index, source in enumerate(sources):
+            self.connect(source, target, input_index=index)
+        return target
+
+    def layout(self) -> Dict[str, List[int]]:
+        """
+        Left-to-right layered positions: a node's column is its longest path from
+        a root, rows are stacked within a column. Nodes on cycles go last.
+        """
+        incoming = dict.fromkeys(self.nodes, 0)
+        for targets in self.outgoing.values():
+            for target in targets:
+                incoming[target] += 1
+        column = dict.fromkeys(self.nodes, 0)
+        ready = deque(name for name, count in incoming.items() if count == 0)
+        placed = []
+        while ready:
+            name = ready.popleft()
+            placed.append(name)
+            for target in self.outgoing.get(name, ()):
+                column[target] = max(column[target], column[name] + 1)
+                incoming[target] -= 1
+                if incoming[target] == 0:
+                    ready.append(target)
+        if len(placed) < len(self.nodes):
+            last = max(column.values(), default=0) + 1
+            for name in self.nodes:
+                if incoming[name] > 0:
+                    column[name] = last
+                    placed.append(name)
+
+        rows: Dict[int, int] = {}
+        positions = {}
+        dx, dy = self.spacing
+        for name in placed:
+            row = rows.get(column[name], 0)
+            rows[column[name]] = row + 1
+            positions[name] = [column[name] * dx, row * dy]
+        return positions
+
+    def build(self) -> Workflow:
+        """Validate the graph and return the ``Workflow``."""
+        if not self.nodes:
+            raise WorkflowBuildError("a workflow needs at least one node")
+        for source, targets in self.outgoing.items():
+            if source not in self.nodes:
+                raise WorkflowBuildError(f"connection from unknown node: {source}")
+            for target in targets:
+                if target not in self.nodes:
+                    raise WorkflowBuildError(f"connection from {source} to unknown node: {target}")
+
+        positions = self.layout() if any("position" not in data for data in self.nodes.values()) else {}
+        ids = set()
+        nodes = []
+        for name, data in self.nodes.items():
+            node = WorkflowNode(**{"id": str(uuid.uuid4()), **data, "position": data.get("position") or positions[name]})
+            if node.id in ids:
+                raise WorkflowBuildError(f"duplicate node id: {node.id}")
+            ids.add(node.id)
+            nodes.append(node)
+        # Copy the output lists so further use of the builder cannot change the built workflow.
+        connections = {
+            source: {kind: [list(targets) for targets in outputs] for kind, outputs in types.items()}
+            for source, types in self.connections.items()
+        }
+        return Workflow(name=self.name, nodes=nodes, connections=connections, settings=self.settings)
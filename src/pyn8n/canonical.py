@@ -0,0 +1,199 @@
+"""
+Canonical form, hashing and structural diff of workflows.
+
+The canonical form keeps only what a user can change. It drops:
+
+* read-only fields: workflow and node ids, ``createdAt``, ``updatedAt`` and tags
+  (tags are managed through their own endpoint)
+* fields left at their model defaults, so a value the server fills in equals one
+  that was never set
+
+Nodes are ordered by name, connection targets are sorted, and empty outputs are
+removed. Two workflows with equal hashes need no ``update_workflow``:
+
+>>> from pyn8n.builder import WorkflowBuilder
+>>> local = WorkflowBuilder("Demo")
+>>> _ = local.add("n8n-nodes-base.manualTrigger").then("n8n-nodes-base.set", parameters={"keep": True})
+>>> a, b = local.build(), local.build()  # same graph, different node ids
+>>> workflow_hash(a) == workflow_hash(b)
+True
+>>> b.nodes[1].parameters["keep"] = False
+>>> invalidate(b)
+>>> [(change.op, change.path) for change in diff_workflows(a, b)]
+[('change', 'nodes.Set.parameters.keep')]
+
+Hashes are cached per workflow object, so comparing a fleet repeatedly costs
+one canonicalisation per object. Call ``invalidate`` after mutating a workflow
+in place.
+"""
+import hashlib
+import json
+import weakref
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+
+from pyn8n.models import Workflow
+
+READ_ONLY_FIELDS = {"id", "tags", "createdAt", "updatedAt"}
+
+_hashes: Dict[int, str] = {}
+
+
+class Change(BaseModel):
+    op: str = Field(..., description="add, remove, change or rename.")
+    path: str = Field(..., description="Dotted location, e.g. nodes.Set.parameters.value or connections.")
+    old: Any = Field(None, description="Previous value.")
+    new: Any = Field(None, description="New value.")
+
+
+class WorkflowDiff(BaseModel):
+    changes: List[Change] = Field(default_factory=list, description="Minimal changes from old to new.")
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __iter__(self) -> Iterator[Change]:  # type: ignore[override]
+        return iter(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+
+def canonical_connections(connections: Dict[str, Any]) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    for source, types in connections.items():
+        kinds = {}
+        for kind, outputs in (types or {}).items():
+            outputs = [
+                sorted(targets or [], key=lambda target: (target["node"], target.get("type", ""), target.get("index", 0)))
+                for targets in outputs or []
+            ]
+            while outputs and not outputs[-1]:
+                outputs.pop()
+            if outputs:
+                kinds[kind] = outputs
+        if kinds:
+            result[source] = kinds
+    return result
+
+
+def canonical(workflow: Workflow) -> Dict[str, Any]:
+    """The workflow as a plain dict containing only user-editable state, in a stable order."""
+    document = workflow.model_dump(exclude_defaults=True, exclude=READ_ONLY_FIELDS | {"nodes", "connections"})
+    document["nodes"] = sorted(
+        (node.model_dump(exclude_defaults=True, exclude={"id"}) for node in workflow.nodes), key=lambda node: node["name"]
+    )
+    document["connections"] = canonical_connections(workflow.connections)
+    if not document.get("settings"):
+        document.pop("settings", None)
+    return document
+
+
+def canonical_json(workflow: Workflow) -> str:
+    return json.dumps(canonical(workflow), sort_keys=True, separators=(",", ":"), default=str)
+
+
+def workflow_hash(workflow: Workflow) -> str:
+    """SHA-256 of the canonical form, computed once per object."""
+    key = id(workflow)
+    cached = _hashes.get(key)
+    if cached is None:
+        cached = _hashes[key] = hashlib.sha256(canonical_json(workflow).encode()).hexdigest()
+        weakref.finalize(workflow, _hashes.pop, key, None)
+    return cached
+
+
+def invalidate(workflow: Workflow) -> None:
+    """Forget the cached hash of a workflow that was modified in place."""
+    _hashes.pop(id(workflow), None)
+
+
+def same_workflow(a: Workflow, b: Workflow) -> bool:
+    return workflow_hash(a) == workflow_hash(b)
+
+
+def diff_values(path: str, old: Any, new: Any, changes: List[Change]) -> None:
+    """Append the leaf-level changes turning ``old`` into ``new``."""
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in sorted(old.keys() | new.keys()):
+            child = f"{path}.{key}"
+            if key not in new:
+                changes.append(Change(op="remove", path=child, old=old[key]))
+            elif key not in old:
+                changes.append(Change(op="add", path=child, new=new[key]))
+            else:
+                diff_values(child, old[key], new[key], changes)
+    elif isinstance(old, list) and isinstance(new, list):
+        for index in range(max(len(old), len(new))):
+            child = f"{path}[{index}]"
+            if index >= len(new):
+                changes.append(Change(op="remove", path=child, old=old[index]))
+            elif index >= len(old):
+                changes.append(Change(op="add", path=child, new=new[index]))
+            else:
+                diff_values(child, old[index], new[index], changes)
+    else:
+        changes.append(Change(op="change", path=path, old=old, new=new))
+
+
+def edges(connections: Dict[str, Any]) -> Set[Tuple[str, str, int, str, int]]:
+    return {
+        (source, kind, output, target["node"], target.get("index", 0))
+        for source, types in connections.items()
+        for kind, outputs in types.items()
+        for output, targets in enumerate(outputs)
+        for target in targets
+    }
+
+
+def diff_workflows(old: Workflow, new: Workflow) -> WorkflowDiff:
+    """
+    Structural changes from ``old`` to ``new``: top-level fields and settings,
+    nodes (matched by name, renames detected through node ids) down to
+    individual parameters, and connections as added or removed edges.
+    """
+    changes: List[Change] = []
+    if same_workflow(old, new):
+        return WorkflowDiff()
+    before, after = canonical(old), canonical(new)
+
+    for key in sorted((before.keys() | after.keys()) - {"nodes", "connections"}):
+        diff_values(key, before.get(key), after.get(key), changes)
+
+    old_nodes = {node["name"]: node for node in before["nodes"]}
+    new_nodes = {node["name"]: node for node in after["nodes"]}
+    renamed: Dict[str, str] = {}
+    old_ids = {node.id: node.name for node in old.nodes if node.id and node.name not in new_nodes}
+    for node in new.nodes:
+        previous: Optional[str] = old_ids.get(node.id) if node.id else None
+        if node.name not in old_nodes and previous is not None:
+            renamed[previous] = node.name
+            changes.append(Change(op="rename", path=f"nodes.{previous}", old=previous, new=node.name))
+
+    new_names = set(renamed.values())
+    for name in sorted(old_nodes.keys() | new_nodes.keys()):
+        if name in new_names:
+            continue
+        if name in renamed:
+            source, target = dict(old_nodes[name], name=renamed[name]), new_nodes[renamed[name]]
+            diff_values(f"nodes.{renamed[name]}", source, target, changes)
+        elif name not in new_nodes:
+            changes.append(Change(op="remove", path=f"nodes.{name}", old=old_nodes[name]))
+        elif name not in old_nodes:
+            changes.append(Change(op="add", path=f"nodes.{name}", new=new_nodes[name]))
+        else:
+            diff_values(f"nodes.{name}", old_nodes[name], new_nodes[name], changes)
+
+    old_edges = {
+        (renamed.get(source, source), kind, output, renamed.get(target, target), index)
+        for source, kind, output, target, index in edges(before["connections"])
+    }
+    new_edges = edges(after["connections"])
+    for edge in sorted(old_edges - new_edges):
+        changes.append(Change(op="remove", path="connections", old=list(edge)))
+    for edge in sorted(new_edges - old_edges):
+        changes.append(Change(op="add", path="connections", new=list(edge)))
+    return WorkflowDiff(changes=changes)
@@ -1,14 +1,23 @@
 """pyn8n CLI."""
 
+import asyncio
+from pathlib import Path
+from typing import Optional
+
 import typer
 from rich import print
 
-from pyn8n.client import N8nClient
-from pyn8n.cmds import devops
+from pyn8n.n8n_client import N8nClient
+from pyn8n.cmds import credentials, devops, executions, tags, users
+from pyn8n.restore import restore_archive
 
 app = typer.Typer()
 
 app.add_typer(devops.app, name="devops")
+app.add_typer(executions.app, name="executions")
+app.add_typer(users.app, name="users")
+app.add_typer(credentials.app, name="credentials")
+app.add_typer(tags.app, name="tags")
 
 @app.command()
 def fire(name: str = "Chell") -> None:
@@ -18,6 +27,170 @@ def fire(name: str = "Chell") -> None:
     client = N8nClient()
 
 
+@app.command("import")
+def import_archive(
+    archive: Path = typer.Argument(..., exists=True, dir_okay=False, help="Export archive (.jsonl or .jsonl.gz)."),
+    checkpoint: Path = typer.Option(None, help="Checkpoint file used to resume an interrupted restore."),
+    concurrency: int = typer.Option(8, min=1, help="Maximum number of concurrent API calls per level."),
+    activate: bool = typer.Option(True, help="Activate workflows that were active when exported."),
+) -> None:
+    """Restore an export archive into the configured n8n instance."""
+
+    async def run():
+        client = N8nClient()
+        try:
+            return await restore_archive(client, archive, checkpoint, concurrency=concurrency, activate=activate)
+        finally:
+            await client.shutdown()
+
+    report = asyncio.run(run())
+    for kind, count in report.created.items():
+        print(f"[green]Created[/green] {count} {kind}(s)")
+    for kind, count in report.skipped.items():
+        print(f"[yellow]Skipped[/yellow] {count} {kind}(s) already in checkpoint")
+    for error in report.errors:
+        print(f"[bold red]Failed[/bold red] {error.kind} {error.old_id}: {error.message}")
+    if report.errors:
+        raise typer.Exit(code=1)
+
+
+@app.command("fake-server")
+def fake_server(
+    host: str = typer.Option("127.0.0.1", help="Bind socket to this host."),
+    port: int = typer.Option(5678, help="Bind socket to this port."),
+    latency_ms: float = typer.Option(0.0, help="Maximum random latency added to each response."),
+    error_rate: float = typer.Option(0.0, min=0.0, max=1.0, help="Probability of answering 500."),
+    rate_limit: Optional[float] = typer.Option(None, help="Requests per second above which to answer 429."),
+    seed_workflows: int = typer.Option(0, help="Number of generated workflows."),
+    seed_executions: int = typer.Option(0, help="Number of generated executions."),
+    seed_tags: int = typer.Option(0, help="Number of generated tags."),
+) -> None:
+    """Serve an in-memory stand-in of the n8n public API for offline and load tests."""
+    import uvicorn
+
+    from pyn8n.fake_n8n import FakeN8n, create_app
+
+    state = FakeN8n()
+    state.seed(workflows=seed_workflows, executions=seed_executions, tags=seed_tags)
+    fake = create_app(state, latency=(0.0, latency_ms / 1000), error_rate=error_rate, rate_limit=rate_limit)
+    print(f"Fake n8n API on http://{host}:{port}/api/v1")
+    uvicorn.run(fake, host=host, port=port, log_level="warning")
+
+
+@app.command()
+def bench(
+    output: Path = typer.Option(Path("bench.json"), help="Where to write the results."),
+    baseline: Optional[Path] = typer.Option(None, exists=True, dir_okay=False, help="Previous results to compare against."),
+    tolerance: float = typer.Option(0.2, min=0.0, help="Allowed slowdown before failing (0.2 = 20%)."),
+    iterations: int = typer.Option(200, min=10, help="Operations per scenario."),
+) -> None:
+    """Benchmark the client hot paths against the in-process fake API."""
+    import json
+
+    from pyn8n.bench import compare, run_benchmarks, write_results
+
+    results = asyncio.run(run_benchmarks(iterations=iterations))
+    for result in results:
+        typer.echo(
+            f"{result.name:<32} {result.ops_per_second:>9.0f}/s  "
+            f"p50 {result.p50_ms:7.2f}ms  p95 {result.p95_ms:7.2f}ms  p99 {result.p99_ms:7.2f}ms"
+        )
+    write_results(results, output)
+
+    if baseline is None:
+        return
+    regressions = compare(results, json.loads(baseline.read_text()), tolerance)
+    for regression in regressions:
+        typer.echo(f"Regression {regression}", err=True)
+    if regressions:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def validate(
+    path: Path = typer.Argument(..., exists=True, help="Workflow JSON file, or a directory searched recursively."),
+    workers: Optional[int] = typer.Option(None, min=1, help="Worker processes (default: one per core)."),
+    strict: bool = typer.Option(False, help="Treat warnings as errors."),
+) -> None:
+    """Validate exported workflows offline, before they reach the server."""
+    from pyn8n.validator import validate_directory, validate_file
+
+    results = validate_directory(path, workers=workers) if path.is_dir() else dict([validate_file(path)])
+    failed = 0
+    for file, issues in results.items():
+        blocking = [issue for issue in issues if strict or issue.severity == "error"]
+        failed += bool(blocking)
+        for issue in issues:
+            where = f" [{issue.node}]" if issue.node else ""
+            typer.echo(f"{file}: {issue.severity}: {issue.code}{where}: {issue.message}")
+    typer.echo(f"{len(results)} workflow(s) checked, {failed} invalid")
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def generate(
+    prompts: Path = typer.Argument(..., exists=True, dir_okay=False, help="Text file with one workflow prompt per line."),
+    attempts: int = typer.Option(3, min=1, help="Generations per prompt, including repairs."),
+    concurrency: int = typer.Option(8, min=1, help="Prompts processed at once."),
+    upload: bool = typer.Option(True, help="Create the valid workflows on the configured n8n instance."),
+) -> None:
+    """Generate workflows from prompts, repairing invalid ones before upload."""
+    from pyn8n.workflow_pipeline import WorkflowPipeline
+
+    lines = [line.strip() for line in prompts.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+    async def run():
+        client = N8nClient() if upload else None
+        try:
+            return await WorkflowPipeline(client, max_attempts=attempts, concurrency=concurrency).run(lines)
+        finally:
+            if client is not None:
+                await client.shutdown()
+
+    outcomes = asyncio.run(run())
+    for outcome in outcomes:
+        status = outcome.error or ("ok" if outcome.valid else f"{len(outcome.issues)} issue(s) left")
+        created = f" -> {outcome.uploaded.id}" if outcome.uploaded is not None else ""
+        typer.echo(f"{outcome.prompt}: {status} after {outcome.attempts} attempt(s){created}")
+    if not all(outcome.valid and not outcome.error for outcome in outcomes):
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("0.0.0.0", help="Bind socket to this host."),
+    port: int = typer.Option(8000, help="Bind socket to this port."),
+    workers: Optional[int] = typer.Option(None, min=1, help="Worker processes (default: one per usable core)."),
+    backlog: int = typer.Option(2048, min=1, help="Maximum number of pending connections."),
+    keepalive: int = typer.Option(5, min=0, help="Seconds to hold idle keep-alive connections open."),
+    timeout: int = typer.Option(30, min=0, help="Seconds before a silent worker is killed and restarted."),
+    graceful_timeout: int = typer.Option(30, min=0, help="Seconds workers get to finish requests on reload or shutdown."),
+    max_requests: int = typer.Option(0, min=0, help="Recycle each worker after this many requests (0 = never)."),
+    max_requests_jitter: int = typer.Option(0, min=0, help="Random extra requests before recycling, to stagger restarts."),
+    pidfile: Optional[Path] = typer.Option(None, help="Write the master PID here (send it SIGHUP to reload)."),
+    reload: bool = typer.Option(False, help="Restart workers when code changes (development only; disables preload)."),
+) -> None:
+    """Serve the node API with gunicorn and uvicorn workers."""
+    from pyn8n.serve import NodeServer, gunicorn_options
+
+    options = gunicorn_options(
+        host=host,
+        port=port,
+        workers=workers,
+        backlog=backlog,
+        keepalive=keepalive,
+        timeout=timeout,
+        graceful_timeout=graceful_timeout,
+        max_requests=max_requests,
+        max_requests_jitter=max_requests_jitter,
+        pidfile=str(pidfile) if pidfile else None,
+        reload=reload,
+    )
+    print(f"Serving pyn8n API on http://{host}:{port} with {options['workers']} worker(s)")
+    NodeServer("pyn8n.api:app", options).run()
+
+
 @app.command()
 def version() -> None:
     """Print version."""
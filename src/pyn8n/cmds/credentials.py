@@ -0,0 +1,37 @@
+import asyncio
+from pathlib import Path
+
+import typer
+
+from pyn8n.credentials import CredentialReport, CredentialSchemaCache, provision_credentials, read_specs
+from pyn8n.n8n_client import N8nClient
+
+app = typer.Typer(help="Manage n8n credentials.")
+
+
+@app.command()
+def provision(
+    specs: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help='JSON list of {name, type, data}; secrets as {"env": NAME} or {"file": PATH}.'
+    ),
+    concurrency: int = typer.Option(8, min=1, help="Maximum number of credentials created at once."),
+    refresh_schemas: bool = typer.Option(False, help="Fetch credential type schemas again instead of using the cache."),
+):
+    """Validate credentials locally against their type schemas and create them concurrently."""
+
+    async def run() -> CredentialReport:
+        client = N8nClient()
+        try:
+            schemas = CredentialSchemaCache(client)
+            if refresh_schemas:
+                schemas.invalidate()
+            return await provision_credentials(client, read_specs(specs), schemas, concurrency=concurrency)
+        finally:
+            await client.shutdown()
+
+    report = asyncio.run(run())
+    for result in report.failed:
+        typer.echo(f"{result.status} {result.name} ({result.type}): {'; '.join(result.errors)}")
+    typer.echo(f"{report.created} created, {len(report.failed)} not created ({report.elapsed:.1f}s)")
+    if report.failed:
+        raise typer.Exit(code=1)
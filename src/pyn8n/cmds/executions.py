@@ -0,0 +1,139 @@
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from pyn8n.analytics import ExecutionStore, execution_status
+from pyn8n.n8n_client import N8nClient
+from pyn8n.prune import PruneFilter, PruneReport, prune_executions
+
+app = typer.Typer(help="Inspect and maintain n8n execution history.")
+
+
+def print_progress(report: PruneReport) -> None:
+    typer.echo(
+        f"  matched={report.matched} deleted={report.deleted} missing={report.missing} "
+        f"failed={report.failed} ({report.rate:.0f}/s)"
+    )
+
+
+@app.command()
+def prune(
+    status: Optional[str] = typer.Option(None, help="Only executions with this status (error, success, waiting)."),
+    workflow_id: Optional[str] = typer.Option(None, help="Only executions of this workflow."),
+    project_id: Optional[str] = typer.Option(None, help="Only executions in this project."),
+    older_than_days: Optional[float] = typer.Option(None, help="Only executions started more than this many days ago."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Count matching executions without deleting them."),
+    concurrency: int = typer.Option(8, min=1, help="Maximum number of deletes in flight."),
+    rate: float = typer.Option(50.0, min=0.1, help="Maximum deletes per second."),
+):
+    """Delete execution history matching the given filters."""
+    prune_filter = PruneFilter(
+        status=status,
+        workflow_id=workflow_id,
+        project_id=project_id,
+        older_than=timedelta(days=older_than_days) if older_than_days is not None else None,
+    )
+
+    async def run() -> PruneReport:
+        client = N8nClient()
+        try:
+            return await prune_executions(
+                client, prune_filter, dry_run=dry_run, concurrency=concurrency, rate=rate, on_progress=print_progress
+            )
+        finally:
+            await client.shutdown()
+
+    report = asyncio.run(run())
+    if dry_run:
+        typer.echo(f"{report.matched} executions would be deleted.")
+        return
+    print_progress(report)
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def ingest(
+    db: Path = typer.Option(Path("executions.sqlite3"), help="Local analytics database."),
+    workflow_id: Optional[str] = typer.Option(None, help="Only ingest executions of this workflow."),
+):
+    """Pull new executions into the local analytics database."""
+    store = ExecutionStore(db)
+
+    async def run() -> int:
+        client = N8nClient()
+        try:
+            return await store.ingest(client, workflow_id=workflow_id)
+        finally:
+            await client.shutdown()
+
+    try:
+        typer.echo(f"Ingested {asyncio.run(run())} new executions.")
+    finally:
+        store.close()
+
+
+@app.command()
+def stats(
+    db: Path = typer.Option(Path("executions.sqlite3"), help="Local analytics database."),
+    since_hours: float = typer.Option(24.0, help="Only consider executions started in the last N hours."),
+):
+    """Show runtime percentiles and error rates per workflow from the local database."""
+    store = ExecutionStore(db)
+    window = timedelta(hours=since_hours)
+    try:
+        percentiles = store.duration_percentiles(since=window)
+        for workflow_id, rates in sorted(store.status_rates(since=window).items()):
+            durations = percentiles.get(workflow_id, {})
+            summary = " ".join(f"p{int(p * 100)}={seconds:.2f}s" for p, seconds in durations.items())
+            typer.echo(
+                f"{workflow_id}: {rates.total} runs, {rates.error_rate:.1%} errors"
+                + (f", {summary}" if summary else "")
+            )
+    finally:
+        store.close()
+
+
+@app.command()
+def tail(
+    workflow_id: Optional[str] = typer.Option(None, help="Only follow executions of this workflow."),
+    status: Optional[str] = typer.Option(None, help="Only follow executions with this status."),
+    project_id: Optional[str] = typer.Option(None, help="Only follow executions in this project."),
+    since_id: Optional[int] = typer.Option(None, help="Start after this execution ID instead of the newest one."),
+    min_interval: float = typer.Option(1.0, help="Fastest poll interval in seconds."),
+    max_interval: float = typer.Option(30.0, help="Slowest poll interval in seconds when idle."),
+):
+    """Follow new executions as they happen (Ctrl-C to stop)."""
+
+    async def run() -> None:
+        client = N8nClient()
+        try:
+            async for execution in client.watch_executions(
+                workflow_id=workflow_id,
+                status=status,
+                project_id=project_id,
+                since_id=since_id,
+                min_interval=min_interval,
+                max_interval=max_interval,
+            ):
+                duration = (
+                    f"{(execution.stoppedAt - execution.startedAt).total_seconds():.2f}s" if execution.stoppedAt else "-"
+                )
+                typer.echo(
+                    f"{execution.startedAt.isoformat()} {execution.id:>8} workflow={execution.workflowId} "
+                    f"{execution_status(execution):<8} {duration}"
+                )
+        finally:
+            await client.shutdown()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    app()
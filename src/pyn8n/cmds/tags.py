@@ -0,0 +1,39 @@
+import asyncio
+from typing import List, Optional
+
+import typer
+
+from pyn8n.n8n_client import N8nClient
+from pyn8n.tags import RetagReport, TagIndex, WorkflowFilter
+
+app = typer.Typer(help="Manage n8n tags.")
+
+
+@app.command()
+def retag(
+    add: List[str] = typer.Option([], "--add", help="Tag name to add (repeatable); created if missing."),
+    remove: List[str] = typer.Option([], "--remove", help="Tag name to remove (repeatable)."),
+    tag: List[str] = typer.Option([], "--tag", help="Only workflows carrying this tag (repeatable)."),
+    name: Optional[str] = typer.Option(None, help="Only workflows with exactly this name."),
+    active: Optional[bool] = typer.Option(None, help="Only active (or inactive) workflows."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what would change without changing it."),
+    concurrency: int = typer.Option(8, min=1, help="Maximum number of updates in flight."),
+):
+    """Add and remove tags on every matching workflow, updating only those that change."""
+    workflow_filter = WorkflowFilter(active=active, tags=tag or None, name=name)
+
+    async def run() -> RetagReport:
+        client = N8nClient()
+        try:
+            return await TagIndex(client, concurrency=concurrency).retag(workflow_filter, add, remove, dry_run=dry_run)
+        finally:
+            await client.shutdown()
+
+    report = asyncio.run(run())
+    for workflow_id, error in report.errors.items():
+        typer.echo(f"failed {workflow_id}: {error}")
+    verb = "would update" if dry_run else "updated"
+    created = f", created tags: {', '.join(report.created_tags)}" if report.created_tags else ""
+    typer.echo(f"matched={report.matched} {verb}={report.updated} unchanged={report.unchanged}{created}")
+    if report.errors:
+        raise typer.Exit(code=1)
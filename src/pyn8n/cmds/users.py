@@ -0,0 +1,47 @@
+import asyncio
+from pathlib import Path
+
+import typer
+
+from pyn8n.n8n_client import N8nClient
+from pyn8n.users import DEFAULT_BATCH_SIZE, ProvisioningReport, UserInvite, provision_users
+
+app = typer.Typer(help="Manage n8n users.")
+
+
+def read_invites(path: Path) -> list:
+    """One ``email[,role]`` per line; blank lines and ``#`` comments are skipped."""
+    invites = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        email, _, role = (part.strip() for part in line.partition(","))
+        invites.append(UserInvite(email=email, role=role) if role else UserInvite(email=email))
+    return invites
+
+
+@app.command()
+def provision(
+    invites: Path = typer.Argument(..., exists=True, dir_okay=False, help="File with one email[,role] per line."),
+    batch_size: int = typer.Option(DEFAULT_BATCH_SIZE, min=1, help="Users per POST /users request."),
+    concurrency: int = typer.Option(4, min=1, help="Maximum number of requests in flight."),
+    update_roles: bool = typer.Option(True, help="Change the role of existing users to the one listed."),
+):
+    """Invite missing users and align the roles of existing ones."""
+
+    async def run() -> ProvisioningReport:
+        client = N8nClient()
+        try:
+            return await provision_users(
+                client, read_invites(invites), batch_size=batch_size, concurrency=concurrency, update_roles=update_roles
+            )
+        finally:
+            await client.shutdown()
+
+    report = asyncio.run(run())
+    for result in report.failed:
+        typer.echo(f"failed {result.email}: {result.error}")
+    typer.echo(" ".join(f"{status}={count}" for status, count in report.counts().items()) + f" ({report.elapsed:.1f}s)")
+    if report.failed:
+        raise typer.Exit(code=1)
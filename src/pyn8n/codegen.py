@@ -0,0 +1,124 @@
+"""
+Code generation from the package templates.
+
+Templates are loaded from ``pyn8n/templates`` (not the working directory) and
+compiled once: the compiled bytecode is cached on disk, so later runs and
+every worker process skip Jinja's parse and compile step.
+
+``render_batch`` renders many jobs on a process pool and writes each output
+only when its content hash differs from the file already on disk. Unchanged
+files keep their modification time, so ``make``, bytecode caches and the
+node registry snapshot do not see them as changed:
+
+>>> from pyn8n.node_renderer import example_node
+>>> source = render("node.j2", **example_node())
+>>> "def example_node(body: ExampleNodeInput) -> ExampleNodeOutput:" in source
+True
+"""
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings
+
+from pyn8n.files import atomic_write
+
+
+class CodegenSettings(BaseSettings):
+    """Code generation configuration, read from ``PYN8N_CODEGEN_*`` environment variables."""
+
+    bytecode_cache: Optional[Path] = Path.home() / ".cache" / "pyn8n" / "jinja"
+
+    class Config:
+        env_prefix = "PYN8N_CODEGEN_"
+
+
+class RenderJob(BaseModel):
+    template: str = Field(..., description="Template name under pyn8n/templates, e.g. node.j2.")
+    context: Dict[str, Any] = Field(default_factory=dict, description="Template variables.")
+    path: Path = Field(..., description="File to write the output to.")
+
+    @classmethod
+    def from_model(cls, template: str, model: BaseModel, path: Path, **context: Any) -> "RenderJob":
+        """A job rendering ``template`` with the fields of ``model`` (plus ``context``) as variables."""
+        return cls(template=template, context={**model.model_dump(), **context}, path=path)
+
+
+class RenderResult(BaseModel):
+    path: Path = Field(..., description="File the output belongs in.")
+    sha256: str = Field(..., description="Hash of the rendered output.")
+    written: bool = Field(..., description="False when the file already had this content.")
+
+
+@lru_cache(maxsize=None)
+def environment(bytecode_cache: Optional[str] = None) -> Environment:
+    """The shared template environment, one per bytecode cache directory and process."""
+    cache = None
+    if bytecode_cache is not None:
+        Path(bytecode_cache).mkdir(parents=True, exist_ok=True)
+        cache = FileSystemBytecodeCache(bytecode_cache)
+    return Environment(
+        loader=PackageLoader("pyn8n", "templates"),
+        bytecode_cache=cache,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        # Templates ship with the package; do not stat them on every lookup.
+        auto_reload=False,
+    )
+
+
+def default_environment() -> Environment:
+    cache = CodegenSettings().bytecode_cache
+    return environment(str(cache) if cache else None)
+
+
+def render(template: str, env: Optional[Environment] = None, **context: Any) -> str:
+    """Render a package template to a string."""
+    return (env or default_environment()).get_template(template).render(**context)
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: Path, content: str) -> RenderResult:
+    """Write ``content`` to ``path`` (atomically) unless the file already holds exactly that."""
+    data = content.encode("utf-8")
+    digest = content_hash(data)
+    try:
+        if path.stat().st_size == len(data) and content_hash(path.read_bytes()) == digest:
+            return RenderResult(path=path, sha256=digest, written=False)
+    except FileNotFoundError:
+        pass
+    atomic_write(path, data)
+    return RenderResult(path=path, sha256=digest, written=True)
+
+
+def render_job(job: RenderJob, bytecode_cache: Optional[str] = None) -> RenderResult:
+    return write_if_changed(job.path, render(job.template, environment(bytecode_cache), **job.context))
+
+
+def render_batch(
+    jobs: Iterable[RenderJob],
+    workers: Optional[int] = None,
+    bytecode_cache: Optional[Path] = None,
+) -> List[RenderResult]:
+    """
+    Render and write every job across ``workers`` processes, in order.
+
+    ``bytecode_cache`` defaults to ``CodegenSettings().bytecode_cache``.
+    """
+    jobs = list(jobs)
+    cache = bytecode_cache or CodegenSettings().bytecode_cache
+    work = partial(render_job, bytecode_cache=str(cache) if cache else None)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        return list(map(work, jobs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(work, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
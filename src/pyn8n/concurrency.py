@@ -0,0 +1,78 @@
+"""Concurrency helpers shared by the bulk n8n operations."""
+import asyncio
+import time
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+
+async def run_bounded(
+    items: Union[Iterable[T], AsyncIterable[T]],
+    worker: Callable[[T], Awaitable[Any]],
+    concurrency: int = 8,
+) -> None:
+    """
+    Feed ``items`` to ``worker`` with at most ``concurrency`` calls in flight.
+
+    Items are pulled lazily through a bounded queue, so a large (or streamed)
+    input never has to be materialised in memory. The first exception raised
+    by a worker cancels the remaining workers and is re-raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    done = object()
+
+    async def consume() -> None:
+        while True:
+            item = await queue.get()
+            if item is done:
+                return
+            await worker(item)
+
+    async def produce() -> None:
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                await queue.put(item)
+        else:
+            for item in items:
+                await queue.put(item)
+        for _ in range(concurrency):
+            await queue.put(done)
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            group.create_task(produce())
+            for _ in range(concurrency):
+                group.create_task(consume())
+    except ExceptionGroup as exc:
+        raise exc.exceptions[0] from None
+
+
+class RateLimiter:
+    """
+    Token bucket allowing ``rate`` acquisitions per second, with bursts of up to ``burst``.
+
+    Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
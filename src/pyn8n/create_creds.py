@@ -1,5 +1,6 @@
 import asyncio
 
+from pyn8n.credentials import CredentialSpec, provision_credentials
 from pyn8n.n8n_client import N8nClient
 from pyn8n.models import *
 
@@ -13,18 +14,19 @@ async def create_credentials():
     )
 
     try:
-        # Define the credential to create
-        new_credential = Credential(
+        # Define the credential to create; the key is read from the environment, never stored here
+        new_credential = CredentialSpec(
             name="Groq API Key",   # Name of the credential
             type="groqApi",       # Credential type as defined in n8n
-            data={"apiKey": "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"}  # Replace with your Groq API Key
+            data={"apiKey": {"env": "GROQ_API_KEY"}}
         )
 
-        # Create the credential using the client
-        created_credential = await client.create_credential(new_credential)
+        # Validate against the (cached) groqApi schema and create the credential
+        report = await provision_credentials(client, [new_credential])
 
         # Output the created credential
-        print(f"Created Credential: {created_credential}")
+        for result in report.results:
+            print(f"Credential {result.name}: {result.status} {result.id or ''} {' '.join(result.errors)}")
 
     except Exception as e:
         print(f"An error occurred: {e}")
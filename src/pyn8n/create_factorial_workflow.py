@@ -1,6 +1,7 @@
 import httpx
 from pyn8n.n8n_client import N8nClient
 from pyn8n.models import *
+from pyn8n.validator import validate_workflow
 
 
 async def main():
@@ -13,6 +14,13 @@ async def main():
         # Use the helper function to create a valid workflow model
         workflow = await Workflow.from_json(file_path="factorial_workflow.json")
 
+        # Check the graph locally rather than learning about it from a 400
+        issues = [issue for issue in validate_workflow(workflow) if issue.severity == "error"]
+        if issues:
+            for issue in issues:
+                print(f"   Invalid workflow: {issue.code}: {issue.message}")
+            return
+
         # Create the workflow
         print("Creating a workflow with Cron and Manual triggers...")
         # print(f"   Workflow: {workflow}\n")
@@ -0,0 +1,240 @@
+"""
+Credential schema cache and bulk credential provisioning.
+
+``CredentialSchemaCache`` keeps the data schema of each credential type
+(``GET /credentials/schema/{type}``) in memory and in a versioned JSON file,
+per n8n instance, so a schema is fetched once per ``max_age`` rather than once
+per credential. Credential data is checked against it locally
+(``schema_errors``, which covers the JSON-schema subset n8n emits: types,
+``required``, ``enum``, ``additionalProperties`` and ``allOf`` of
+``if``/``then``/``else``), so a typo costs no round-trip.
+
+``provision_credentials`` creates many credentials concurrently from specs
+whose secrets come from the environment or from files, never from the spec
+itself::
+
+    [{"name": "Groq", "type": "groqApi", "data": {"apiKey": {"env": "GROQ_API_KEY"}}},
+     {"name": "Mail", "type": "smtp", "data": {"user": "bot", "password": {"file": "/run/secrets/smtp"}}}]
+"""
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings
+
+from pyn8n.concurrency import run_bounded
+from pyn8n.files import atomic_write
+from pyn8n.models import Credential
+from pyn8n.n8n_client import N8nClient
+
+CACHE_VERSION = 1
+
+JSON_TYPES = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+    "null": type(None),
+}
+
+
+class CredentialSettings(BaseSettings):
+    """Credential tooling configuration, read from ``PYN8N_CREDENTIALS_*`` environment variables."""
+
+    schema_cache: Optional[Path] = Path.home() / ".cache" / "pyn8n" / "credential-schemas.json"
+    schema_max_age: float = 7 * 24 * 3600
+
+    class Config:
+        env_prefix = "PYN8N_CREDENTIALS_"
+
+
+class CredentialSpec(BaseModel):
+    name: str = Field(..., description="Name of the credential.")
+    type: str = Field(..., description="Credential type, e.g. groqApi.")
+    data: Dict[str, Any] = Field(
+        default_factory=dict, description='Credential data; a value may be {"env": NAME} or {"file": PATH}.'
+    )
+
+
+class CredentialResult(BaseModel):
+    name: str = Field(..., description="Name of the credential.")
+    type: str = Field(..., description="Credential type.")
+    status: str = Field(..., description="created, invalid or failed.")
+    id: Optional[str] = Field(None, description="Id of the created credential.")
+    errors: List[str] = Field(default_factory=list, description="Why the credential was not created.")
+
+
+class CredentialReport(BaseModel):
+    results: List[CredentialResult] = Field(default_factory=list, description="One entry per spec, in input order.")
+    elapsed: float = Field(0.0, description="Wall-clock seconds spent.")
+
+    @property
+    def created(self) -> int:
+        return sum(result.status == "created" for result in self.results)
+
+    @property
+    def failed(self) -> List[CredentialResult]:
+        return [result for result in self.results if result.status != "created"]
+
+
+def matches_type(value: Any, expected: Any) -> bool:
+    names = expected if isinstance(expected, list) else [expected]
+    for name in names:
+        python_type = JSON_TYPES.get(name)
+        if python_type is None:
+            return True
+        # bool is an int in Python but not a number in JSON.
+        if isinstance(value, python_type) and not (isinstance(value, bool) and name in ("number", "integer")):
+            return True
+    return False
+
+
+def schema_errors(schema: Mapping[str, Any], value: Any, path: str = "data") -> List[str]:
+    """Messages for every way ``value`` violates ``schema``; unknown keywords are ignored."""
+    errors: List[str] = []
+    if "type" in schema and not matches_type(value, schema["type"]):
+        return [f"{path} must be {schema['type']}"]
+    if "enum" in schema and value not in schema["enum"]:
+        errors.append(f"{path} must be one of {schema['enum']}")
+    if isinstance(value, dict):
+        properties = schema.get("properties", {})
+        for key in schema.get("required", ()):
+            if key not in value:
+                errors.append(f"{path} is missing required property {key!r}")
+        for key, item in value.items():
+            if key in properties:
+                errors.extend(schema_errors(properties[key], item, f"{path}.{key}"))
+            elif schema.get("additionalProperties") is False:
+                errors.append(f"{path} has unknown property {key!r}")
+    for part in schema.get("allOf", ()):
+        errors.extend(schema_errors(part, value, path))
+    if "if" in schema:
+        branch = schema.get("then") if not schema_errors(schema["if"], value, path) else schema.get("else")
+        if branch:
+            errors.extend(schema_errors(branch, value, path))
+    return errors
+
+
+class CredentialSchemaCache:
+    """Credential type schemas of one n8n instance, cached in memory and on disk."""
+
+    def __init__(self, client: N8nClient, settings: Optional[CredentialSettings] = None):
+        self.client = client
+        self.settings = settings or CredentialSettings()
+        self.path = self.settings.schema_cache
+        self.schemas: Dict[str, Dict[str, Any]] = self.read().get(client.base_url, {})
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self.fetched = 0
+
+    def read(self) -> Dict[str, Any]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            document = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return document.get("instances", {}) if document.get("version") == CACHE_VERSION else {}
+
+    def write(self) -> None:
+        if self.path is None:
+            return
+        # Merge with what other processes cached for other instances since we started.
+        instances = self.read()
+        instances[self.client.base_url] = self.schemas
+        atomic_write(self.path, json.dumps({"version": CACHE_VERSION, "instances": instances}))
+
+    def fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        return entry is not None and time.time() - entry["fetched"] < self.settings.schema_max_age
+
+    async def get(self, credential_type: str) -> Dict[str, Any]:
+        """The data schema of ``credential_type``, fetched at most once however many callers wait for it."""
+        entry = self.schemas.get(credential_type)
+        if self.fresh(entry):
+            return entry["schema"]
+        lock = self.locks.setdefault(credential_type, asyncio.Lock())
+        async with lock:
+            entry = self.schemas.get(credential_type)
+            if not self.fresh(entry):
+                schema = await self.client.get_credential_type(credential_type)
+                self.fetched += 1
+                entry = self.schemas[credential_type] = {"schema": schema, "fetched": time.time()}
+                self.write()
+        return entry["schema"]
+
+    def invalidate(self, credential_type: Optional[str] = None) -> None:
+        """Drop one cached schema, or all of this instance's."""
+        if credential_type is None:
+            self.schemas.clear()
+        else:
+            self.schemas.pop(credential_type, None)
+        self.write()
+
+    async def validate(self, credential: Credential) -> List[str]:
+        return schema_errors(await self.get(credential.type), credential.data)
+
+
+def resolve_secrets(data: Dict[str, Any], environ: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+    """Replace ``{"env": NAME}`` and ``{"file": PATH}`` values with the secret they point to."""
+    environ = os.environ if environ is None else environ
+    resolved = {}
+    for key, value in data.items():
+        if isinstance(value, dict) and value.keys() == {"env"}:
+            if value["env"] not in environ:
+                raise KeyError(f"environment variable {value['env']} is not set (for {key!r})")
+            value = environ[value["env"]]
+        elif isinstance(value, dict) and value.keys() == {"file"}:
+            value = Path(value["file"]).expanduser().read_text(encoding="utf-8").strip()
+        elif isinstance(value, dict):
+            value = resolve_secrets(value, environ)
+        resolved[key] = value
+    return resolved
+
+
+def read_specs(path: Path) -> List[CredentialSpec]:
+    return [CredentialSpec(**spec) for spec in json.loads(path.read_text(encoding="utf-8"))]
+
+
+async def provision_credentials(
+    client: N8nClient,
+    specs: Iterable[CredentialSpec],
+    schemas: Optional[CredentialSchemaCache] = None,
+    concurrency: int = 8,
+    environ: Optional[Mapping[str, str]] = None,
+) -> CredentialReport:
+    """
+    Resolve the secrets of every spec, validate them against the cached type
+    schemas and create the valid credentials, ``concurrency`` at a time.
+    """
+    started = time.monotonic()
+    schemas = schemas or CredentialSchemaCache(client)
+    specs = list(specs)
+    results: List[Optional[CredentialResult]] = [None] * len(specs)
+
+    async def provision(item) -> None:
+        index, spec = item
+        try:
+            credential = Credential(name=spec.name, type=spec.type, data=resolve_secrets(spec.data, environ))
+        except (KeyError, OSError) as exc:
+            results[index] = CredentialResult(name=spec.name, type=spec.type, status="invalid", errors=[str(exc)])
+            return
+        try:
+            errors = await schemas.validate(credential)
+            if errors:
+                results[index] = CredentialResult(name=spec.name, type=spec.type, status="invalid", errors=errors)
+                return
+            created = await client.create_credential(credential)
+        except httpx.HTTPError as exc:
+            message = f"{exc.response.status_code}: {exc.response.text}" if isinstance(exc, httpx.HTTPStatusError) else str(exc)
+            results[index] = CredentialResult(name=spec.name, type=spec.type, status="failed", errors=[message])
+            return
+        results[index] = CredentialResult(name=spec.name, type=spec.type, status="created", id=created.id)
+
+    await run_bounded(enumerate(specs), provision, concurrency)
+    return CredentialReport(results=results, elapsed=time.monotonic() - started)  # type: ignore[arg-type]
@@ -0,0 +1,588 @@
+"""
+In-memory stand-in for the n8n public API (``openapi.yml``), served as an ASGI app.
+
+The fake is stateful: workflows, executions, tags, variables, projects,
+credentials and users live in memory and list endpoints use the same
+``limit``/``cursor`` pagination as n8n: offset cursors for workflows, tags,
+users and variables (so a page shifts when earlier items disappear), last-id
+cursors for the others. Latency, random server errors and
+429 throttling can be injected to exercise concurrency, retries and caching
+under realistic conditions without a real instance::
+
+    app = create_app(latency=(0.0, 0.02), error_rate=0.01, rate_limit=200)
+    client = N8nClient(base_url="http://n8n/api/v1", transport=httpx.ASGITransport(app=app))
+
+or over the network::
+
+    pyn8n fake-server --port 5678 --seed-workflows 1000 --seed-executions 100000
+"""
+import asyncio
+import base64
+import bisect
+import itertools
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+BASE_PATH = "/api/v1"
+
+WORKFLOW_FIELDS = {"name", "nodes", "connections", "settings", "staticData"}
+EXECUTION_STATUSES = ("success", "error", "waiting")
+
+
+class ApiError(Exception):
+    def __init__(self, status_code: int, message: str):
+        self.status_code = status_code
+        self.message = message
+
+
+def now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"lastId": last_id}).encode()).decode()
+
+
+def decode_cursor(cursor: str, field: str = "lastId") -> int:
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor.encode()))[field])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ApiError(400, "Invalid cursor") from exc
+
+
+def encode_offset_cursor(limit: int, offset: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"limit": limit, "offset": offset}).encode()).decode()
+
+
+class Collection:
+    """
+    Objects keyed by integer ID, kept in ID order for cursor pagination.
+    ``offset`` collections page by position in the (filtered) listing, like
+    n8n's workflow, tag, user and variable endpoints, instead of by last id.
+    """
+
+    def __init__(self, newest_first: bool = False, offset: bool = False):
+        self.items: Dict[int, Dict[str, Any]] = {}
+        self.ids: List[int] = []
+        self.newest_first = newest_first
+        self.offset = offset
+        self.next_id = 1
+
+    def add(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        item_id = self.next_id
+        self.next_id += 1
+        item["id"] = str(item_id)
+        self.items[item_id] = item
+        self.ids.append(item_id)
+        return item
+
+    def get(self, item_id: Any) -> Dict[str, Any]:
+        try:
+            return self.items[int(item_id)]
+        except (KeyError, ValueError):
+            raise ApiError(404, "Not Found") from None
+
+    def remove(self, item_id: Any) -> Dict[str, Any]:
+        item = self.get(item_id)
+        key = int(item["id"])
+        del self.items[key]
+        del self.ids[bisect.bisect_left(self.ids, key)]
+        return item
+
+    def find(self, predicate: Callable[[Dict[str, Any]], bool]) -> Optional[Dict[str, Any]]:
+        return next((item for item in self.items.values() if predicate(item)), None)
+
+    def page(
+        self,
+        limit: Optional[int],
+        cursor: Optional[str],
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Dict[str, Any]:
+        limit = min(int(limit or 100), 250)
+        if self.offset:
+            return self.offset_page(limit, cursor, predicate)
+        if self.newest_first:
+            end = bisect.bisect_left(self.ids, decode_cursor(cursor)) if cursor else len(self.ids)
+            candidates = (self.ids[index] for index in range(end - 1, -1, -1))
+        else:
+            start = bisect.bisect_right(self.ids, decode_cursor(cursor)) if cursor else 0
+            candidates = (self.ids[index] for index in range(start, len(self.ids)))
+
+        data: List[Dict[str, Any]] = []
+        for item_id in candidates:
+            item = self.items[item_id]
+            if predicate is None or predicate(item):
+                data.append(item)
+                if len(data) == limit:
+                    break
+        more = len(data) == limit
+        return {"data": data, "nextCursor": encode_cursor(int(data[-1]["id"])) if more else None}
+
+    def offset_page(
+        self,
+        limit: int,
+        cursor: Optional[str],
+        predicate: Optional[Callable[[Dict[str, Any]], bool]],
+    ) -> Dict[str, Any]:
+        offset = decode_cursor(cursor, "offset") if cursor else 0
+        matching = (item for item in (self.items[item_id] for item_id in self.ids) if predicate is None or predicate(item))
+        # One item past the page tells whether another page follows.
+        data = list(itertools.islice(matching, offset, offset + limit + 1))
+        more = len(data) > limit
+        return {"data": data[:limit], "nextCursor": encode_offset_cursor(limit, offset + limit) if more else None}
+
+
+class FakeN8n:
+    """The in-memory state behind the fake API."""
+
+    def __init__(self):
+        self.workflows = Collection(offset=True)
+        self.executions = Collection(newest_first=True)
+        self.tags = Collection(offset=True)
+        self.variables = Collection(offset=True)
+        self.projects = Collection()
+        self.credentials = Collection()
+        self.users = Collection(offset=True)
+        self.credential_schemas: Dict[str, Dict[str, Any]] = {}
+        self.workflow_tags: Dict[str, List[str]] = {}
+
+    def workflow_view(self, workflow: Dict[str, Any]) -> Dict[str, Any]:
+        tags = [self.tags.items[int(tag_id)] for tag_id in self.workflow_tags.get(workflow["id"], [])
+                if int(tag_id) in self.tags.items]
+        return {**workflow, "tags": tags}
+
+    def add_workflow(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        missing = {"name", "nodes", "connections", "settings"} - body.keys()
+        if missing:
+            raise ApiError(400, f"request/body must have required property '{sorted(missing)[0]}'")
+        unknown = body.keys() - WORKFLOW_FIELDS
+        if unknown:
+            raise ApiError(400, f"request/body must NOT have additional properties ({sorted(unknown)[0]})")
+        stamp = now()
+        return self.workflows.add({
+            **{key: body[key] for key in WORKFLOW_FIELDS if key in body},
+            "active": False,
+            "createdAt": stamp,
+            "updatedAt": stamp,
+        })
+
+    def add_execution(
+        self,
+        workflow_id: str,
+        status: str = "success",
+        started_at: Optional[datetime] = None,
+        duration: float = 1.0,
+        mode: str = "trigger",
+    ) -> Dict[str, Any]:
+        started_at = started_at or datetime.now(timezone.utc)
+        finished = status == "success"
+        stopped = None if status in ("waiting", "running") else (started_at + timedelta(seconds=duration)).isoformat()
+        return self.executions.add({
+            "finished": finished,
+            "mode": mode,
+            "status": status,
+            "retryOf": None,
+            "retrySuccessId": None,
+            "startedAt": started_at.isoformat(),
+            "stoppedAt": stopped,
+            "workflowId": workflow_id,
+            "waitTill": None,
+        })
+
+    def seed(self, workflows: int = 0, executions: int = 0, tags: int = 0, nodes_per_workflow: int = 2) -> None:
+        """Populate the instance with generated objects for load tests."""
+        rng = random.Random(0)
+        for index in range(tags):
+            self.tags.add({"name": f"tag-{index}", "createdAt": now(), "updatedAt": now()})
+        workflow_ids = []
+        for index in range(workflows):
+            nodes = [
+                {
+                    "id": f"node-{node}",
+                    "name": f"Node {node}",
+                    "type": "n8n-nodes-base.manualTrigger" if node == 0 else "n8n-nodes-base.set",
+                    "typeVersion": 1,
+                    "position": [node * 200, 0],
+                    "parameters": {},
+                }
+                for node in range(nodes_per_workflow)
+            ]
+            connections = {
+                f"Node {node}": {"main": [[{"node": f"Node {node + 1}", "type": "main", "index": 0}]]}
+                for node in range(nodes_per_workflow - 1)
+            }
+            workflow = self.add_workflow(
+                {"name": f"Workflow {index}", "nodes": nodes, "connections": connections, "settings": {}}
+            )
+            workflow_ids.append(workflow["id"])
+        start = datetime.now(timezone.utc) - timedelta(days=30)
+        for index in range(executions if workflow_ids else 0):
+            self.add_execution(
+                rng.choice(workflow_ids),
+                status=rng.choices(EXECUTION_STATUSES, weights=(90, 9, 1))[0],
+                started_at=start + timedelta(seconds=index * 30 * 86400 / executions),
+                duration=rng.expovariate(1.0),
+            )
+
+
+class Throttle:
+    """Fixed-rate token bucket deciding when to answer 429."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        # Hold at least one token, or a rate below 1/s would never let a request through.
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def allow(self) -> bool:
+        current = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (current - self.updated) * self.rate)
+        self.updated = current
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+def build_router(state: FakeN8n) -> APIRouter:
+    router = APIRouter()
+
+    # Workflows
+
+    @router.get("/workflows")
+    async def get_workflows(
+        active: Optional[bool] = None,
+        tags: Optional[str] = None,
+        name: Optional[str] = None,
+        projectId: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        wanted = set(tags.split(",")) if tags else None
+
+        def matches(workflow: Dict[str, Any]) -> bool:
+            if active is not None and workflow["active"] != active:
+                return False
+            if name is not None and workflow["name"] != name:
+                return False
+            if projectId is not None and workflow.get("projectId") != projectId:
+                return False
+            if wanted is not None:
+                names = {tag["name"] for tag in state.workflow_view(workflow)["tags"]}
+                return wanted <= names
+            return True
+
+        page = state.workflows.page(limit, cursor, matches)
+        return {**page, "data": [state.workflow_view(workflow) for workflow in page["data"]]}
+
+    @router.post("/workflows")
+    async def create_workflow(request: Request):
+        return state.workflow_view(state.add_workflow(await request.json()))
+
+    @router.get("/workflows/{workflow_id}")
+    async def get_workflow(workflow_id: str):
+        return state.workflow_view(state.workflows.get(workflow_id))
+
+    @router.put("/workflows/{workflow_id}")
+    async def update_workflow(workflow_id: str, request: Request):
+        workflow = state.workflows.get(workflow_id)
+        body = await request.json()
+        unknown = body.keys() - WORKFLOW_FIELDS
+        if unknown:
+            raise ApiError(400, f"request/body must NOT have additional properties ({sorted(unknown)[0]})")
+        workflow.update(body)
+        workflow["updatedAt"] = now()
+        return state.workflow_view(workflow)
+
+    @router.delete("/workflows/{workflow_id}")
+    async def delete_workflow(workflow_id: str):
+        workflow = state.workflow_view(state.workflows.remove(workflow_id))
+        state.workflow_tags.pop(workflow_id, None)
+        return workflow
+
+    @router.post("/workflows/{workflow_id}/activate")
+    async def activate_workflow(workflow_id: str):
+        workflow = state.workflows.get(workflow_id)
+        workflow["active"] = True
+        return state.workflow_view(workflow)
+
+    @router.post("/workflows/{workflow_id}/deactivate")
+    async def deactivate_workflow(workflow_id: str):
+        workflow = state.workflows.get(workflow_id)
+        workflow["active"] = False
+        return state.workflow_view(workflow)
+
+    @router.put("/workflows/{workflow_id}/transfer")
+    async def transfer_workflow(workflow_id: str, request: Request):
+        workflow = state.workflows.get(workflow_id)
+        destination = (await request.json())["destinationProjectId"]
+        state.projects.get(destination)
+        workflow["projectId"] = destination
+        return {}
+
+    @router.get("/workflows/{workflow_id}/tags")
+    async def get_workflow_tags(workflow_id: str):
+        return state.workflow_view(state.workflows.get(workflow_id))["tags"]
+
+    @router.put("/workflows/{workflow_id}/tags")
+    async def update_workflow_tags(workflow_id: str, request: Request):
+        workflow = state.workflows.get(workflow_id)
+        tag_ids = [str(tag["id"]) for tag in await request.json()]
+        for tag_id in tag_ids:
+            state.tags.get(tag_id)
+        state.workflow_tags[workflow_id] = tag_ids
+        return state.workflow_view(workflow)["tags"]
+
+    # Executions
+
+    @router.get("/executions")
+    async def get_executions(
+        status: Optional[str] = None,
+        workflowId: Optional[str] = None,
+        projectId: Optional[str] = None,
+        includeData: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        project_workflows = None
+        if projectId is not None:
+            project_workflows = {wf["id"] for wf in state.workflows.items.values() if wf.get("projectId") == projectId}
+
+        def matches(execution: Dict[str, Any]) -> bool:
+            if status is not None and execution["status"] != status:
+                return False
+            if workflowId is not None and execution["workflowId"] != workflowId:
+                return False
+            return project_workflows is None or execution["workflowId"] in project_workflows
+
+        return state.executions.page(limit, cursor, matches)
+
+    @router.get("/executions/{execution_id}")
+    async def get_execution(execution_id: str):
+        return state.executions.get(execution_id)
+
+    @router.delete("/executions/{execution_id}")
+    async def delete_execution(execution_id: str):
+        return state.executions.remove(execution_id)
+
+    # Credentials
+
+    @router.post("/credentials")
+    async def create_credential(request: Request):
+        body = await request.json()
+        for field in ("name", "type", "data"):
+            if field not in body:
+                raise ApiError(400, f"request/body must have required property '{field}'")
+        stamp = now()
+        credential = state.credentials.add({**body, "createdAt": stamp, "updatedAt": stamp})
+        return {key: value for key, value in credential.items() if key != "data"}
+
+    @router.delete("/credentials/{credential_id}")
+    async def delete_credential(credential_id: str):
+        credential = state.credentials.remove(credential_id)
+        return {key: value for key, value in credential.items() if key != "data"}
+
+    @router.get("/credentials/schema/{credential_type}")
+    async def get_credential_type(credential_type: str):
+        if credential_type not in state.credential_schemas:
+            raise ApiError(404, "Not Found")
+        return state.credential_schemas[credential_type]
+
+    @router.put("/credentials/{credential_id}/transfer")
+    async def transfer_credential(credential_id: str, request: Request):
+        credential = state.credentials.get(credential_id)
+        destination = (await request.json())["destinationProjectId"]
+        state.projects.get(destination)
+        credential["projectId"] = destination
+        return Response(status_code=200)
+
+    # Tags
+
+    @router.post("/tags", status_code=201)
+    async def create_tag(request: Request):
+        body = await request.json()
+        if state.tags.find(lambda tag: tag["name"] == body.get("name")):
+            raise ApiError(409, "Tag already exists")
+        stamp = now()
+        return state.tags.add({"name": body["name"], "createdAt": stamp, "updatedAt": stamp})
+
+    @router.get("/tags")
+    async def get_tags(limit: Optional[int] = None, cursor: Optional[str] = None):
+        return state.tags.page(limit, cursor)
+
+    @router.get("/tags/{tag_id}")
+    async def get_tag(tag_id: str):
+        return state.tags.get(tag_id)
+
+    @router.put("/tags/{tag_id}")
+    async def update_tag(tag_id: str, request: Request):
+        tag = state.tags.get(tag_id)
+        body = await request.json()
+        if state.tags.find(lambda other: other["name"] == body.get("name") and other is not tag):
+            raise ApiError(409, "Tag already exists")
+        tag.update(name=body["name"], updatedAt=now())
+        return tag
+
+    @router.delete("/tags/{tag_id}")
+    async def delete_tag(tag_id: str):
+        return state.tags.remove(tag_id)
+
+    # Variables
+
+    @router.post("/variables", status_code=201)
+    async def create_variable(request: Request):
+        body = await request.json()
+        if state.variables.find(lambda variable: variable["key"] == body.get("key")):
+            raise ApiError(409, "Variable already exists")
+        return state.variables.add({"key": body["key"], "value": body["value"], "type": "string"})
+
+    @router.get("/variables")
+    async def get_variables(limit: Optional[int] = None, cursor: Optional[str] = None):
+        return state.variables.page(limit, cursor)
+
+    @router.delete("/variables/{variable_id}", status_code=204)
+    async def delete_variable(variable_id: str):
+        state.variables.remove(variable_id)
+        return Response(status_code=204)
+
+    # Projects
+
+    @router.post("/projects", status_code=201)
+    async def create_project(request: Request):
+        body = await request.json()
+        return state.projects.add({"name": body["name"], "type": "team"})
+
+    @router.get("/projects")
+    async def get_projects(limit: Optional[int] = None, cursor: Optional[str] = None):
+        return state.projects.page(limit, cursor)
+
+    @router.delete("/projects/{project_id}", status_code=204)
+    async def delete_project(project_id: str):
+        state.projects.remove(project_id)
+        return Response(status_code=204)
+
+    @router.put("/projects/{project_id}", status_code=204)
+    async def update_project(project_id: str, request: Request):
+        state.projects.get(project_id)["name"] = (await request.json())["name"]
+        return Response(status_code=204)
+
+    # Users
+
+    def find_user(identifier: str) -> Dict[str, Any]:
+        user = state.users.find(lambda user: user["email"] == identifier)
+        return user or state.users.get(identifier)
+
+    @router.get("/users")
+    async def get_users(
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        includeRole: bool = False,
+        projectId: Optional[str] = None,
+    ):
+        page = state.users.page(limit, cursor)
+        if not includeRole:
+            page["data"] = [{key: value for key, value in user.items() if key != "role"} for user in page["data"]]
+        return page
+
+    @router.post("/users")
+    async def create_users(request: Request):
+        results = []
+        for invite in await request.json():
+            if state.users.find(lambda user: user["email"] == invite["email"]):
+                results.append({"user": {"email": invite["email"]}, "error": "Email already in use"})
+                continue
+            stamp = now()
+            user = state.users.add({
+                "email": invite["email"],
+                "role": invite.get("role", "global:member"),
+                "isPending": True,
+                "createdAt": stamp,
+                "updatedAt": stamp,
+            })
+            results.append({
+                "user": {"id": user["id"], "email": user["email"], "inviteAcceptUrl": "", "emailSent": False},
+                "error": "",
+            })
+        return results
+
+    @router.get("/users/{identifier}")
+    async def get_user(identifier: str, includeRole: bool = False):
+        user = find_user(identifier)
+        return user if includeRole else {key: value for key, value in user.items() if key != "role"}
+
+    @router.delete("/users/{identifier}", status_code=204)
+    async def delete_user(identifier: str):
+        state.users.remove(find_user(identifier)["id"])
+        return Response(status_code=204)
+
+    @router.patch("/users/{identifier}/role")
+    async def change_user_role(identifier: str, request: Request):
+        find_user(identifier)["role"] = (await request.json())["newRoleName"]
+        return {}
+
+    # Audit and source control
+
+    @router.post("/audit")
+    async def generate_audit():
+        return {"Credentials Risk Report": {"risk": "credentials", "sections": []}}
+
+    @router.post("/source-control/pull")
+    async def pull_changes():
+        return {"variables": {"added": [], "changed": []}, "credentials": [], "workflows": [], "tags": {}}
+
+    return router
+
+
+def create_app(
+    state: Optional[FakeN8n] = None,
+    latency: Tuple[float, float] = (0.0, 0.0),
+    error_rate: float = 0.0,
+    rate_limit: Optional[float] = None,
+    api_key: Optional[str] = None,
+    seed: Optional[int] = None,
+) -> FastAPI:
+    """
+    Build the fake API.
+
+    ``latency`` is a (min, max) range of seconds added to every response,
+    ``error_rate`` the probability of answering 500, and ``rate_limit`` the
+    sustained requests per second above which requests get 429 with a
+    ``Retry-After`` header. When ``api_key`` is set, other keys get 401.
+    """
+    state = state or FakeN8n()
+    rng = random.Random(seed)
+    throttle = Throttle(rate_limit) if rate_limit else None
+
+    app = FastAPI(title="Fake n8n Public API")
+    app.state.n8n = state
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):
+        if api_key is not None and request.headers.get("X-N8N-API-KEY") != api_key:
+            return JSONResponse({"message": "unauthorized"}, status_code=401)
+        if throttle is not None and not throttle.allow():
+            return JSONResponse(
+                {"message": "Too many requests"}, status_code=429, headers={"Retry-After": f"{1 / throttle.rate:.3f}"}
+            )
+        if latency[1] > 0:
+            await asyncio.sleep(rng.uniform(*latency))
+        if error_rate and rng.random() < error_rate:
+            return JSONResponse({"message": "Injected failure"}, status_code=500)
+        return await call_next(request)
+
+    @app.exception_handler(ApiError)
+    async def api_error(request: Request, exc: ApiError):
+        return JSONResponse({"message": exc.message}, status_code=exc.status_code)
+
+    app.include_router(build_router(state), prefix=BASE_PATH)
+    return app
+
+
+app = create_app()
@@ -0,0 +1,26 @@
+"""File helpers shared by the on-disk caches and generated outputs."""
+import os
+from pathlib import Path
+from typing import Union
+
+
+def atomic_write(path: Path, data: Union[str, bytes]) -> None:
+    """
+    Write ``data`` to ``path`` so readers see either the old or the new content.
+
+    The data goes to a hidden temporary file next to ``path`` (named per process,
+    so concurrent writers don't collide), which then replaces ``path`` in one
+    ``os.replace``. Missing parent directories are created.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        if isinstance(data, str):
+            temporary.write_text(data, encoding="utf-8")
+        else:
+            temporary.write_bytes(data)
+        os.replace(temporary, path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
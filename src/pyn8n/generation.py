@@ -0,0 +1,156 @@
+"""
+Concurrent, cached structured generation.
+
+``GenerationService.generate`` produces a model instance from a prompt via the
+model class's ``from_prompt`` (dslmodel's ``DSLModel`` and ``AgentModel``),
+adding what a single call lacks:
+
+* a bounded number of generations in flight, and a token-bucket rate limit per
+  LLM (``rate_limits``, in requests per second)
+* a disk cache keyed by (LLM, prompt, JSON schema of the class), so changing a
+  prompt or the model class regenerates just the affected results
+* one generation for identical prompts requested concurrently
+
+Regenerating a library of prompts with ``generate_many`` only calls the LLM for
+prompts that changed since the last run::
+
+    service = GenerationService()
+    patterns = asyncio.run(service.generate_many(WorkflowPattern, prompts))
+"""
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from pydantic_settings import BaseSettings
+
+from pyn8n.concurrency import RateLimiter
+from pyn8n.files import atomic_write
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+Generate = Callable[[Type[BaseModel], str, str], Awaitable[BaseModel]]
+
+
+class GenerationSettings(BaseSettings):
+    """LLM generation configuration, read from ``PYN8N_GENERATION_*`` environment variables."""
+
+    model: str = "groq:llama3-groq-8b-8192-tool-use-preview"
+    concurrency: int = 8
+    rate_limits: Dict[str, float] = {}
+    default_rate: Optional[float] = None
+    cache_dir: Optional[Path] = Path.home() / ".cache" / "pyn8n" / "generations"
+
+    class Config:
+        env_prefix = "PYN8N_GENERATION_"
+
+
+def schema_hash(cls: Type[BaseModel]) -> str:
+    return hashlib.sha256(json.dumps(cls.model_json_schema(), sort_keys=True).encode()).hexdigest()
+
+
+def cache_key(model: str, prompt: str, cls: Type[BaseModel]) -> str:
+    return hashlib.sha256(json.dumps([model, prompt, schema_hash(cls)]).encode()).hexdigest()
+
+
+async def from_prompt(cls: Type[BaseModel], prompt: str, model: str) -> BaseModel:
+    """Call ``cls.from_prompt``; synchronous implementations run in a thread."""
+    if inspect.iscoroutinefunction(cls.from_prompt):  # type: ignore[attr-defined]
+        return await cls.from_prompt(prompt, model=model)  # type: ignore[attr-defined]
+    return await asyncio.to_thread(cls.from_prompt, prompt, model=model)  # type: ignore[attr-defined]
+
+
+class GenerationCache:
+    """Generated instances as JSON files named by their cache key."""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str, cls: Type[M]) -> Optional[M]:
+        try:
+            return cls.model_validate_json(self.path(key).read_bytes())
+        except (OSError, ValidationError):
+            return None
+
+    def put(self, key: str, instance: BaseModel) -> None:
+        atomic_write(self.path(key), instance.model_dump_json())
+
+
+class GenerationService:
+    """Runs ``from_prompt`` generations concurrently with caching, deduplication and rate limits."""
+
+    def __init__(self, settings: Optional[GenerationSettings] = None, generate: Generate = from_prompt):
+        self.settings = settings or GenerationSettings()
+        self.generate_instance = generate
+        self.cache = GenerationCache(self.settings.cache_dir) if self.settings.cache_dir else None
+        self.slots = asyncio.Semaphore(self.settings.concurrency)
+        self.limiters: Dict[str, RateLimiter] = {}
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self.calls = 0
+        self.hits = 0
+
+    def limiter(self, model: str) -> Optional[RateLimiter]:
+        rate = self.settings.rate_limits.get(model, self.settings.default_rate)
+        if rate is None:
+            return None
+        if model not in self.limiters:
+            self.limiters[model] = RateLimiter(rate)
+        return self.limiters[model]
+
+    async def generate(self, cls: Type[M], prompt: str, model: Optional[str] = None, cache: bool = True) -> M:
+        """An instance of ``cls`` for ``prompt``, from the cache when available."""
+        model = model or self.settings.model
+        key = cache_key(model, prompt, cls)
+        if cache and self.cache is not None:
+            cached = self.cache.get(key, cls)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+        pending = self.in_flight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = self.in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            instance = await self.call(cls, prompt, model)
+            if cache and self.cache is not None:
+                self.cache.put(key, instance)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark the exception retrieved when no duplicate was waiting for it.
+            future.exception()
+            raise
+        else:
+            future.set_result(instance)
+            return instance  # type: ignore[return-value]
+        finally:
+            del self.in_flight[key]
+
+    async def call(self, cls: Type[BaseModel], prompt: str, model: str) -> BaseModel:
+        async with self.slots:
+            limiter = self.limiter(model)
+            if limiter is not None:
+                await limiter.acquire()
+            self.calls += 1
+            logger.debug("Generating %s with %s", cls.__name__, model)
+            return await self.generate_instance(cls, prompt, model)
+
+    async def generate_many(
+        self, cls: Type[M], prompts: Iterable[str], model: Optional[str] = None, return_exceptions: bool = False
+    ) -> List[Any]:
+        """Instances for every prompt, in order. Failures are returned in place when ``return_exceptions``."""
+        return await asyncio.gather(
+            *(self.generate(cls, prompt, model) for prompt in prompts), return_exceptions=return_exceptions
+        )
@@ -0,0 +1,192 @@
+"""
+Deploying generated nodes into a running API.
+
+``NodeDeployer.deploy`` takes the source of an ``@n8n_node`` module (as
+rendered by ``pyn8n.node_renderer``), compiles it and makes its nodes callable
+under ``/nodes`` without writing files or restarting workers:
+
+1. The source is compiled once. Code objects are cached in memory and on disk
+   by the hash of the source, so redeploying an unchanged node, or deploying
+   it in another worker, skips the compiler.
+2. The module is executed into a fresh module object while its nodes are
+   collected in a staging registry, so a module that fails half way leaves the
+   live nodes untouched.
+3. The staged nodes replace the previous version in ``n8n_nodes_registry`` and
+   their routes are swapped in the app's route list. Routes look their node up
+   at call time (see ``pyn8n.node_registry.lazy_endpoint``), so requests
+   already running finish on the version they started with and the next ones
+   use the new one.
+
+Deployments affect the current process only; with several workers, each one
+deploys the same source (and reuses the compiled code from the disk cache).
+"""
+import hashlib
+import logging
+import marshal
+import sys
+import threading
+import types
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from pydantic_settings import BaseSettings
+
+from pyn8n.files import atomic_write
+from pyn8n.n8n_decorator import declared_modules, n8n_nodes_registry, staged_nodes
+from pyn8n.node_registry import NodeSpec, add_node_schemas, describe_node, register_routes
+from pyn8n.node_renderer import FunctionDataTemplate, InputModelTemplate, OutputModelTemplate, render_node
+
+logger = logging.getLogger(__name__)
+
+
+class HotNodeSettings(BaseSettings):
+    """Runtime node deployment configuration, read from ``PYN8N_HOT_NODES_*`` environment variables."""
+
+    bytecode_cache: Optional[Path] = Path.home() / ".cache" / "pyn8n" / "nodes"
+    prefix: str = "/nodes"
+
+    class Config:
+        env_prefix = "PYN8N_HOT_NODES_"
+
+
+class CodeCache:
+    """Compiled module code by source hash, kept in memory and as ``.pyc``-style files on disk."""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = directory
+        self.code: Dict[str, types.CodeType] = {}
+
+    def path(self, key: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{key}.{sys.implementation.cache_tag}.pyc"
+
+    def load(self, key: str) -> Optional[types.CodeType]:
+        if self.directory is None:
+            return None
+        try:
+            data = self.path(key).read_bytes()
+        except OSError:
+            return None
+        if not data.startswith(MAGIC_NUMBER):
+            return None
+        try:
+            return marshal.loads(data[len(MAGIC_NUMBER):])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def dump(self, key: str, code: types.CodeType) -> None:
+        if self.directory is None:
+            return
+        atomic_write(self.path(key), MAGIC_NUMBER + marshal.dumps(code))
+
+    def compile(self, source: str, filename: str) -> types.CodeType:
+        """Compile ``source``, or return the code compiled for it before."""
+        key = hashlib.sha256(f"{filename}\0{source}".encode()).hexdigest()
+        code = self.code.get(key)
+        if code is None:
+            code = self.load(key)
+            if code is None:
+                code = compile(source, filename, "exec", dont_inherit=True)
+                self.dump(key, code)
+            self.code[key] = code
+        return code
+
+
+class NodeDeployer:
+    """Installs, replaces and removes generated node modules in a running ``app``."""
+
+    def __init__(self, app: FastAPI, settings: Optional[HotNodeSettings] = None):
+        self.app = app
+        add_node_schemas(app)
+        self.settings = settings or HotNodeSettings()
+        self.cache = CodeCache(self.settings.bytecode_cache)
+        self.lock = threading.Lock()
+
+    def route_path(self, name: str) -> str:
+        return f"{self.settings.prefix}/{name}"
+
+    def deploy(self, module: str, source: str) -> List[NodeSpec]:
+        """
+        Make the nodes defined by ``source`` live as module ``module``, replacing
+        any previous version of that module. Raises (leaving the previous
+        version serving) if the source does not compile or execute.
+        """
+        code = self.cache.compile(source, f"<pyn8n:{module}>")
+        namespace = types.ModuleType(module)
+        namespace.__file__ = code.co_filename
+        staged: Dict[str, Any] = {}
+
+        with self.lock:
+            # Declared first, so the decorator does not add eager routes for the module.
+            declared_modules.add(module)
+            token = staged_nodes.set(staged)
+            try:
+                exec(code, namespace.__dict__)
+            finally:
+                staged_nodes.reset(token)
+
+            taken = {name for name in staged if name in n8n_nodes_registry and self.owner(name) != module}
+            if taken:
+                raise ValueError(f"node names already used by other modules: {', '.join(sorted(taken))}")
+
+            specs = [describe_node(name, module, node) for name, node in staged.items()]
+            router = APIRouter(prefix=self.settings.prefix)
+            register_routes(router, specs)
+            previous = [name for name in n8n_nodes_registry if self.owner(name) == module]
+
+            sys.modules[module] = namespace
+            n8n_nodes_registry.update(staged)
+            self.swap_routes(router.routes, [name for name in previous if name not in staged])
+            for name in previous:
+                if name not in staged:
+                    del n8n_nodes_registry[name]
+
+        logger.info("Deployed %s: %s", module, ", ".join(staged) or "no nodes")
+        return specs
+
+    def render_and_deploy(
+        self,
+        module: str,
+        input_model: InputModelTemplate,
+        output_model: OutputModelTemplate,
+        function_data: FunctionDataTemplate,
+        import_list: Iterable[str] = (),
+    ) -> List[NodeSpec]:
+        """Render a node with ``node.j2`` and deploy it."""
+        return self.deploy(module, render_node(input_model, output_model, function_data, import_list))
+
+    def remove(self, module: str) -> List[str]:
+        """Take every node of ``module`` offline; returns their names."""
+        with self.lock:
+            names = [name for name in n8n_nodes_registry if self.owner(name) == module]
+            self.swap_routes([], names)
+            for name in names:
+                del n8n_nodes_registry[name]
+            sys.modules.pop(module, None)
+        return names
+
+    def owner(self, name: str) -> Optional[str]:
+        node = n8n_nodes_registry.get(name)
+        return node["function"].__module__ if node is not None else None
+
+    def swap_routes(self, routes: Iterable[Any], removed: Iterable[str]) -> None:
+        """Replace routes with the same path in place, append new ones and drop those of ``removed`` nodes."""
+        live = self.app.router.routes
+        index = {
+            route.path: position
+            for position, route in enumerate(live)
+            if isinstance(route, APIRoute) and "POST" in route.methods
+        }
+        for route in routes:
+            position = index.get(route.path)
+            if position is None:
+                live.append(route)
+            else:
+                live[position] = route
+        gone = {self.route_path(name) for name in removed}
+        if gone:
+            live[:] = [route for route in live if not (isinstance(route, APIRoute) and route.path in gone)]
+        self.app.openapi_schema = None
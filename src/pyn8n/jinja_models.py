@@ -1,16 +1,9 @@
-from jinja2 import FileSystemLoader
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Union
 
-
-from pydantic import BaseModel, Field
-from typing import Optional
-
-from jinja2 import Environment
-
 from dslmodel import DSLModel, init_instant
 
-env = Environment(loader=FileSystemLoader("templates"), trim_blocks=True, lstrip_blocks=True)
+from pyn8n import codegen
 
 
 class Argument(BaseModel):
@@ -62,22 +55,18 @@ class App(BaseModel):
 
 
 def render_option(option: Option) -> str:
-    """Renders the option template with the provided data."""
-    template = env.get_template("option.j2")
-    return template.render(ctx=option)
+    """Renders the option macro with the provided data."""
+    return str(codegen.default_environment().get_template("option.j2").module.render_option(option))
 
 
 def render_signature(signature: Signature) -> str:
     """Renders the signature template using the provided data."""
-    template = env.get_template("signature.j2")
-    return template.render(ctx=signature.mod)
+    return render("signature.j2", signature)
 
 
 def render(template_name: str, model: BaseModel) -> str:
     """Renders the template using the provided model."""
-    template = env.get_template(template_name)
-    print(model.model_dump())
-    return template.render(**model.model_dump())
+    return codegen.render(template_name, **model.model_dump())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+"""
+Non-blocking structured logging.
+
+``configure_logging`` routes every record through a bounded in-memory queue to
+a background thread that formats and writes it, so a request never waits on
+stdout or a slow log shipper. When the queue is full new records are dropped
+(and counted) rather than blocking.
+
+Output is one JSON object per line, or coloredlogs' console format for local
+use. Per-request records are marked with ``extra={"sample": True}`` and kept
+with probability ``sample_rate``. Levels can be set per module. Everything is
+configurable through ``PYN8N_LOG_*`` environment variables, e.g.::
+
+    PYN8N_LOG_LEVELS='{"pyn8n.api": "DEBUG", "httpx": "WARNING"}'
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from pydantic_settings import BaseSettings
+
+# Attributes every LogRecord has; anything else was passed through ``extra``.
+RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+
+class LoggingSettings(BaseSettings):
+    """Logging configuration, read from ``PYN8N_LOG_*`` environment variables."""
+
+    level: str = "INFO"
+    levels: Dict[str, str] = {}
+    json_output: bool = True
+    sample_rate: float = 1.0
+    queue_size: int = 10_000
+
+    class Config:
+        env_prefix = "PYN8N_LOG_"
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as a single-line JSON object including its ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        document: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and key != "sample":
+                document[key] = value
+        if record.exc_text:
+            document["exception"] = record.exc_text
+        return json.dumps(document, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps records marked ``sample=True`` with probability ``rate``; passes everything else."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not getattr(record, "sample", False) or random.random() < self.rate
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks: records are dropped when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render the message and traceback now (their arguments may change later),
+        # but leave the formatting itself to the writer thread.
+        record = logging.makeLogRecord(vars(record))
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging(settings: Optional[LoggingSettings] = None, stream: Any = None) -> DroppingQueueHandler:
+    """Install the queued handler on the root logger, replacing any previous configuration."""
+    global listener
+    settings = settings or LoggingSettings()
+    if listener is not None:
+        listener.stop()
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    if settings.json_output:
+        output.setFormatter(JsonFormatter())
+    else:
+        import coloredlogs
+
+        output.setFormatter(coloredlogs.ColoredFormatter())
+
+    handler = DroppingQueueHandler(queue.Queue(maxsize=settings.queue_size))
+    handler.addFilter(SamplingFilter(settings.sample_rate))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(settings.level.upper())
+    for name, level in settings.levels.items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=True)
+    listener.start()
+    return handler
+
+
+@atexit.register
+def flush_logging() -> None:
+    """Stop the writer thread after it has written everything still queued."""
+    global listener
+    if listener is not None:
+        listener.stop()
+        listener = None
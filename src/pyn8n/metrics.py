@@ -0,0 +1,151 @@
+"""
+Minimal metric primitives with Prometheus text exposition.
+
+Counters, gauges and histograms are grouped into labelled families and kept in
+a ``MetricsRegistry`` whose ``render()`` output can be served as-is from a
+``/metrics`` endpoint, without depending on ``prometheus_client``.
+
+>>> registry = MetricsRegistry()
+>>> calls = registry.counter("calls_total", "Calls made.", ["endpoint"])
+>>> calls.labels("get_tags").inc()
+>>> print(registry.render())
+# HELP calls_total Calls made.
+# TYPE calls_total counter
+calls_total{endpoint="get_tags"} 1.0
+<BLANKLINE>
+"""
+import bisect
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class Counter:
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class Gauge:
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, as Prometheus expects."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the ``fraction`` quantile (``inf`` past the last bucket)."""
+        target, seen = fraction * self.count, 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if count and seen >= target:
+                return bound
+        return float("inf")
+
+
+class Family:
+    """All the children of one metric name, keyed by label values."""
+
+    def __init__(self, kind: str, name: str, documentation: str, labelnames: Sequence[str], factory):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.factory = factory
+        self.children: Dict[Tuple[str, ...], object] = {}
+        self.lock = threading.Lock()
+
+    def labels(self, *values: str):
+        key = tuple(str(value) for value in values)
+        child = self.children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            with self.lock:
+                child = self.children.setdefault(key, self.factory())
+        return child
+
+    def samples(self) -> Iterator[str]:
+        for values, child in sorted(self.children.items()):
+            labels = format_labels(self.labelnames, values)
+            if self.kind != "histogram":
+                yield f"{self.name}{labels} {child.value}"
+                continue
+            cumulative = 0
+            for bound, count in zip(child.buckets + (float("inf"),), child.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                yield f"{self.name}_bucket{format_labels(self.labelnames + ('le',), values + (le,))} {cumulative}"
+            yield f"{self.name}_sum{labels} {child.sum}"
+            yield f"{self.name}_count{labels} {child.count}"
+
+
+class MetricsRegistry:
+    """Named metric families rendered together in the Prometheus text format."""
+
+    def __init__(self):
+        self.families: Dict[str, Family] = {}
+
+    def register(self, kind: str, name: str, documentation: str, labelnames: Sequence[str], factory) -> Family:
+        family = self.families.get(name)
+        if family is None:
+            family = self.families[name] = Family(kind, name, documentation, labelnames, factory)
+        elif family.kind != kind or family.labelnames != tuple(labelnames):
+            raise ValueError(f"metric {name} is already registered as a {family.kind} with labels {family.labelnames}")
+        return family
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Family:
+        return self.register("counter", name, documentation, labelnames, Counter)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Family:
+        return self.register("gauge", name, documentation, labelnames, Gauge)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Optional[Sequence[float]] = None
+    ) -> Family:
+        return self.register(
+            "histogram", name, documentation, labelnames, lambda: Histogram(buckets or LATENCY_BUCKETS)
+        )
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in self.families.values():
+            lines.append(f"# HELP {family.name} {escape(family.documentation)}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            lines.extend(family.samples())
+        return "\n".join(lines) + "\n"
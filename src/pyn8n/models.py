@@ -1,6 +1,6 @@
 from dslmodel.agent_model import AgentModel
 from pydantic import BaseModel, Field
-from typing import Optional, Any, List, Dict
+from typing import Optional, Any, List, Dict, Union
 from datetime import datetime
 
 from pydantic_settings import BaseSettings
@@ -15,6 +15,11 @@ class Credential(BaseModel):
     updatedAt: Optional[str] = Field(None, description="Timestamp when updated.")
 
 
+class CredentialReference(BaseModel):
+    id: Optional[str] = Field(None, description="ID of the referenced credential.")
+    name: Optional[str] = Field(None, description="Name of the referenced credential.")
+
+
 class AuditReport(BaseModel):
     credentials: Optional[Dict[str, Any]] = Field(None, description="Risk report related to credentials.")
     database: Optional[Dict[str, Any]] = Field(None, description="Risk report related to database usage.")
@@ -30,7 +35,9 @@ class WorkflowNode(BaseModel):
     typeVersion: float = Field(..., description="Version of the node type.")
     position: List[int] = Field(..., description="Position of the node in the editor.")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Configuration parameters for the node.")
-    credentials: Optional[Dict[str, Credential]] = Field(None, description="Credentials associated with the node.")
+    credentials: Optional[Dict[str, CredentialReference]] = Field(
+        None, description="Credentials used by the node, keyed by credential type."
+    )
     disabled: Optional[bool] = Field(False, description="Whether the node is disabled.")
     notesInFlow: Optional[bool] = Field(False, description="Whether notes are displayed in the workflow flow.")
     notes: Optional[str] = Field(None, description="Optional notes about the node.")
@@ -53,13 +60,20 @@ class WorkflowSettings(BaseModel):
     timezone: Optional[str] = Field("UTC", description="Workflow timezone.")
 
 
+class Tag(BaseModel):
+    id: Optional[str] = Field(None, description="Unique identifier for the tag.")
+    name: str = Field(..., description="Name of the tag.")
+    createdAt: Optional[str] = Field(None, description="Timestamp when created.")
+    updatedAt: Optional[str] = Field(None, description="Timestamp when updated.")
+
+
 class Workflow(AgentModel):
     id: Optional[str] = Field(None, description="Unique identifier for the workflow.")
     name: str = Field(..., description="Name of the workflow.")
     nodes: List[WorkflowNode] = Field(..., description="Nodes in the workflow.")
     connections: Dict[str, Any] = Field(..., description="Connections between nodes.")
     settings: Optional[WorkflowSettings] = Field(None, description="Workflow-specific settings.")
-    tags: List[str] = Field(default_factory=list, description="Tags associated with the workflow.")
+    tags: List[Union[Tag, str]] = Field(default_factory=list, description="Tags associated with the workflow.")
 
 
 class WorkflowList(BaseModel):
@@ -71,6 +85,7 @@ class Execution(BaseModel):
     id: str = Field(..., description="Unique identifier for the execution.")
     finished: bool = Field(..., description="Indicates whether the execution has finished.")
     mode: str = Field(..., description="Mode of execution.")
+    status: Optional[str] = Field(None, description="Execution status (e.g. success, error, running, waiting).")
     retryOf: Optional[str] = Field(None, description="Retry execution ID if applicable.")
     retrySuccessId: Optional[str] = Field(None, description="ID of successful retry if applicable.")
     startedAt: datetime = Field(..., description="Start timestamp.")
@@ -88,13 +103,6 @@ class CredentialList(BaseModel):
     data: List[Credential] = Field(..., description="List of credentials.")
 
 
-class Tag(BaseModel):
-    id: Optional[str] = Field(None, description="Unique identifier for the tag.")
-    name: str = Field(..., description="Name of the tag.")
-    createdAt: Optional[str] = Field(None, description="Timestamp when created.")
-    updatedAt: Optional[str] = Field(None, description="Timestamp when updated.")
-
-
 class TagList(BaseModel):
     data: List[Tag] = Field(..., description="List of tags.")
     nextCursor: Optional[str] = Field(None, description="Cursor for pagination.")
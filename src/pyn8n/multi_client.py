@@ -0,0 +1,267 @@
+"""
+One client for a fleet of n8n instances.
+
+``MultiN8nClient`` keeps a pooled ``N8nClient`` per instance and offers three
+ways to call them:
+
+* ``call``: routed to the instance serving a tenant or project (or named
+  explicitly). Reads (``get_*`` methods) fail over to the instance's
+  ``fallbacks`` when it is down.
+* ``fan_out``: the same call on every instance at once, one result (or
+  exception) per instance.
+* ``iterate`` / ``collect``: a paginated listing on every instance at once,
+  merged as pages arrive, e.g. every failing execution in the fleet::
+
+      async with MultiN8nClient.from_settings() as fleet:
+          failing = await fleet.collect("get_executions", status="error")
+
+An instance that fails ``failure_threshold`` times in a row with a transport
+error, 429 or 5xx is considered down for ``cooldown`` seconds: reads go to its
+fallbacks first, and any successful call marks it healthy again.
+
+Instances are configured as JSON in ``PYN8N_FLEET_INSTANCES``, e.g.::
+
+    [{"name": "eu", "base_url": "https://eu.example.com/api/v1", "api_key": "...",
+      "tenants": ["acme"], "fallbacks": ["eu-standby"]}, ...]
+"""
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings
+
+from pyn8n.n8n_client import N8nClient, paginate, retryable
+
+logger = logging.getLogger(__name__)
+
+
+class InstanceConfig(BaseModel):
+    name: str = Field(..., description="Unique name of the instance, e.g. a region.")
+    base_url: str = Field(..., description="Public API URL, e.g. https://eu.example.com/api/v1.")
+    api_key: Optional[str] = Field(None, description="API key; defaults to N8N_API_KEY.")
+    tenants: List[str] = Field(default_factory=list, description="Tenants served by this instance.")
+    projects: List[str] = Field(default_factory=list, description="Project ids living on this instance.")
+    fallbacks: List[str] = Field(default_factory=list, description="Instances that can serve its reads when it is down.")
+    default: bool = Field(False, description="Serve tenants and projects no instance claims.")
+
+
+class FleetSettings(BaseSettings):
+    """Fleet configuration, read from ``PYN8N_FLEET_*`` environment variables."""
+
+    instances: List[InstanceConfig] = []
+    timeout: float = 10.0
+    failure_threshold: int = 3
+    cooldown: float = 30.0
+
+    class Config:
+        env_prefix = "PYN8N_FLEET_"
+
+
+class InstanceHealth:
+    __slots__ = ("failures", "down_since")
+
+    def __init__(self):
+        self.failures = 0
+        self.down_since: Optional[float] = None
+
+
+class MultiN8nClient:
+    """Pooled clients for many n8n instances with routing, fan-out and read failover."""
+
+    def __init__(
+        self,
+        instances: Iterable[InstanceConfig],
+        timeout: float = 10.0,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        transports: Optional[Dict[str, httpx.AsyncBaseTransport]] = None,
+    ):
+        self.instances = {instance.name: instance for instance in instances}
+        if not self.instances:
+            raise ValueError("at least one instance is required")
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        transports = transports or {}
+        self.clients = {
+            name: N8nClient(instance.base_url, instance.api_key, timeout, transport=transports.get(name))
+            for name, instance in self.instances.items()
+        }
+        self.health = {name: InstanceHealth() for name in self.instances}
+        self.tenants = {tenant: name for name, instance in self.instances.items() for tenant in instance.tenants}
+        self.projects = {project: name for name, instance in self.instances.items() for project in instance.projects}
+        self.default = next((name for name, instance in self.instances.items() if instance.default), None)
+
+    @classmethod
+    def from_settings(cls, settings: Optional[FleetSettings] = None, **kwargs: Any) -> "MultiN8nClient":
+        settings = settings or FleetSettings()
+        return cls(
+            settings.instances,
+            timeout=settings.timeout,
+            failure_threshold=settings.failure_threshold,
+            cooldown=settings.cooldown,
+            **kwargs,
+        )
+
+    async def __aenter__(self) -> "MultiN8nClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.shutdown()
+
+    async def shutdown(self) -> None:
+        await asyncio.gather(*(client.shutdown() for client in self.clients.values()))
+
+    # Routing and health
+
+    def route(self, tenant: Optional[str] = None, project: Optional[str] = None, instance: Optional[str] = None) -> str:
+        """The instance serving ``instance``, ``project`` or ``tenant`` (checked in that order)."""
+        if instance is not None:
+            if instance not in self.instances:
+                raise KeyError(f"unknown instance {instance!r}")
+            return instance
+        name = self.projects.get(project) if project is not None else None
+        if name is None and tenant is not None:
+            name = self.tenants.get(tenant)
+        name = name or self.default
+        if name is None:
+            if len(self.instances) == 1:
+                return next(iter(self.instances))
+            raise KeyError(f"no instance serves tenant={tenant!r} project={project!r}")
+        return name
+
+    def client(self, tenant: Optional[str] = None, project: Optional[str] = None, instance: Optional[str] = None) -> N8nClient:
+        return self.clients[self.route(tenant, project, instance)]
+
+    def healthy(self, name: str) -> bool:
+        down_since = self.health[name].down_since
+        return down_since is None or time.monotonic() - down_since >= self.cooldown
+
+    def succeeded(self, name: str) -> None:
+        health = self.health[name]
+        health.failures, health.down_since = 0, None
+
+    def failed(self, name: str, exc: BaseException) -> None:
+        health = self.health[name]
+        health.failures += 1
+        if health.failures >= self.failure_threshold:
+            if health.down_since is None:
+                logger.warning("n8n instance %s is down: %s", name, exc)
+            health.down_since = time.monotonic()
+
+    async def invoke(self, name: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call ``method`` on instance ``name``, recording the outcome in its health."""
+        try:
+            result = await getattr(self.clients[name], method)(*args, **kwargs)
+        except Exception as exc:
+            if retryable(exc):
+                self.failed(name, exc)
+            raise
+        self.succeeded(name)
+        return result
+
+    # Routed calls
+
+    async def call(
+        self,
+        method: str,
+        *args: Any,
+        tenant: Optional[str] = None,
+        project: Optional[str] = None,
+        instance: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Call ``method`` (an ``N8nClient`` method name) on the routed instance.
+        Reads fail over to the instance's fallbacks, healthy ones first.
+        """
+        primary = self.route(tenant, project, instance)
+        if not method.startswith("get_"):
+            return await self.invoke(primary, method, *args, **kwargs)
+        candidates = [primary, *(name for name in self.instances[primary].fallbacks if name in self.instances)]
+        candidates.sort(key=lambda name: not self.healthy(name))
+        error: Optional[BaseException] = None
+        for name in candidates:
+            try:
+                return await self.invoke(name, method, *args, **kwargs)
+            except Exception as exc:
+                if not retryable(exc):
+                    raise
+                error = exc
+                logger.debug("Read %s failed on %s, trying the next instance", method, name)
+        assert error is not None
+        raise error
+
+    # Fleet-wide calls
+
+    def targets(self, instances: Optional[Iterable[str]]) -> List[str]:
+        return list(instances) if instances is not None else list(self.instances)
+
+    async def fan_out(self, method: str, *args: Any, instances: Optional[Iterable[str]] = None, **kwargs: Any) -> Dict[str, Any]:
+        """``method`` on every instance concurrently; failures are returned as exceptions in place."""
+        names = self.targets(instances)
+        results = await asyncio.gather(
+            *(self.invoke(name, method, *args, **kwargs) for name in names), return_exceptions=True
+        )
+        return dict(zip(names, results))
+
+    async def iterate(
+        self,
+        method: str,
+        limit: int = 250,
+        instances: Optional[Iterable[str]] = None,
+        errors: Optional[Dict[str, BaseException]] = None,
+        **params: Any,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Every item of a paginated listing on every instance, as ``(instance, item)``
+        pairs in arrival order. All instances are paged concurrently. When
+        ``errors`` is given, a failing instance is recorded there and the others
+        continue; otherwise its error is raised.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=limit * 2)
+        done = object()
+
+        async def pages(name: str) -> None:
+            async def fetch(**kwargs: Any) -> Any:
+                return await self.invoke(name, method, **kwargs)
+
+            try:
+                async for item in paginate(fetch, limit=limit, **params):
+                    await queue.put((name, item))
+            except Exception as exc:
+                if errors is None:
+                    await queue.put((name, exc))
+                else:
+                    errors[name] = exc
+            finally:
+                await queue.put(done)
+
+        names = self.targets(instances)
+        tasks = [asyncio.create_task(pages(name)) for name in names]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                entry = await queue.get()
+                if entry is done:
+                    remaining -= 1
+                elif isinstance(entry[1], Exception):
+                    raise entry[1]
+                else:
+                    yield entry
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def collect(
+        self,
+        method: str,
+        limit: int = 250,
+        instances: Optional[Iterable[str]] = None,
+        errors: Optional[Dict[str, BaseException]] = None,
+        **params: Any,
+    ) -> List[Tuple[str, Any]]:
+        return [entry async for entry in self.iterate(method, limit, instances, errors, **params)]
@@ -1,11 +1,15 @@
 import asyncio
+import inspect
+import time
 import httpx
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 from apiclient_pydantic import serialize_all_methods
 from pydantic import BaseModel
 
+from pyn8n.concurrency import run_bounded
 from pyn8n.models import *
+from pyn8n.telemetry import Telemetry
 
 
 # ---------------------------
@@ -17,7 +21,47 @@ def get_json(response: httpx.Response) -> Any:
     Raise an exception for non-success status codes and return the JSON content.
     """
     response.raise_for_status()
-    return response.json()
+    span = response.request.extensions.get("pyn8n.span")
+    if span is None:
+        return response.json()
+    started = time.perf_counter()
+    data = response.json()
+    span.decoded(started)
+    return data
+
+
+def retryable(exc: BaseException) -> bool:
+    """
+    Whether ``exc`` is worth retrying: a transport error (timeout, refused
+    connection), 429 or any 5xx, i.e. the server rather than the request is the
+    problem.
+    """
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == httpx.codes.TOO_MANY_REQUESTS or status >= 500
+    return False
+
+
+async def paginate(fetch: Callable[..., Awaitable[Any]], limit: int = 100, **params: Any) -> AsyncIterator[Any]:
+    """
+    Follow ``nextCursor`` across the pages of a list endpoint and yield every item.
+
+    ``fetch`` is any cursor-paginated client method, e.g. ``client.get_tags``.
+    Pages may be list models (``TagList``) or raw dicts (``get_users``).
+    """
+    cursor: Optional[str] = None
+    while True:
+        page = await fetch(limit=limit, cursor=cursor, **params)
+        if isinstance(page, dict):
+            data, cursor = page.get("data", []), page.get("nextCursor")
+        else:
+            data, cursor = page.data, page.nextCursor
+        for item in data:
+            yield item
+        if not cursor:
+            return
 
 
 # ---------------------------
@@ -26,13 +70,21 @@ def get_json(response: httpx.Response) -> Any:
 
 @serialize_all_methods
 class N8nClient:
-    def __init__(self, base_url: str = None, api_key: str = None, timeout: float = 10.0):
+    def __init__(
+        self,
+        base_url: str = None,
+        api_key: str = None,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        telemetry: Optional[Telemetry] = None,
+    ):
         settings = N8nSettings()
         self.base_url = base_url or f"{settings.protocol}://{settings.host}:{settings.port}{settings.base_path}"
         self.api_key = api_key or N8nSettings().api_key
 
         self.timeout = timeout
 
+        # `transport` lets tests and benchmarks talk to an in-process app, e.g. pyn8n.fake_n8n.
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             headers={
@@ -40,8 +92,17 @@ class N8nClient:
                 "Accept": "application/json"
             },
             timeout=self.timeout,
+            transport=transport,
+            event_hooks=telemetry.event_hooks() if telemetry else None,
         )
 
+        # Without telemetry nothing is wrapped or hooked, so calls cost exactly what they did before.
+        self.telemetry = telemetry
+        if telemetry is not None:
+            for name, member in inspect.getmembers(type(self), inspect.iscoroutinefunction):
+                if not name.startswith("_") and name != "shutdown":
+                    setattr(self, name, telemetry.wrap(name, getattr(self, name)))
+
     #
     # --------------
     # Workflow Endpoints
@@ -183,6 +244,103 @@ class N8nClient:
         response = await self.client.delete(f"/executions/{execution_id}")
         return Execution(**get_json(response))
 
+    async def watch_executions(
+        self,
+        workflow_id: Optional[str] = None,
+        status: Optional[str] = None,
+        project_id: Optional[str] = None,
+        since_id: Optional[int] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        page_size: int = 25,
+        follow_pending: bool = True,
+        concurrency: int = 8,
+    ):
+        """
+        GET /executions (polled)
+        Yield executions as they appear, oldest first, until the generator is closed.
+
+        Only executions newer than a high-water mark are fetched: paging stops at
+        the first already-seen ID. Without ``since_id`` the mark starts at the
+        newest existing execution. The poll interval halves while new executions
+        arrive and backs off by 1.5x up to ``max_interval`` while idle.
+
+        With ``follow_pending``, executions yielded before they finished are
+        yielded again once they complete. Completion is detected with the paged
+        ``status=waiting`` and ``status=running`` listings; only executions that
+        left both are re-fetched individually, at most ``concurrency`` at a time.
+        Executions deleted before they finished are dropped.
+        """
+        high_water = since_id
+        pending: Dict[int, Execution] = {}
+        interval = min_interval
+
+        while True:
+            fresh: List[Execution] = []
+            cursor: Optional[str] = None
+            while True:
+                page = await self.get_executions(
+                    status=status, workflow_id=workflow_id, project_id=project_id, limit=page_size, cursor=cursor
+                )
+                new = [execution for execution in page.data if high_water is None or int(execution.id) > high_water]
+                fresh.extend(new)
+                cursor = page.nextCursor
+                if high_water is None or not cursor or len(new) < len(page.data):
+                    break
+
+            if high_water is None:
+                # First poll without a starting point: only establish the mark.
+                high_water = max((int(execution.id) for execution in page.data), default=0)
+                fresh = []
+            elif fresh:
+                high_water = max(int(execution.id) for execution in fresh)
+
+            completed: List[Execution] = []
+            if pending:
+                # Listings are newest first, so paging stops below the oldest pending ID.
+                oldest = min(pending)
+                unfinished = set()
+                for unfinished_status in ("waiting", "running"):
+                    async for execution in paginate(
+                        self.get_executions,
+                        limit=250,
+                        status=unfinished_status,
+                        workflow_id=workflow_id,
+                        project_id=project_id,
+                    ):
+                        if int(execution.id) < oldest:
+                            break
+                        unfinished.add(int(execution.id))
+
+                async def refresh(execution_id: int) -> None:
+                    try:
+                        execution = await self.get_execution(execution_id)
+                    except httpx.HTTPStatusError as exc:
+                        if exc.response.status_code != httpx.codes.NOT_FOUND:
+                            raise
+                        # Deleted (e.g. pruned) before it finished: stop following it.
+                        del pending[execution_id]
+                        return
+                    if execution.finished or execution.stoppedAt is not None:
+                        del pending[execution_id]
+                        completed.append(execution)
+
+                await run_bounded([key for key in pending if key not in unfinished], refresh, concurrency)
+                completed.sort(key=lambda item: int(item.id))
+
+            for execution in sorted(fresh, key=lambda item: int(item.id)) + completed:
+                if follow_pending and not execution.finished and execution.stoppedAt is None:
+                    pending[int(execution.id)] = execution
+                yield execution
+
+            if len(fresh) >= page_size:
+                interval = min_interval
+            elif fresh or completed:
+                interval = max(min_interval, interval / 2)
+            else:
+                interval = min(max_interval, interval * 1.5)
+            await asyncio.sleep(interval)
+
     #
     # --------------
     # Credential Endpoints
@@ -425,10 +583,11 @@ class N8nClient:
         response = await self.client.get("/users", params=params)
         return get_json(response)
 
-    async def create_users(self, users: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def create_users(self, users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         POST /users
-        Create multiple users.
+        Create multiple users. Returns one ``{"user": ..., "error": ...}`` entry per user.
+        For thousands of users see pyn8n.users.provision_users.
         """
         response = await self.client.post("/users", json=users)
         return get_json(response)
@@ -695,8 +854,8 @@ async def main():
         users = await client.get_users()
         print(f"   Users: {users}\n")
 
-        if created_users.get("user"):
-            user_id = created_users["user"]["id"]
+        if created_users and not created_users[0]["error"]:
+            user_id = created_users[0]["user"]["id"]
             print(f"26. Retrieving user by ID: {user_id}...")
             user = await client.get_user(user_id)
             print(f"   Retrieved User: {user}\n")
@@ -1,14 +1,44 @@
-from typing import Callable, Type, Optional
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Set, Type, Optional
 from functools import wraps
 from pydantic import BaseModel
 from fastapi import APIRouter, HTTPException
 
+from pyn8n.api_metrics import metrics
+
+logger = logging.getLogger(__name__)
+
 # Initialize FastAPI Router
 router = APIRouter()
 
 # Registry to store all n8n nodes
 n8n_nodes_registry = {}
 
+# Modules whose node routes are registered from discovery metadata (see pyn8n.node_registry);
+# importing them must not add a second route.
+declared_modules: Set[str] = set()
+
+# While set (see pyn8n.hot_nodes), decorated nodes are collected here instead of going live.
+staged_nodes: ContextVar[Optional[Dict[str, Any]]] = ContextVar("staged_nodes", default=None)
+
+
+def run_node(action_name: str, node: Dict[str, Any], body: BaseModel) -> BaseModel:
+    """Call a registered node function and validate its result, recording node metrics."""
+    try:
+        # Execute the registered function
+        started = time.perf_counter()
+        result = node["function"](body)
+        validating = time.perf_counter()
+        metrics.node_handler.labels(action_name).observe(validating - started)
+        output = node["output_model"](**result.dict())  # Ensure output matches the model
+        metrics.node_validation.labels(action_name).observe(time.perf_counter() - validating)
+        return output
+    except Exception as e:
+        metrics.node_errors.labels(action_name).inc()
+        raise HTTPException(status_code=400, detail=str(e))
+
 
 def n8n_node(
     node_name: Optional[str] = None,
@@ -28,24 +58,25 @@ def n8n_node(
         action_name = node_name or func.__name__
 
         # Add to registry
-        n8n_nodes_registry[action_name] = {
+        registry = staged_nodes.get()
+        if registry is None:
+            registry = n8n_nodes_registry
+        node = registry[action_name] = {
             "function": func,
             "input_model": input_model,
             "output_model": output_model,
         }
 
-        print(f"Registered n8n node: {action_name}")
+        logger.debug("Registered n8n node: %s", action_name)
+
+        if func.__module__ in declared_modules:
+            return func
 
         # Define a FastAPI endpoint for the node
         @router.post(f"/{action_name}", response_model=output_model)
         @wraps(func)
         async def endpoint(body: input_model):
-            try:
-                # Execute the registered function
-                result = func(body)
-                return output_model(**result.dict())  # Ensure output matches the model
-            except Exception as e:
-                raise HTTPException(status_code=400, detail=str(e))
+            return run_node(action_name, node, body)
 
         return func  # Return the original function unmodified
 
@@ -1,6 +1,10 @@
+import logging
+
 from pydantic import BaseModel, Field
 from pyn8n.n8n_decorator import n8n_node
 
+logger = logging.getLogger(__name__)
+
 
 # Input model
 class FactorialInput(BaseModel):
@@ -20,7 +24,7 @@ def factorial_node(body: FactorialInput) -> FactorialOutput:
         return 1 if n == 0 else n * factorial(n - 1)
 
     result = factorial(body.number)
-    print(f"{factorial_node.__name__}: Factorial of {body.number} is {result}")
+    logger.debug("%s: Factorial of %s is %s", factorial_node.__name__, body.number, result, extra={"sample": True})
     return FactorialOutput(result=result)
 
 
@@ -32,7 +36,7 @@ def factorial(body: FactorialInput) -> FactorialOutput:
         return 1 if n == 0 else n * factorial(n - 1)
 
     result = factorial(body.number)
-    print(f"{factorial.__name__}: Factorial of {body.number} is {result}")
+    logger.debug("%s: Factorial of %s is %s", factorial.__name__, body.number, result, extra={"sample": True})
     return FactorialOutput(result=result)
 
 
@@ -0,0 +1,246 @@
+"""
+Node discovery and lazy loading.
+
+Node modules (files using ``@n8n_node``) are found through the
+``pyn8n.nodes`` entry-point group, directory scans and explicit module names.
+Each node's route is registered from metadata - name, description and the
+input/output JSON schemas - and its module is only imported when the node is
+first called, so heavy dependencies never load in workers that do not use
+them.
+
+The metadata comes from a snapshot file keyed by each module's file size and
+modification time. Only modules that are new or changed since the snapshot
+was written are imported at startup (to read their models); the rest of the
+boot is a JSON read, whatever the number of nodes. Third-party packages
+publish nodes with::
+
+    [tool.poetry.plugins."pyn8n.nodes"]
+    my_nodes = "my_package.nodes"
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+from importlib import import_module
+from importlib.metadata import entry_points
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_settings import BaseSettings
+
+from pyn8n.api_metrics import metrics
+from pyn8n.files import atomic_write
+from pyn8n.n8n_decorator import declared_modules, n8n_nodes_registry, run_node
+
+ENTRY_POINT_GROUP = "pyn8n.nodes"
+SNAPSHOT_VERSION = 2
+# Nested models are referenced where add_node_schemas() publishes them.
+REF_TEMPLATE = "#/components/schemas/{model}"
+
+
+class NodeRegistrySettings(BaseSettings):
+    """Where to look for nodes, read from ``PYN8N_NODES_*`` environment variables."""
+
+    modules: List[str] = ["pyn8n.n8n_nodes"]
+    directories: List[Path] = []
+    snapshot: Optional[Path] = Path.home() / ".cache" / "pyn8n" / "node-registry.json"
+
+    class Config:
+        env_prefix = "PYN8N_NODES_"
+
+
+class NodeSpec(BaseModel):
+    name: str = Field(..., description="Node name, also the route path under /nodes.")
+    module: str = Field(..., description="Module that defines the node.")
+    description: Optional[str] = Field(None, description="Docstring of the node function.")
+    input_schema: Dict[str, Any] = Field(..., description="JSON schema of the input model.")
+    output_schema: Dict[str, Any] = Field(..., description="JSON schema of the output model.")
+
+
+def entry_point_modules(group: str = ENTRY_POINT_GROUP) -> List[str]:
+    return [entry_point.value.partition(":")[0] for entry_point in entry_points(group=group)]
+
+
+def scan_directory(directory: Path) -> List[str]:
+    """
+    Module names of the node files in ``directory``, which must be importable
+    (on ``sys.path`` or inside a package). Files are matched by their source
+    mentioning ``n8n_node``, without importing them.
+    """
+    directory = directory.resolve()
+    package, root = [], directory
+    while (root / "__init__.py").exists():
+        package.insert(0, root.name)
+        root = root.parent
+    modules = []
+    for path in sorted(directory.glob("*.py")):
+        if path.name != "__init__.py" and "n8n_node" in path.read_text(encoding="utf-8"):
+            modules.append(".".join([*package, path.stem]))
+    return modules
+
+
+def fingerprint(module: str) -> Optional[Tuple[int, int]]:
+    spec = find_spec(module)
+    if spec is None or not spec.origin or not os.path.exists(spec.origin):
+        return None
+    stat = os.stat(spec.origin)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def describe_node(name: str, module: str, node: Dict[str, Any]) -> NodeSpec:
+    """The metadata of a registry entry."""
+    return NodeSpec(
+        name=name,
+        module=module,
+        description=(node["function"].__doc__ or "").strip() or None,
+        input_schema=node["input_model"].model_json_schema(ref_template=REF_TEMPLATE),
+        output_schema=node["output_model"].model_json_schema(ref_template=REF_TEMPLATE),
+    )
+
+
+def inspect_module(module: str) -> List[NodeSpec]:
+    """Import ``module`` and describe the nodes it registers."""
+    declared_modules.add(module)
+    if module not in sys.modules:
+        # Forget nodes a previous version of the module registered under other names.
+        for name in [name for name, node in n8n_nodes_registry.items() if node["function"].__module__ == module]:
+            del n8n_nodes_registry[name]
+        import_module(module)
+    return [
+        describe_node(name, module, node)
+        for name, node in n8n_nodes_registry.items()
+        if node["function"].__module__ == module
+    ]
+
+
+def read_snapshot(path: Optional[Path]) -> Dict[str, Any]:
+    if path is None or not path.exists():
+        return {}
+    try:
+        snapshot = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return snapshot.get("modules", {}) if snapshot.get("version") == SNAPSHOT_VERSION else {}
+
+
+def write_snapshot(path: Path, modules: Dict[str, Any]) -> None:
+    atomic_write(path, json.dumps({"version": SNAPSHOT_VERSION, "modules": modules}))
+
+
+def discover(
+    modules: Iterable[str] = (),
+    directories: Iterable[Path] = (),
+    snapshot: Optional[Path] = None,
+    entry_point_group: Optional[str] = ENTRY_POINT_GROUP,
+) -> List[NodeSpec]:
+    """Describe every discoverable node, importing only modules missing from or stale in ``snapshot``."""
+    names = list(modules)
+    for directory in directories:
+        names.extend(scan_directory(directory))
+    if entry_point_group:
+        names.extend(entry_point_modules(entry_point_group))
+
+    cached = read_snapshot(snapshot)
+    current: Dict[str, Any] = {}
+    for module in dict.fromkeys(names):
+        stamp = fingerprint(module)
+        entry = cached.get(module)
+        if entry is None or stamp is None or tuple(entry["fingerprint"]) != stamp:
+            entry = {"fingerprint": stamp, "nodes": [spec.model_dump() for spec in inspect_module(module)]}
+        current[module] = entry
+
+    if snapshot is not None and current != cached:
+        write_snapshot(snapshot, current)
+    return [NodeSpec(**node) for entry in current.values() for node in entry["nodes"]]
+
+
+async def load_node(spec: NodeSpec) -> Dict[str, Any]:
+    """The registry entry for ``spec``, importing its module (off the event loop) on first use."""
+    node = n8n_nodes_registry.get(spec.name)
+    if node is None:
+        await asyncio.to_thread(import_module, spec.module)
+        node = n8n_nodes_registry[spec.name]
+    return node
+
+
+def register_routes(router: APIRouter, specs: Iterable[NodeSpec]) -> None:
+    """
+    Add a ``POST /{name}`` route per node, documented from the snapshot schemas.
+
+    The schemas' nested models (``$defs``) are kept on the endpoint for
+    ``add_node_schemas`` to publish as OpenAPI components.
+    """
+    for spec in specs:
+        declared_modules.add(spec.module)
+        input_schema = {key: value for key, value in spec.input_schema.items() if key != "$defs"}
+        output_schema = {key: value for key, value in spec.output_schema.items() if key != "$defs"}
+        endpoint = lazy_endpoint(spec)
+        endpoint.openapi_components = {**spec.input_schema.get("$defs", {}), **spec.output_schema.get("$defs", {})}
+        router.add_api_route(
+            f"/{spec.name}",
+            endpoint,
+            methods=["POST"],
+            name=spec.name,
+            description=spec.description,
+            openapi_extra={
+                "requestBody": {"required": True, "content": {"application/json": {"schema": input_schema}}},
+                "responses": {"200": {"content": {"application/json": {"schema": output_schema}}}},
+            },
+        )
+
+
+def add_node_schemas(app: FastAPI) -> None:
+    """
+    Publish the nested models of the node routes under ``components/schemas``.
+
+    FastAPI never sees the models of lazily loaded nodes, so their ``$ref``s
+    would dangle. The components are collected from the routes live when the
+    document is generated, so hot-deployed nodes are included too.
+    """
+    if getattr(app.openapi, "adds_node_schemas", False):
+        return
+    generate = app.openapi
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema is None:
+            schemas = generate().setdefault("components", {}).setdefault("schemas", {})
+            for route in app.routes:
+                for name, schema in getattr(getattr(route, "endpoint", None), "openapi_components", {}).items():
+                    schemas.setdefault(name, schema)
+        return app.openapi_schema
+
+    openapi.adds_node_schemas = True
+    app.openapi = openapi
+
+
+def lazy_endpoint(spec: NodeSpec):
+    async def endpoint(request: Request):
+        node = await load_node(spec)
+        try:
+            payload = await request.json()
+        except ValueError:
+            raise RequestValidationError([{"type": "json_invalid", "loc": ("body",), "msg": "Invalid JSON"}]) from None
+        started = time.perf_counter()
+        try:
+            body = node["input_model"].model_validate(payload)
+        except ValidationError as exc:
+            raise RequestValidationError(exc.errors(include_url=False)) from None
+        finally:
+            metrics.node_validation.labels(spec.name).observe(time.perf_counter() - started)
+        return run_node(spec.name, node, body)
+
+    endpoint.__module__, endpoint.__name__, endpoint.__qualname__ = spec.module, spec.name, spec.name
+    return endpoint
+
+
+def load_nodes(router: APIRouter, settings: Optional[NodeRegistrySettings] = None) -> List[NodeSpec]:
+    """Discover nodes per ``settings`` and register their routes on ``router``."""
+    settings = settings or NodeRegistrySettings()
+    specs = discover(settings.modules, settings.directories, settings.snapshot)
+    register_routes(router, specs)
+    return specs
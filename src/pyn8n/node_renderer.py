@@ -1,54 +1,10 @@
+from typing import Any, Dict, Iterable, Optional
 
-from jinja2 import Template
+from jinja2 import Environment
+from pydantic import BaseModel
 
-template = Template("""
-from pydantic import BaseModel, Field
-from pyn8n.n8n_decorator import n8n_node
+from pyn8n.codegen import render
 
-{% for import in import_list %}
-{{ import }}
-{% endfor %}
-
-# Input model
-class {{ input_model.name }}Input(BaseModel):
-    {% for field in input_model.fields %}
-    {{ field.name }}: {{ field.type }} = Field(..., description="{{ field.description }}")
-    {% endfor %}
-
-# Output model
-class {{ output_model.name }}(BaseModel):
-    {% for field in output_model.fields %}
-    {{ field.name }}: {{ field.type }} = Field(..., description="{{ field.description }}")
-    {% endfor %}
-
-# Node definition
-@n8n_node(input_model={{ input_model.name }}Input, output_model={{ output_model.name }})
-def {{ function_name }}(body: {{ input_model.name }}Input) -> {{ output_model.name }}:
-    \"\"\"{{ function_description }}\"\"\"
-    {{ implementation }}
-    return {{ output_model.name }}({{ return_fields }})
-""")
-
-input_model = {
-    "name": "ExampleNode",
-    "fields": [
-        {"name": "field1", "type": "int", "description": "An example field"}
-    ]
-}
-
-output_model = {
-    "name": "ExampleNodeOutput",
-    "fields": [
-        {"name": "result", "type": "int", "description": "The result of the computation"}
-    ]
-}
-
-function_data = {
-    "function_name": "example_node",
-    "function_description": "An example node that performs a computation.",
-    "implementation": "result = body.field1 * 2",
-    "return_fields": "result=result"
-}
 
 class FieldTemplate(BaseModel):
     name: str
@@ -70,27 +26,50 @@ class FunctionDataTemplate(BaseModel):
     return_fields: str
 
 
-if __name__ == "__main__":
-    input_model = InputModelTemplate(
-        name="ExampleNode",
-        fields=[
-            FieldTemplate(name="field1", type="int", description="An example field")
-        ]
+def node_context(
+    input_model: InputModelTemplate,
+    output_model: OutputModelTemplate,
+    function_data: FunctionDataTemplate,
+    import_list: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """The variables of ``node.j2`` for one node."""
+    return {
+        "input_model": input_model.model_dump(),
+        "output_model": output_model.model_dump(),
+        "import_list": list(import_list),
+        **function_data.model_dump(),
+    }
+
+
+def render_node(
+    input_model: InputModelTemplate,
+    output_model: OutputModelTemplate,
+    function_data: FunctionDataTemplate,
+    import_list: Iterable[str] = (),
+    env: Optional[Environment] = None,
+) -> str:
+    """Python source of an ``@n8n_node`` module."""
+    return render("node.j2", env, **node_context(input_model, output_model, function_data, import_list))
+
+
+def example_node() -> Dict[str, Any]:
+    return node_context(
+        InputModelTemplate(
+            name="ExampleNode",
+            fields=[FieldTemplate(name="field1", type="int", description="An example field")],
+        ),
+        OutputModelTemplate(
+            name="ExampleNodeOutput",
+            fields=[FieldTemplate(name="result", type="int", description="The result of the computation")],
+        ),
+        FunctionDataTemplate(
+            function_name="example_node",
+            function_description="An example node that performs a computation.",
+            implementation="result = body.field1 * 2",
+            return_fields="result=result",
+        ),
     )
 
-    output_model = OutputModelTemplate(
-        name="ExampleNodeOutput",
-        fields=[
-            FieldTemplate(name="result", type="int", description="The result of the computation")
-        ]
-    )
 
-    function_data = FunctionDataTemplate(
-        function_name="example_node",
-        function_description="An example node that performs a computation.",
-        implementation="result = body.field1 * 2",
-        return_fields="result=result"
-    )
-
-    rendered_code = template.render(input_model=input_model, output_model=output_model, **function_data.model_dump())
-    print(rendered_code)
\ No newline at end of file
+if __name__ == "__main__":
+    print(render("node.j2", **example_node()))
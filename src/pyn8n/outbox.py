@@ -0,0 +1,338 @@
+"""
+Durable outbox for n8n mutations.
+
+In outbox mode a mutation (``create_workflow``, ``activate_workflow``,
+``create_variable``, ...) is appended to a local SQLite log and the caller
+gets its idempotency key back immediately. A background task drains the log:
+
+* up to ``batch_size`` due entries per round, ``concurrency`` at a time; an
+  entry is claimed (``sending``) before it is sent and its outcome is
+  committed as soon as the call returns
+* transport errors, 429 and 5xx are retried with exponential backoff, for up
+  to ``max_attempts``; other errors (a 400 for an invalid workflow) fail the
+  entry at once
+* entries survive restarts of both the caller and n8n: anything not yet
+  delivered is sent on the next drain
+* an entry may name an ordering ``group``; entries of one group are sent one
+  after the other, in order (e.g. deactivate, update, activate a workflow).
+  When an entry fails for good, the entries queued behind it in its group are
+  failed too ("blocked by <key>") rather than sent out of sequence
+
+Each entry has an idempotency key, generated or given by the caller. A key is
+accepted once, so re-submitting the same change (say, a pipeline step retried
+after a crash) never queues it twice, and a delivered entry is never resent.
+n8n itself has no idempotency keys: a create that times out after reaching
+the server can still be applied twice when retried, and so can an entry that
+was being sent when the process crashed (it is ``pending`` again on the next
+open). Only one ``Outbox`` should drain a given file.
+
+    outbox = Outbox("outbox.sqlite3", N8nClient())
+    writer = outbox.proxy()
+    key = writer.create_variable(Variable(key="mode", value="on"))  # returns at once
+    outbox.start()
+    entry = await outbox.wait(key)
+"""
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from pyn8n.concurrency import run_bounded
+from pyn8n.n8n_client import N8nClient, retryable
+
+logger = logging.getLogger(__name__)
+
+# N8nClient methods that change state and can be queued.
+MUTATIONS = frozenset({
+    "create_workflow", "update_workflow", "delete_workflow", "activate_workflow", "deactivate_workflow",
+    "transfer_workflow", "delete_execution", "create_credential", "delete_credential", "transfer_credential",
+    "create_tag", "update_tag", "delete_tag", "update_workflow_tags", "create_variable", "delete_variable",
+    "create_project", "delete_project", "update_project", "create_users", "delete_user", "change_user_role",
+})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    method TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    grp TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    due REAL NOT NULL,
+    created REAL NOT NULL,
+    error TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (status, due);
+"""
+
+# Due entries, skipping any that wait behind an earlier unfinished entry of their group.
+DUE = """
+SELECT id, key, method, arguments, attempts FROM outbox AS entry
+WHERE status = 'pending' AND due <= ?
+  AND (grp IS NULL OR id = (
+    SELECT MIN(id) FROM outbox WHERE grp = entry.grp AND status IN ('pending', 'sending')
+  ))
+ORDER BY id LIMIT ?
+"""
+
+UNFINISHED = ("pending", "sending")
+
+
+class OutboxEntry(BaseModel):
+    key: str = Field(..., description="Idempotency key.")
+    method: str = Field(..., description="N8nClient method to call.")
+    status: str = Field(..., description="pending, sending, done or failed.")
+    attempts: int = Field(0, description="Delivery attempts made.")
+    group: Optional[str] = Field(None, description="Ordering group.")
+    error: Optional[str] = Field(None, description="Last delivery error.")
+    result: Any = Field(None, description="JSON form of what the call returned.")
+
+
+def encode(value: Any) -> Any:
+    """JSON form of a call argument or result; pydantic models keep their class for ``decode``."""
+    if isinstance(value, BaseModel):
+        cls = type(value)
+        return {"__model__": f"{cls.__module__}:{cls.__qualname__}", "data": value.model_dump(mode="json", exclude_unset=True)}
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: encode(item) for key, item in value.items()}
+    return value
+
+
+def decode(value: Any) -> Any:
+    if isinstance(value, dict) and "__model__" in value:
+        module, _, name = value["__model__"].partition(":")
+        return getattr(import_module(module), name).model_validate(value["data"])
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: decode(item) for key, item in value.items()}
+    return value
+
+
+class Outbox:
+    """SQLite write-ahead log of n8n mutations with a background drain."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        client: N8nClient,
+        batch_size: int = 50,
+        concurrency: int = 8,
+        max_attempts: int = 10,
+        backoff: float = 0.5,
+        max_backoff: float = 60.0,
+        interval: float = 1.0,
+    ):
+        self.client = client
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.interval = interval
+        self.db = sqlite3.connect(str(path))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        # WAL with synchronous=NORMAL survives process crashes; only an OS crash can lose the last commits.
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        with self.db:
+            # Entries a previous process was sending when it stopped; their outcome is unknown.
+            self.db.execute("UPDATE outbox SET status = 'pending' WHERE status = 'sending'")
+        self.waiters: Dict[str, asyncio.Future] = {}
+        self.wakeup: Optional[asyncio.Event] = None
+        self.task: Optional[asyncio.Task] = None
+        self.stopping = False
+
+    def close(self) -> None:
+        self.db.close()
+
+    def enqueue(self, method: str, *args: Any, key: Optional[str] = None, group: Optional[str] = None, **kwargs: Any) -> str:
+        """Append a call of ``N8nClient.<method>`` to the log and return its idempotency key."""
+        if method not in MUTATIONS:
+            raise ValueError(f"{method} is not a queueable mutation")
+        key = key or uuid.uuid4().hex
+        now = time.time()
+        arguments = json.dumps({"args": encode(list(args)), "kwargs": encode(kwargs)})
+        with self.db:
+            self.db.execute(
+                "INSERT INTO outbox (key, method, arguments, grp, due, created) VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO NOTHING",
+                (key, method, arguments, group, now, now),
+            )
+        if self.wakeup is not None:
+            self.wakeup.set()
+        return key
+
+    def proxy(self, group: Optional[str] = None) -> "OutboxClient":
+        """A client whose mutations are queued here and whose reads go straight to n8n."""
+        return OutboxClient(self, group)
+
+    def entry(self, key: str) -> Optional[OutboxEntry]:
+        row = self.db.execute(
+            "SELECT key, method, status, attempts, grp, error, result FROM outbox WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        key, method, status, attempts, group, error, result = row
+        return OutboxEntry(
+            key=key, method=method, status=status, attempts=attempts, group=group, error=error,
+            result=json.loads(result) if result is not None else None,
+        )
+
+    def counts(self) -> Dict[str, int]:
+        counts = {"pending": 0, "sending": 0, "done": 0, "failed": 0}
+        counts.update(self.db.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+        return counts
+
+    def purge(self, older_than: float = 7 * 24 * 3600) -> int:
+        """Forget delivered entries (and with them their keys) older than ``older_than`` seconds."""
+        with self.db:
+            cursor = self.db.execute(
+                "DELETE FROM outbox WHERE status = 'done' AND created < ?", (time.time() - older_than,)
+            )
+        return cursor.rowcount
+
+    async def wait(self, key: str, timeout: Optional[float] = None) -> OutboxEntry:
+        """The entry once it is delivered or has failed for good."""
+        entry = self.entry(key)
+        if entry is None:
+            raise KeyError(key)
+        if entry.status not in UNFINISHED:
+            return entry
+        future = self.waiters.setdefault(key, asyncio.get_running_loop().create_future())
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+    def claim(self) -> List[tuple]:
+        """Mark up to ``batch_size`` due entries as ``sending`` and return them."""
+        with self.db:
+            self.db.execute("BEGIN IMMEDIATE")
+            rows = self.db.execute(DUE, (time.time(), self.batch_size)).fetchall()
+            self.db.executemany("UPDATE outbox SET status = 'sending' WHERE id = ?", [(row[0],) for row in rows])
+        return rows
+
+    def settle(self, key: str, entry_id: int, status: str, attempts: int, due: float, error: Optional[str], result: Optional[str]) -> None:
+        blocked: List[str] = []
+        with self.db:
+            self.db.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, due = ?, error = ?, result = ? WHERE id = ?",
+                (status, attempts, due, error, result, entry_id),
+            )
+            if status == "failed":
+                behind = (
+                    "FROM outbox WHERE status = 'pending' AND id > ? AND grp = (SELECT grp FROM outbox WHERE id = ?)"
+                )
+                blocked = [row[0] for row in self.db.execute(f"SELECT key {behind}", (entry_id, entry_id))]
+                self.db.execute(
+                    f"UPDATE outbox SET status = 'failed', error = ? WHERE id IN (SELECT id {behind})",
+                    (f"blocked by {key}", entry_id, entry_id),
+                )
+        for settled in (key, *blocked):
+            future = self.waiters.get(settled)
+            if status != "pending" and future is not None:
+                del self.waiters[settled]
+                if not future.done():
+                    future.set_result(self.entry(settled))
+
+    async def drain_once(self) -> int:
+        """Deliver one batch of due entries; returns how many were attempted."""
+        rows = self.claim()
+        settled = set()
+
+        async def deliver(row) -> None:
+            entry_id, key, method, arguments, attempts = row
+            call = json.loads(arguments)
+            attempts += 1
+            try:
+                result = await getattr(self.client, method)(*decode(call["args"]), **decode(call["kwargs"]))
+            except Exception as exc:
+                if retryable(exc) and attempts < self.max_attempts:
+                    due = time.time() + min(self.max_backoff, self.backoff * 2 ** (attempts - 1))
+                    self.settle(key, entry_id, "pending", attempts, due, str(exc), None)
+                else:
+                    logger.warning("Outbox entry %s (%s) failed: %s", key, method, exc)
+                    self.settle(key, entry_id, "failed", attempts, time.time(), str(exc), None)
+            else:
+                self.settle(key, entry_id, "done", attempts, time.time(), None, json.dumps(encode(result), default=str))
+            settled.add(entry_id)
+
+        try:
+            await run_bounded(rows, deliver, self.concurrency)
+        finally:
+            # Cancelled mid-batch: entries whose call never completed go back to the queue.
+            unsettled = [(row[0],) for row in rows if row[0] not in settled]
+            if unsettled:
+                with self.db:
+                    self.db.executemany("UPDATE outbox SET status = 'pending' WHERE id = ? AND status = 'sending'", unsettled)
+        return len(rows)
+
+    def next_due(self) -> Optional[float]:
+        return self.db.execute("SELECT MIN(due) FROM outbox WHERE status = 'pending'").fetchone()[0]
+
+    async def run(self) -> None:
+        self.wakeup = asyncio.Event()
+        while not self.stopping:
+            try:
+                if await self.drain_once():
+                    continue
+            except Exception:
+                logger.exception("Outbox drain failed")
+            if self.stopping:
+                break
+            due = self.next_due()
+            delay = self.interval if due is None else min(self.interval, max(0.0, due - time.time()))
+            self.wakeup.clear()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        """Drain in a background task of the running loop."""
+        if self.task is None:
+            self.stopping = False
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self, flush: bool = False) -> None:
+        """
+        Stop draining once the batch in flight is settled; with ``flush``, then
+        deliver every entry that is due now.
+        """
+        if self.task is not None:
+            self.stopping = True
+            if self.wakeup is not None:
+                self.wakeup.set()
+            try:
+                await self.task
+            finally:
+                self.task = None
+        if flush:
+            while await self.drain_once():
+                pass
+
+
+class OutboxClient:
+    """``N8nClient`` stand-in: mutations return their outbox key at once, reads pass through."""
+
+    def __init__(self, outbox: Outbox, group: Optional[str] = None):
+        self.outbox = outbox
+        self.group = group
+
+    def __getattr__(self, name: str) -> Any:
+        if name in MUTATIONS:
+
+            def enqueue(*args: Any, key: Optional[str] = None, **kwargs: Any) -> str:
+                return self.outbox.enqueue(name, *args, key=key, group=self.group, **kwargs)
+
+            return enqueue
+        return getattr(self.outbox.client, name)
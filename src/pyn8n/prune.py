@@ -0,0 +1,120 @@
+"""
+Bulk deletion of execution history.
+
+Candidates are streamed from ``GET /executions`` with cursor pagination and
+deleted one by one through ``DELETE /executions/{id}``, with a bounded number
+of requests in flight and a global requests-per-second ceiling so the live
+instance is not starved.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+
+from pyn8n.concurrency import RateLimiter, run_bounded
+from pyn8n.models import Execution
+from pyn8n.n8n_client import N8nClient, paginate, retryable
+
+
+class PruneFilter(BaseModel):
+    status: Optional[str] = Field(None, description="Only executions with this status (error, success, waiting).")
+    workflow_id: Optional[str] = Field(None, description="Only executions of this workflow.")
+    project_id: Optional[str] = Field(None, description="Only executions in this project.")
+    older_than: Optional[timedelta] = Field(None, description="Only executions started longer ago than this.")
+
+    def cutoff(self) -> Optional[datetime]:
+        if self.older_than is None:
+            return None
+        return datetime.now(timezone.utc) - self.older_than
+
+
+class PruneReport(BaseModel):
+    matched: int = Field(0, description="Executions selected by the filter.")
+    deleted: int = Field(0, description="Executions deleted.")
+    missing: int = Field(0, description="Executions already gone when deleted (404).")
+    failed: int = Field(0, description="Executions that could not be deleted.")
+    elapsed: float = Field(0.0, description="Wall-clock seconds spent.")
+
+    @property
+    def rate(self) -> float:
+        return self.deleted / self.elapsed if self.elapsed else 0.0
+
+
+async def iter_candidates(
+    client: N8nClient, prune_filter: PruneFilter, page_size: int = 250
+) -> AsyncIterator[Execution]:
+    """Yield executions matching ``prune_filter``, following the cursor across pages."""
+    cutoff = prune_filter.cutoff()
+    async for execution in paginate(
+        client.get_executions,
+        limit=page_size,
+        status=prune_filter.status,
+        workflow_id=prune_filter.workflow_id,
+        project_id=prune_filter.project_id,
+    ):
+        if cutoff is not None and execution.startedAt >= cutoff:
+            continue
+        yield execution
+
+
+async def prune_executions(
+    client: N8nClient,
+    prune_filter: PruneFilter,
+    dry_run: bool = False,
+    concurrency: int = 8,
+    rate: float = 50.0,
+    max_retries: int = 3,
+    page_size: int = 250,
+    on_progress: Optional[Callable[[PruneReport], None]] = None,
+    progress_every: int = 1000,
+) -> PruneReport:
+    """
+    Delete every execution matching ``prune_filter``.
+
+    At most ``concurrency`` deletes are in flight and no more than ``rate`` are
+    issued per second. Transport errors (e.g. timeouts), 429 and 5xx responses
+    are retried with exponential backoff; an execution still failing after
+    ``max_retries`` is counted as failed and the prune carries on. With ``dry_run`` nothing is deleted and
+    the report only carries the number of matches.
+    """
+    report = PruneReport()
+    started = time.monotonic()
+    limiter = RateLimiter(rate)
+
+    def tick(processed: int) -> None:
+        report.elapsed = time.monotonic() - started
+        if on_progress is not None and processed % progress_every == 0:
+            on_progress(report)
+
+    async def delete(execution: Execution) -> None:
+        report.matched += 1
+        for attempt in range(max_retries + 1):
+            await limiter.acquire()
+            try:
+                await client.delete_execution(execution.id)
+            except httpx.HTTPError as exc:
+                if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == httpx.codes.NOT_FOUND:
+                    report.missing += 1
+                elif retryable(exc) and attempt < max_retries:
+                    await asyncio.sleep(2 ** attempt * 0.5)
+                    continue
+                else:
+                    report.failed += 1
+            else:
+                report.deleted += 1
+            break
+        tick(report.deleted + report.missing + report.failed)
+
+    candidates = iter_candidates(client, prune_filter, page_size=page_size)
+    if dry_run:
+        async for _ in candidates:
+            report.matched += 1
+            tick(report.matched)
+    else:
+        await run_bounded(candidates, delete, concurrency)
+
+    report.elapsed = time.monotonic() - started
+    return report
@@ -0,0 +1,257 @@
+"""
+Restore an export archive into an n8n instance.
+
+An archive is a JSON Lines file (optionally gzip-compressed, ``.gz``) with one
+object per line::
+
+    {"type": "tag", "data": {"id": "3", "name": "billing"}}
+    {"type": "project", "data": {"id": "p1", "name": "Finance"}}
+    {"type": "variable", "data": {"id": "7", "key": "region", "value": "eu"}}
+    {"type": "workflow", "data": {"id": "42", "name": "...", "nodes": [...], "active": true,
+                                  "tags": [{"id": "3"}], "projectId": "p1"}}
+
+Objects are restored level by level, following their dependencies:
+
+1. tags, projects and variables
+2. workflows
+3. re-attaching tags and transferring workflows to their project, using the
+   server-assigned IDs from levels 1 and 2
+4. activation of workflows that were active when exported (and whose level 3
+   steps succeeded)
+
+Each level is streamed from the archive and processed with bounded
+concurrency. Every completed step is appended to a checkpoint file, so an
+interrupted restore picks up where it stopped: a created workflow is recorded
+before it is tagged or transferred, and a resumed restore retries only the
+steps that did not complete instead of creating the workflow again.
+"""
+import asyncio
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from pydantic import BaseModel, Field, ValidationError
+
+from pyn8n.concurrency import run_bounded
+from pyn8n.models import Project, Tag, Variable, Workflow
+from pyn8n.n8n_client import N8nClient, paginate
+
+LEVELS: List[Tuple[str, ...]] = [
+    ("tag", "project", "variable"),
+    ("workflow",),
+    ("workflow_tags", "transfer"),
+    ("activate",),
+]
+
+# Steps applied to workflows already created, derived from their archive records.
+WORKFLOW_STEPS = ("workflow_tags", "transfer", "activate")
+
+
+class UnmappedReference(Exception):
+    """A record refers to an object (tag, project) that has no server ID yet."""
+
+
+class RestoreError(BaseModel):
+    kind: str = Field(..., description="Object type that failed to restore.")
+    old_id: str = Field(..., description="ID of the object in the archive.")
+    message: str = Field(..., description="Error reported by the server.")
+
+
+class RestoreReport(BaseModel):
+    created: Dict[str, int] = Field(default_factory=dict, description="Objects created per type.")
+    skipped: Dict[str, int] = Field(default_factory=dict, description="Objects already restored per the checkpoint.")
+    errors: List[RestoreError] = Field(default_factory=list, description="Objects that failed to restore.")
+
+
+def read_archive(path: Path, kinds: Optional[Tuple[str, ...]] = None) -> Iterator[Dict[str, Any]]:
+    """Stream ``{"type", "data"}`` records from an archive, optionally only those of ``kinds``."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if kinds is None or record["type"] in kinds:
+                yield record
+
+
+def record_key(record: Dict[str, Any]) -> str:
+    """Return the archive-side identity of a record (its ``id``, or ``key`` for variables)."""
+    data = record["data"]
+    return str(data.get("id") or data.get("key") or data["name"])
+
+
+class Checkpoint:
+    """
+    Append-only log of completed restore steps, mapping archive IDs to server IDs.
+
+    Each line is ``{"kind": ..., "old": ..., "new": ...}``. A torn final line
+    left by a crash is truncated on load.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.ids: Dict[Tuple[str, str], Optional[str]] = {}
+        self._handle = None
+        if path is not None and path.exists():
+            valid = 0
+            with path.open("rb") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    self.ids[(entry["kind"], entry["old"])] = entry["new"]
+                    valid += len(line)
+            if valid < path.stat().st_size:
+                with path.open("r+b") as handle:
+                    handle.truncate(valid)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        # Steps recorded without a server ID (by older versions) are not done.
+        return self.ids.get(key) is not None
+
+    def get(self, kind: str, old_id: Any) -> Optional[str]:
+        return self.ids.get((kind, str(old_id)))
+
+    def record(self, kind: str, old_id: str, new_id: Optional[str]) -> None:
+        self.ids[(kind, old_id)] = new_id
+        if self.path is None:
+            return
+        if self._handle is None:
+            self._handle = self.path.open("a", encoding="utf-8")
+        self._handle.write(json.dumps({"kind": kind, "old": old_id, "new": new_id}) + "\n")
+        self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class Restorer:
+    """Restore an archive into the instance behind ``client``."""
+
+    def __init__(
+        self,
+        client: N8nClient,
+        checkpoint: Optional[Checkpoint] = None,
+        concurrency: int = 8,
+        activate: bool = True,
+    ):
+        self.client = client
+        self.checkpoint = checkpoint or Checkpoint()
+        self.concurrency = concurrency
+        self.activate = activate
+        self.report = RestoreReport()
+        self._existing_tags: Optional[Dict[str, str]] = None
+        self._tags_lock = asyncio.Lock()
+
+    async def restore(self, path: Path) -> RestoreReport:
+        try:
+            for kinds in LEVELS:
+                if kinds == ("activate",) and not self.activate:
+                    continue
+                records = self._workflow_steps(path, kinds) if kinds[0] in WORKFLOW_STEPS else read_archive(path, kinds)
+                await run_bounded(records, self._restore_record, self.concurrency)
+        finally:
+            self.checkpoint.close()
+        return self.report
+
+    def _needs(self, kind: str, data: Dict[str, Any]) -> bool:
+        if kind == "workflow_tags":
+            return bool(data.get("tags"))
+        if kind == "transfer":
+            return bool(data.get("projectId"))
+        old_id = record_key({"data": data})
+        return bool(data.get("active")) and all(
+            (step, old_id) in self.checkpoint for step in ("workflow_tags", "transfer") if self._needs(step, data)
+        )
+
+    def _workflow_steps(self, path: Path, kinds: Tuple[str, ...]) -> Iterator[Dict[str, Any]]:
+        for record in read_archive(path, ("workflow",)):
+            if not self.checkpoint.get("workflow", record_key(record)):
+                continue
+            for kind in kinds:
+                if self._needs(kind, record["data"]):
+                    yield {"type": kind, "data": record["data"]}
+
+    async def _restore_record(self, record: Dict[str, Any]) -> None:
+        kind, old_id = record["type"], record_key(record)
+        if (kind, old_id) in self.checkpoint:
+            self.report.skipped[kind] = self.report.skipped.get(kind, 0) + 1
+            return
+        try:
+            new_id = await getattr(self, f"_restore_{kind}")(record["data"])
+        except (httpx.HTTPError, ValidationError, UnmappedReference) as exc:
+            message = exc.response.text if isinstance(exc, httpx.HTTPStatusError) else str(exc) or type(exc).__name__
+            self.report.errors.append(RestoreError(kind=kind, old_id=old_id, message=message))
+            return
+        self.checkpoint.record(kind, old_id, new_id)
+        self.report.created[kind] = self.report.created.get(kind, 0) + 1
+
+    async def _restore_tag(self, data: Dict[str, Any]) -> Optional[str]:
+        try:
+            return (await self.client.create_tag(Tag(name=data["name"]))).id
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code != httpx.codes.CONFLICT:
+                raise
+        # The tag already exists on the target instance: reuse it.
+        async with self._tags_lock:
+            if self._existing_tags is None:
+                self._existing_tags = {tag.name: tag.id async for tag in paginate(self.client.get_tags)}
+        tag_id = self._existing_tags.get(data["name"])
+        if tag_id is None:
+            raise UnmappedReference(f"tag {data['name']!r} already exists but was not found")
+        return tag_id
+
+    async def _restore_project(self, data: Dict[str, Any]) -> Optional[str]:
+        return (await self.client.create_project(Project(name=data["name"]))).id
+
+    async def _restore_variable(self, data: Dict[str, Any]) -> Optional[str]:
+        return (await self.client.create_variable(Variable(key=data["key"], value=data["value"]))).id
+
+    async def _restore_workflow(self, data: Dict[str, Any]) -> Optional[str]:
+        workflow = Workflow(**{key: value for key, value in data.items() if key not in ("id", "tags")})
+        return (await self.client.create_workflow(workflow)).id
+
+    async def _restore_workflow_tags(self, data: Dict[str, Any]) -> Optional[str]:
+        workflow_id = self.checkpoint.get("workflow", record_key({"data": data}))
+        tags = data.get("tags") or []
+        tag_ids = [self._remap_tag(tag) for tag in tags]
+        unmapped = [tag["id"] if isinstance(tag, dict) else tag for tag, tag_id in zip(tags, tag_ids) if not tag_id]
+        if unmapped:
+            raise UnmappedReference(f"tags {unmapped} were not restored")
+        await self.client.update_workflow_tags(workflow_id, [{"id": tag_id} for tag_id in tag_ids])
+        return workflow_id
+
+    async def _restore_transfer(self, data: Dict[str, Any]) -> Optional[str]:
+        workflow_id = self.checkpoint.get("workflow", record_key({"data": data}))
+        project_id = self.checkpoint.get("project", data["projectId"])
+        if not project_id:
+            raise UnmappedReference(f"project {data['projectId']!r} was not restored")
+        await self.client.transfer_workflow(workflow_id, project_id)
+        return project_id
+
+    async def _restore_activate(self, data: Dict[str, Any]) -> Optional[str]:
+        workflow_id = self.checkpoint.get("workflow", record_key({"data": data}))
+        await self.client.activate_workflow(workflow_id)
+        return workflow_id
+
+    def _remap_tag(self, tag: Any) -> Optional[str]:
+        """Resolve an archived tag reference (``{"id": ...}`` or a bare id) to its server ID."""
+        return self.checkpoint.get("tag", tag["id"] if isinstance(tag, dict) else tag)
+
+
+async def restore_archive(
+    client: N8nClient,
+    path: Path,
+    checkpoint_path: Optional[Path] = None,
+    concurrency: int = 8,
+    activate: bool = True,
+) -> RestoreReport:
+    """Restore the archive at ``path``, resuming from ``checkpoint_path`` if it exists."""
+    restorer = Restorer(client, Checkpoint(checkpoint_path), concurrency=concurrency, activate=activate)
+    return await restorer.restore(path)
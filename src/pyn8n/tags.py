@@ -0,0 +1,188 @@
+"""
+Tag lookup and bulk retagging.
+
+``TagIndex`` reads every tag once and keeps name -> tag and id -> tag maps,
+updated by its own ``create``, ``rename`` and ``delete``, so resolving a tag is
+a dict lookup instead of a paginated scan.
+
+``TagIndex.retag`` adds and removes tags on every workflow matching a filter:
+tags to add that do not exist are created once up front, the matching
+workflows are listed in full before any of them is changed (n8n pages
+workflows by offset, so updating while paging would skip matches), each
+workflow's new tag set is computed from the tags already present in the
+listing, and ``PUT /workflows/{id}/tags`` is only sent (concurrently) for
+workflows whose tags actually change.
+"""
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+
+import httpx
+from pydantic import BaseModel, Field
+
+from pyn8n.concurrency import run_bounded
+from pyn8n.models import Tag, Workflow
+from pyn8n.n8n_client import N8nClient, paginate
+
+
+class WorkflowFilter(BaseModel):
+    active: Optional[bool] = Field(None, description="Only active (or inactive) workflows.")
+    tags: Optional[List[str]] = Field(None, description="Only workflows carrying all of these tag names.")
+    name: Optional[str] = Field(None, description="Only workflows with exactly this name.")
+    ids: Optional[Set[str]] = Field(None, description="Only these workflow ids.")
+
+
+class RetagReport(BaseModel):
+    matched: int = Field(0, description="Workflows selected by the filter.")
+    updated: int = Field(0, description="Workflows whose tags were changed.")
+    unchanged: int = Field(0, description="Workflows that already had the wanted tags.")
+    created_tags: List[str] = Field(default_factory=list, description="Names of tags created for the retag.")
+    errors: Dict[str, str] = Field(default_factory=dict, description="Workflow id -> why its update failed.")
+    elapsed: float = Field(0.0, description="Wall-clock seconds spent.")
+
+
+class TagIndex:
+    """Every tag of an instance by name and by id."""
+
+    def __init__(self, client: N8nClient, concurrency: int = 8):
+        self.client = client
+        self.concurrency = concurrency
+        self.by_name: Dict[str, Tag] = {}
+        self.by_id: Dict[str, Tag] = {}
+        self.loaded = False
+
+    async def load(self) -> "TagIndex":
+        """(Re)read all tags."""
+        tags = [tag async for tag in paginate(self.client.get_tags, limit=250)]
+        self.by_name = {tag.name: tag for tag in tags}
+        self.by_id = {tag.id: tag for tag in tags}
+        self.loaded = True
+        return self
+
+    async def ensure_loaded(self) -> None:
+        if not self.loaded:
+            await self.load()
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def id_of(self, name: str) -> Optional[str]:
+        tag = self.by_name.get(name)
+        return tag.id if tag is not None else None
+
+    def name_of(self, tag_id: str) -> Optional[str]:
+        tag = self.by_id.get(tag_id)
+        return tag.name if tag is not None else None
+
+    def remember(self, tag: Tag) -> Tag:
+        previous = self.by_id.get(tag.id)
+        if previous is not None and previous.name != tag.name:
+            self.by_name.pop(previous.name, None)
+        self.by_name[tag.name] = self.by_id[tag.id] = tag
+        return tag
+
+    async def create(self, name: str, reload: bool = True) -> Optional[Tag]:
+        """
+        Create a tag, or return the existing one if another client created it
+        first. With ``reload=False`` such a conflict returns ``None`` and the
+        caller reloads the index.
+        """
+        try:
+            return self.remember(await self.client.create_tag(Tag(name=name)))
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code != httpx.codes.CONFLICT:
+                raise
+        if not reload:
+            return None
+        await self.load()
+        return self.by_name[name]
+
+    async def rename(self, tag_id: str, name: str) -> Tag:
+        return self.remember(await self.client.update_tag(tag_id, {"name": name}))
+
+    async def delete(self, tag_id: str) -> Tag:
+        deleted = await self.client.delete_tag(tag_id)
+        tag = self.by_id.pop(tag_id, None)
+        if tag is not None:
+            self.by_name.pop(tag.name, None)
+        return deleted
+
+    async def ensure(self, names: Iterable[str]) -> List[Tag]:
+        """The tags called ``names``, creating the missing ones concurrently."""
+        await self.ensure_loaded()
+        names = list(dict.fromkeys(names))
+        conflicts: List[str] = []
+
+        async def create(name: str) -> None:
+            if await self.create(name, reload=False) is None:
+                conflicts.append(name)
+
+        await run_bounded([name for name in names if name not in self.by_name], create, self.concurrency)
+        if conflicts:
+            await self.load()
+        return [self.by_name[name] for name in names]
+
+    def tag_id(self, tag: Union[Tag, str]) -> Optional[str]:
+        """The id of a tag as it appears in a workflow listing (a tag object or a name)."""
+        if isinstance(tag, Tag):
+            return tag.id or self.id_of(tag.name)
+        return self.id_of(tag) or tag
+
+    async def workflows(self, workflow_filter: WorkflowFilter):
+        async for workflow in paginate(
+            self.client.get_workflows,
+            limit=250,
+            active=workflow_filter.active,
+            tags=",".join(workflow_filter.tags) if workflow_filter.tags else None,
+            name=workflow_filter.name,
+        ):
+            if workflow_filter.ids is None or workflow.id in workflow_filter.ids:
+                yield workflow
+
+    async def retag(
+        self,
+        workflow_filter: Optional[WorkflowFilter] = None,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+        predicate: Optional[Callable[[Workflow], bool]] = None,
+        dry_run: bool = False,
+    ) -> RetagReport:
+        """
+        Add the tags named ``add`` to, and remove those named ``remove`` from,
+        every workflow matching ``workflow_filter`` (and ``predicate``).
+        """
+        started = time.monotonic()
+        workflow_filter = workflow_filter or WorkflowFilter()
+        await self.ensure_loaded()
+        report = RetagReport()
+        add, remove = list(add), list(remove)
+        if dry_run:
+            report.created_tags = [name for name in add if name not in self.by_name]
+            add_ids = [self.id_of(name) or f"new:{name}" for name in add]
+        else:
+            missing = [name for name in add if name not in self.by_name]
+            add_ids = [tag.id for tag in await self.ensure(add)]
+            report.created_tags = missing
+        remove_ids = {self.id_of(name) for name in remove} - {None}
+
+        async def update(workflow: Workflow) -> None:
+            if predicate is not None and not predicate(workflow):
+                return
+            report.matched += 1
+            current = [tag_id for tag_id in map(self.tag_id, workflow.tags) if tag_id]
+            wanted = [tag_id for tag_id in current if tag_id not in remove_ids]
+            wanted += [tag_id for tag_id in add_ids if tag_id not in wanted]
+            if set(wanted) == set(current):
+                report.unchanged += 1
+                return
+            if not dry_run:
+                try:
+                    await self.client.update_workflow_tags(workflow.id, [{"id": tag_id} for tag_id in wanted])
+                except httpx.HTTPError as exc:
+                    report.errors[workflow.id] = str(exc)
+                    return
+            report.updated += 1
+
+        matching = [workflow async for workflow in self.workflows(workflow_filter)]
+        await run_bounded(matching, update, self.concurrency)
+        report.elapsed = time.monotonic() - started
+        return report
@@ -0,0 +1,274 @@
+"""
+Per-endpoint tracing for N8nClient.
+
+Pass a ``Telemetry`` to ``N8nClient(telemetry=...)`` and every API call is
+recorded as a ``Span`` whose latency is split into phases:
+
+* ``pool_wait`` - waiting for a pooled connection
+* ``connect`` - TCP and TLS handshakes for a new connection
+* ``server`` - sending the request until the response headers arrive
+* ``download`` - reading the response body
+* ``decode`` - JSON decoding
+* ``validate`` - building the pydantic models
+
+alongside request/response payload sizes and connection retries. The network
+phases come from httpcore's trace events; transports that do not emit them
+(e.g. ``httpx.ASGITransport``) report everything before the body as ``server``.
+
+Finished spans are handed to exporters: ``InProcessCollector`` keeps them in
+memory, ``PrometheusExporter`` feeds a ``MetricsRegistry`` and
+``OpenTelemetryExporter`` emits OpenTelemetry spans and histograms (and from
+there OTLP, if the SDK is configured that way). A client created without
+telemetry installs no hooks at all.
+"""
+import contextvars
+import functools
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Protocol
+
+import httpx
+
+from pyn8n.metrics import SIZE_BUCKETS, MetricsRegistry
+
+PHASES = ("pool_wait", "connect", "server", "download", "decode", "validate")
+
+current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("pyn8n_span", default=None)
+
+
+class Span:
+    """Timings of a single ``N8nClient`` method call."""
+
+    __slots__ = (
+        "endpoint", "started_ns", "started", "duration", "phases", "attempts", "retries",
+        "request_bytes", "response_bytes", "status_code", "error", "mark", "connecting", "headers_received",
+        "decoded_at",
+    )
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.started_ns = time.time_ns()
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.attempts = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status_code: Optional[int] = None
+        self.error: Optional[str] = None
+        self.mark = self.started
+        self.connecting = False
+        self.headers_received = False
+        self.decoded_at: Optional[float] = None
+
+    def lap(self, phase: str) -> float:
+        now = time.perf_counter()
+        self.phases[phase] += now - self.mark
+        self.mark = now
+        return now
+
+    async def trace(self, event: str, info: Dict[str, Any]) -> None:
+        """httpcore ``trace`` extension: turns connection events into phase boundaries."""
+        if event == "connection.connect_tcp.started":
+            self.lap("pool_wait")
+            self.connecting = True
+        elif event == "connection.retry.started":
+            self.retries += 1
+        elif event.endswith(".send_request_headers.started"):
+            self.lap("connect" if self.connecting else "pool_wait")
+            self.connecting = False
+        elif event.endswith(".receive_response_headers.complete"):
+            self.lap("server")
+            self.headers_received = True
+
+    def decoded(self, started: float) -> None:
+        self.decoded_at = time.perf_counter()
+        self.phases["decode"] += self.decoded_at - started
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        end = time.perf_counter()
+        self.duration = end - self.started
+        if self.decoded_at is not None:
+            self.phases["validate"] += end - self.decoded_at
+        if isinstance(error, httpx.HTTPStatusError):
+            self.status_code = error.response.status_code
+        if error is not None:
+            self.error = type(error).__name__
+
+    def as_dict(self) -> Dict[str, Any]:
+        internal = ("mark", "connecting", "headers_received", "decoded_at")
+        return {name: getattr(self, name) for name in self.__slots__ if name not in internal}
+
+
+class Exporter(Protocol):
+    def export(self, span: Span) -> None:
+        ...
+
+
+class Telemetry:
+    """Creates spans for client calls and fans finished spans out to ``exporters``."""
+
+    def __init__(self, *exporters: Exporter):
+        self.exporters = list(exporters)
+
+    def start(self, endpoint: str) -> Span:
+        return Span(endpoint)
+
+    def record(self, span: Span) -> None:
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    def event_hooks(self) -> Dict[str, List[Any]]:
+        return {"request": [self.on_request], "response": [self.on_response]}
+
+    async def on_request(self, request: httpx.Request) -> None:
+        span = current_span.get()
+        if span is None:
+            return
+        span.attempts += 1
+        span.retries += span.attempts > 1
+        span.request_bytes += len(request.content)
+        span.mark = time.perf_counter()
+        span.headers_received = False
+        request.extensions["trace"] = span.trace
+        request.extensions["pyn8n.span"] = span
+
+    async def on_response(self, response: httpx.Response) -> None:
+        span = response.request.extensions.get("pyn8n.span")
+        if span is None:
+            return
+        if not span.headers_received:
+            span.lap("server")
+        span.status_code = response.status_code
+        await response.aread()
+        span.lap("download")
+        span.response_bytes += len(response.content)
+
+    def wrap(self, endpoint: str, method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """Wrap a bound client coroutine method so each call is recorded as a span."""
+
+        @functools.wraps(method)
+        async def traced(*args: Any, **kwargs: Any) -> Any:
+            span = self.start(endpoint)
+            token = current_span.set(span)
+            try:
+                result = await method(*args, **kwargs)
+            except BaseException as exc:
+                span.finish(exc)
+                raise
+            else:
+                span.finish()
+            finally:
+                current_span.reset(token)
+                self.record(span)
+            return result
+
+        return traced
+
+
+class InProcessCollector:
+    """Keeps the most recent ``maxlen`` spans for tests, notebooks and debugging."""
+
+    def __init__(self, maxlen: int = 10_000):
+        self.spans: Deque[Span] = deque(maxlen=maxlen)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Call count, error count and mean seconds per phase, per endpoint."""
+        result: Dict[str, Dict[str, float]] = {}
+        for span in self.spans:
+            entry = result.setdefault(span.endpoint, {"calls": 0, "errors": 0, "duration": 0.0, **dict.fromkeys(PHASES, 0.0)})
+            entry["calls"] += 1
+            entry["errors"] += span.error is not None
+            entry["duration"] += span.duration
+            for phase, seconds in span.phases.items():
+                entry[phase] += seconds
+        for entry in result.values():
+            for key in ("duration", *PHASES):
+                entry[key] /= entry["calls"]
+        return result
+
+
+class PrometheusExporter:
+    """Aggregates spans into Prometheus histograms and counters on ``registry``."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        self.calls = self.registry.counter(
+            "pyn8n_client_requests_total", "n8n API calls by endpoint and status.", ["endpoint", "status"]
+        )
+        self.retries = self.registry.counter("pyn8n_client_retries_total", "Retried n8n API requests.", ["endpoint"])
+        self.duration = self.registry.histogram(
+            "pyn8n_client_request_duration_seconds", "Total n8n API call latency.", ["endpoint"]
+        )
+        self.phases = self.registry.histogram(
+            "pyn8n_client_phase_duration_seconds", "n8n API call latency per phase.", ["endpoint", "phase"]
+        )
+        self.payload = self.registry.histogram(
+            "pyn8n_client_payload_bytes", "n8n API payload sizes.", ["endpoint", "direction"], buckets=SIZE_BUCKETS
+        )
+
+    def export(self, span: Span) -> None:
+        self.calls.labels(span.endpoint, span.status_code or span.error or "none").inc()
+        if span.retries:
+            self.retries.labels(span.endpoint).inc(span.retries)
+        self.duration.labels(span.endpoint).observe(span.duration)
+        for phase, seconds in span.phases.items():
+            self.phases.labels(span.endpoint, phase).observe(seconds)
+        self.payload.labels(span.endpoint, "request").observe(span.request_bytes)
+        self.payload.labels(span.endpoint, "response").observe(span.response_bytes)
+
+    def render(self) -> str:
+        return self.registry.render()
+
+
+class OpenTelemetryExporter:
+    """
+    Emits each span as an OpenTelemetry client span plus duration histograms.
+
+    Requires ``opentelemetry-api``; exporting over OTLP is a matter of
+    configuring the SDK's tracer and meter providers.
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None):
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as exc:
+            raise ImportError("OpenTelemetryExporter requires the opentelemetry-api package") from exc
+
+        self.trace = trace
+        self.tracer = trace.get_tracer("pyn8n", tracer_provider=tracer_provider)
+        meter = metrics.get_meter("pyn8n", meter_provider=meter_provider)
+        self.duration = meter.create_histogram("pyn8n.client.duration", unit="s", description="n8n API call latency.")
+        self.phase_duration = meter.create_histogram(
+            "pyn8n.client.phase.duration", unit="s", description="n8n API call latency per phase."
+        )
+        self.payload = meter.create_histogram("pyn8n.client.payload.size", unit="By", description="n8n API payload sizes.")
+
+    def export(self, span: Span) -> None:
+        attributes = {"pyn8n.endpoint": span.endpoint}
+        otel_span = self.tracer.start_span(
+            f"n8n {span.endpoint}", kind=self.trace.SpanKind.CLIENT, start_time=span.started_ns, attributes=attributes
+        )
+        otel_span.set_attributes(
+            {
+                **{f"pyn8n.phase.{phase}": seconds for phase, seconds in span.phases.items()},
+                "pyn8n.retries": span.retries,
+                "http.request.body.size": span.request_bytes,
+                "http.response.body.size": span.response_bytes,
+            }
+        )
+        if span.status_code is not None:
+            otel_span.set_attribute("http.response.status_code", span.status_code)
+        if span.error is not None:
+            otel_span.set_status(self.trace.Status(self.trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=span.started_ns + int(span.duration * 1e9))
+
+        self.duration.record(span.duration, attributes)
+        for phase, seconds in span.phases.items():
+            self.phase_duration.record(seconds, {**attributes, "pyn8n.phase": phase})
+        self.payload.record(span.request_bytes, {**attributes, "pyn8n.direction": "request"})
+        self.payload.record(span.response_bytes, {**attributes, "pyn8n.direction": "response"})
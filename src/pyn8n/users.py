@@ -0,0 +1,180 @@
+"""
+Bulk user provisioning.
+
+``provision_users`` brings an instance's users in line with a list of
+invitations:
+
+1. Existing users are read once through the auto-paginated ``GET /users``.
+2. Missing users are invited with ``POST /users`` in chunks of ``batch_size``,
+   several chunks at a time. A chunk the server rejects as a whole with a 4xx
+   is split in half and retried, so one bad address cannot fail a thousand
+   others. A timeout, 429 or 5xx resends the same chunk after a backoff
+   instead: ``POST /users`` is not idempotent and splitting would only
+   multiply requests while the server is struggling.
+3. Invitations that still failed are checked against a fresh ``GET /users``;
+   users that exist by now (e.g. a timed-out request that did reach the
+   server) count as created.
+4. Existing users with a different global role get ``PATCH /users/{id}/role``
+   calls, in parallel.
+
+Every invitation ends up in the report with its own status.
+"""
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+from pydantic import BaseModel, Field
+
+from pyn8n.concurrency import run_bounded
+from pyn8n.n8n_client import N8nClient, paginate, retryable
+
+# Invitations per POST /users. n8n creates the users of a request one after the
+# other, so larger chunks only add latency; 50 keeps each request well inside
+# the default client timeout.
+DEFAULT_BATCH_SIZE = 50
+
+STATUSES = ("created", "role-changed", "unchanged", "failed")
+
+
+class UserInvite(BaseModel):
+    email: str = Field(..., description="Email address of the user.")
+    role: str = Field("global:member", description="Global role, e.g. global:member or global:admin.")
+
+
+class UserResult(BaseModel):
+    email: str = Field(..., description="Email address of the user.")
+    status: str = Field(..., description="created, role-changed, unchanged or failed.")
+    id: Optional[str] = Field(None, description="User id, when known.")
+    role: Optional[str] = Field(None, description="Role the user has after provisioning.")
+    error: Optional[str] = Field(None, description="Why provisioning failed.")
+
+
+class ProvisioningReport(BaseModel):
+    results: List[UserResult] = Field(default_factory=list, description="One entry per invitation, in input order.")
+    elapsed: float = Field(0.0, description="Wall-clock seconds spent.")
+
+    def counts(self) -> Dict[str, int]:
+        counts = dict.fromkeys(STATUSES, 0)
+        for result in self.results:
+            counts[result.status] += 1
+        return counts
+
+    @property
+    def failed(self) -> List[UserResult]:
+        return [result for result in self.results if result.status == "failed"]
+
+
+def http_error(exc: httpx.HTTPError) -> str:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"{exc.response.status_code}: {exc.response.text}"
+    return str(exc) or type(exc).__name__
+
+
+async def existing_users(client: N8nClient, page_size: int = 250) -> Dict[str, Dict]:
+    """All users with their roles, by lower-cased email."""
+    return {
+        user["email"].lower(): user
+        async for user in paginate(client.get_users, limit=page_size, include_role=True)
+    }
+
+
+async def provision_users(
+    client: N8nClient,
+    invites: Iterable[UserInvite],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = 4,
+    update_roles: bool = True,
+    max_attempts: int = 4,
+    backoff: float = 0.5,
+) -> ProvisioningReport:
+    """
+    Invite users that do not exist yet and align the role of those that do.
+
+    Invitations are deduplicated by email (the last one wins). At most
+    ``concurrency`` requests are in flight; a chunk hitting a timeout, 429 or
+    5xx is sent up to ``max_attempts`` times, ``backoff`` seconds apart
+    (doubling).
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    started = time.monotonic()
+    wanted = {invite.email.lower(): invite for invite in invites}
+    users = await existing_users(client)
+    results: Dict[str, UserResult] = {}
+
+    missing = [invite for email, invite in wanted.items() if email not in users]
+    chunks = [missing[index:index + batch_size] for index in range(0, len(missing), batch_size)]
+
+    async def send(chunk: List[UserInvite]) -> List[Dict]:
+        attempt = 0
+        while True:
+            try:
+                return await client.create_users([invite.model_dump() for invite in chunk])
+            except httpx.HTTPError as exc:
+                attempt += 1
+                if not retryable(exc) or attempt >= max_attempts:
+                    raise
+            await asyncio.sleep(backoff * 2 ** (attempt - 1))
+
+    async def create(chunk: List[UserInvite]) -> None:
+        try:
+            created = await send(chunk)
+        except httpx.HTTPError as exc:
+            if len(chunk) > 1 and not retryable(exc):
+                middle = len(chunk) // 2
+                await create(chunk[:middle])
+                await create(chunk[middle:])
+                return
+            for invite in chunk:
+                results[invite.email.lower()] = UserResult(email=invite.email, status="failed", error=http_error(exc))
+            return
+        roles = {invite.email.lower(): invite.role for invite in chunk}
+        for entry in created:
+            user = entry.get("user") or {}
+            email = (user.get("email") or "").lower()
+            if email not in roles:
+                continue
+            if entry.get("error"):
+                results[email] = UserResult(email=user["email"], status="failed", id=user.get("id"), error=entry["error"])
+            else:
+                results[email] = UserResult(email=user["email"], status="created", id=user.get("id"), role=roles[email])
+        for invite in chunk:
+            results.setdefault(
+                invite.email.lower(),
+                UserResult(email=invite.email, status="failed", error="not in the server's response"),
+            )
+
+    async def change_role(email: str) -> None:
+        user, role = users[email], wanted[email].role
+        try:
+            await client.change_user_role(user["id"], role)
+        except httpx.HTTPError as exc:
+            results[email] = UserResult(
+                email=user["email"], status="failed", id=user["id"], role=user.get("role"), error=http_error(exc)
+            )
+        else:
+            results[email] = UserResult(email=user["email"], status="role-changed", id=user["id"], role=role)
+
+    changes = []
+    for email, invite in wanted.items():
+        user = users.get(email)
+        if user is None:
+            continue
+        if update_roles and user.get("role") != invite.role:
+            changes.append(email)
+        else:
+            results[email] = UserResult(email=user["email"], status="unchanged", id=user["id"], role=user.get("role"))
+
+    await run_bounded(chunks, create, concurrency)
+    if any(results[invite.email.lower()].status == "failed" for invite in missing):
+        try:
+            users_now = await existing_users(client)
+        except httpx.HTTPError:
+            users_now = {}
+        for invite in missing:
+            email, user = invite.email.lower(), users_now.get(invite.email.lower())
+            if results[email].status == "failed" and user is not None:
+                results[email] = UserResult(email=user["email"], status="created", id=user["id"], role=user.get("role"))
+    await run_bounded(changes, change_role, concurrency)
+    return ProvisioningReport(results=[results[email] for email in wanted], elapsed=time.monotonic() - started)
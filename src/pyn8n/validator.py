@@ -0,0 +1,201 @@
+"""
+Offline workflow validation.
+
+Catches the mistakes n8n would answer with a 400 (or silently accept and then
+fail at run time) before a workflow is uploaded: duplicate node ids or names,
+connections to nodes that do not exist or that name nodes by id, workflows
+without a trigger, missing required parameters and dangling credential
+references.
+
+``validate_directory`` checks every ``*.json`` workflow under a directory on a
+process pool, so thousands of files validate in seconds in CI.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field, ValidationError
+
+from pyn8n.models import Workflow
+
+TRIGGER_TYPES = {
+    "n8n-nodes-base.webhook",
+    "n8n-nodes-base.cron",
+    "n8n-nodes-base.interval",
+    "n8n-nodes-base.start",
+    "n8n-nodes-base.emailReadImap",
+    "n8n-nodes-base.executeWorkflowTrigger",
+}
+
+# Parameters n8n has no default for, per node type.
+REQUIRED_PARAMETERS: Dict[str, Tuple[str, ...]] = {
+    "n8n-nodes-base.webhook": ("path",),
+    "n8n-nodes-base.httpRequest": ("url",),
+    "n8n-nodes-base.executeWorkflow": ("workflowId",),
+    "n8n-nodes-base.respondToWebhook": ("respondWith",),
+}
+
+
+class ValidationIssue(BaseModel):
+    code: str = Field(..., description="Machine-readable issue kind, e.g. unknown-target.")
+    message: str = Field(..., description="Human-readable description.")
+    node: Optional[str] = Field(None, description="Name of the node the issue concerns.")
+    severity: str = Field("error", description="error or warning.")
+
+
+def is_trigger(node_type: str) -> bool:
+    return node_type in TRIGGER_TYPES or node_type.endswith("Trigger")
+
+
+def connection_targets(source: str, types: Any, issues: List[ValidationIssue]) -> Iterator[str]:
+    """
+    Names of the nodes ``source`` connects to. Each level of
+    ``{type: [[{"node": name, ...}]]}`` is type-checked and a shape n8n cannot
+    read is reported as ``malformed-connection`` instead of raising.
+    """
+
+    def malformed(message: str) -> None:
+        issues.append(ValidationIssue(code="malformed-connection", message=message, node=source))
+
+    if types is None:
+        return
+    if not isinstance(types, dict):
+        malformed(f"connections must map connection types to outputs, got {type(types).__name__}")
+        return
+    for kind, outputs in types.items():
+        if outputs is None:
+            continue
+        if not isinstance(outputs, list):
+            malformed(f"{kind!r} outputs must be a list, got {type(outputs).__name__}")
+            continue
+        for targets in outputs:
+            if targets is None:
+                continue
+            if not isinstance(targets, list):
+                malformed(f"each {kind!r} output must be a list of targets, got {type(targets).__name__}")
+                continue
+            for target in targets:
+                if not isinstance(target, dict) or not isinstance(target.get("node"), str):
+                    malformed(f"connection target must be an object with a node name, got {target!r}")
+                    continue
+                yield target["node"]
+
+
+def validate_workflow(
+    workflow: Workflow,
+    required_parameters: Optional[Mapping[str, Iterable[str]]] = None,
+    known_credentials: Optional[Set[str]] = None,
+) -> List[ValidationIssue]:
+    """
+    Check ``workflow`` and return every issue found (empty when valid).
+
+    ``required_parameters`` extends ``REQUIRED_PARAMETERS``. When
+    ``known_credentials`` (ids or names) is given, every credential a node
+    references must be in it.
+    """
+    required = {**REQUIRED_PARAMETERS, **(required_parameters or {})}
+    issues: List[ValidationIssue] = []
+    names: Set[str] = set()
+    ids: Dict[str, str] = {}
+
+    for node in workflow.nodes:
+        if node.name in names:
+            issues.append(ValidationIssue(code="duplicate-name", message=f"duplicate node name {node.name!r}", node=node.name))
+        names.add(node.name)
+        if node.id is not None:
+            if node.id in ids:
+                issues.append(
+                    ValidationIssue(
+                        code="duplicate-id", message=f"node id {node.id} is also used by {ids[node.id]!r}", node=node.name
+                    )
+                )
+            ids[node.id] = node.name
+
+        for parameter in required.get(node.type, ()):
+            if node.parameters.get(parameter) in (None, ""):
+                issues.append(
+                    ValidationIssue(
+                        code="missing-parameter", message=f"{node.type} requires parameter {parameter!r}", node=node.name
+                    )
+                )
+
+        for credential_type, credential in (node.credentials or {}).items():
+            reference = credential.id or credential.name
+            if not reference:
+                issues.append(
+                    ValidationIssue(code="credential-reference", message=f"{credential_type} credential has no id", node=node.name)
+                )
+            elif known_credentials is not None and not {credential.id, credential.name} & known_credentials:
+                issues.append(
+                    ValidationIssue(
+                        code="unknown-credential",
+                        message=f"{credential_type} credential {reference!r} does not exist",
+                        node=node.name,
+                    )
+                )
+
+    if not any(is_trigger(node.type) and not node.disabled for node in workflow.nodes):
+        issues.append(ValidationIssue(code="no-trigger", message="workflow has no enabled trigger node"))
+
+    for source, types in workflow.connections.items():
+        if source not in names:
+            if source in ids:
+                issues.append(
+                    ValidationIssue(
+                        code="connection-by-id",
+                        message=f"connections must be keyed by node name, not id {source!r}",
+                        node=ids[source],
+                    )
+                )
+            else:
+                issues.append(ValidationIssue(code="unknown-source", message=f"connection from unknown node {source!r}"))
+        for name in connection_targets(source, types, issues):
+            if name in names:
+                continue
+            if name in ids:
+                issues.append(
+                    ValidationIssue(
+                        code="connection-by-id",
+                        message=f"connection targets must be node names, not id {name!r}",
+                        node=source,
+                    )
+                )
+            else:
+                issues.append(
+                    ValidationIssue(code="unknown-target", message=f"connection to unknown node {name!r}", node=source)
+                )
+    return issues
+
+
+def validate_file(
+    path: Path,
+    required_parameters: Optional[Mapping[str, Iterable[str]]] = None,
+    known_credentials: Optional[Set[str]] = None,
+) -> Tuple[str, List[ValidationIssue]]:
+    """Load and validate one exported workflow file."""
+    try:
+        workflow = Workflow.model_validate(json.loads(Path(path).read_text(encoding="utf-8")))
+    except (OSError, ValueError) as exc:
+        message = f"{len(exc.errors())} schema errors: {exc.errors()[0]['msg']}" if isinstance(exc, ValidationError) else str(exc)
+        return str(path), [ValidationIssue(code="invalid-file", message=message)]
+    return str(path), validate_workflow(workflow, required_parameters, known_credentials)
+
+
+def validate_directory(
+    directory: Path,
+    pattern: str = "**/*.json",
+    workers: Optional[int] = None,
+    required_parameters: Optional[Mapping[str, Iterable[str]]] = None,
+    known_credentials: Optional[Set[str]] = None,
+) -> Dict[str, List[ValidationIssue]]:
+    """Validate every file matching ``pattern`` across ``workers`` processes; returns issues per file."""
+    paths = sorted(Path(directory).glob(pattern))
+    check = partial(validate_file, required_parameters=required_parameters, known_credentials=known_credentials)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2:
+        return dict(map(check, paths))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(check, paths, chunksize=max(1, len(paths) // (workers * 4))))
@@ -0,0 +1,184 @@
+"""
+In-memory view of n8n variables.
+
+``VariableStore`` loads every variable once and then serves ``get(key)`` from a
+dict: O(1), no network, safe to call in hot loops and from other threads. A
+background task re-lists the variables every ``interval`` seconds and applies
+only the differences. After the initial load, the registered change callbacks
+are called for each key that was added, changed or removed. n8n has no
+"changed since" filter, so every refresh reads all pages, but it publishes
+nothing when nothing changed.
+
+n8n's API has no variable update, so ``set`` replaces a variable by deleting
+and re-creating it. Writes to the same key are serialised, the local value
+only changes once the new variable exists, and if the create fails the old
+value is restored on the server.
+
+    async with VariableStore(client, interval=30) as store:
+        store.on_change(lambda key, old, new: print(key, old, "->", new))
+        timeout = float(store.get("api_timeout", "10"))
+        await store.set_many({"feature_x": "on", "batch_size": "500"})
+"""
+import asyncio
+import logging
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import httpx
+
+from pyn8n.concurrency import run_bounded
+from pyn8n.models import Variable
+from pyn8n.n8n_client import N8nClient, paginate
+
+logger = logging.getLogger(__name__)
+
+ChangeCallback = Callable[[str, Optional[str], Optional[str]], None]
+
+
+class VariableStore:
+    """All variables of an instance, kept in memory and refreshed in the background."""
+
+    def __init__(self, client: N8nClient, interval: Optional[float] = 60.0, concurrency: int = 8):
+        self.client = client
+        self.interval = interval
+        self.concurrency = concurrency
+        self.values: Dict[str, str] = {}
+        self.ids: Dict[str, str] = {}
+        self.callbacks: List[ChangeCallback] = []
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self.task: Optional[asyncio.Task] = None
+        self.loaded = False
+        self.generation = 0
+        self.written: Dict[str, int] = {}
+
+    async def __aenter__(self) -> "VariableStore":
+        await self.refresh()
+        if self.interval:
+            self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self.values.get(key, default)
+
+    def __getitem__(self, key: str) -> str:
+        return self.values[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def snapshot(self) -> Dict[str, str]:
+        return dict(self.values)
+
+    def on_change(self, callback: ChangeCallback) -> ChangeCallback:
+        """Call ``callback(key, old, new)`` after every change; ``None`` stands for absent. Usable as a decorator."""
+        self.callbacks.append(callback)
+        return callback
+
+    def publish(self, changes: Iterable[Tuple[str, Optional[str], Optional[str]]]) -> None:
+        for key, old, new in changes:
+            for callback in self.callbacks:
+                try:
+                    callback(key, old, new)
+                except Exception:
+                    logger.exception("Variable change callback failed for %s", key)
+
+    async def refresh(self) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """Re-read every variable, swap in the new state and return what changed (published after the first load)."""
+        started = self.generation
+        values: Dict[str, str] = {}
+        ids: Dict[str, str] = {}
+        async for variable in paginate(self.client.get_variables, limit=250):
+            values[variable.key] = variable.value
+            ids[variable.key] = variable.id
+        # Keys written during the listing, or being written now, keep their local state.
+        for key in [key for key, lock in self.locks.items() if lock.locked() or self.written.get(key, 0) > started]:
+            if key in self.values:
+                values[key], ids[key] = self.values[key], self.ids[key]
+            else:
+                values.pop(key, None)
+                ids.pop(key, None)
+        previous = self.values
+        changes = [(key, previous.get(key), value) for key, value in values.items() if previous.get(key) != value]
+        changes += [(key, value, None) for key, value in previous.items() if key not in values]
+        self.values, self.ids = values, ids
+        first, self.loaded = not self.loaded, True
+        if not first:
+            self.publish(changes)
+        return changes
+
+    def mark_written(self, key: str) -> None:
+        self.generation += 1
+        self.written[key] = self.generation
+
+    async def set(self, key: str, value: str) -> Variable:
+        """Create or replace ``key`` (delete + create on the server)."""
+        lock = self.locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            old_id, old_value = self.ids.get(key), self.values.get(key)
+            if old_id is not None and old_value == value:
+                return Variable(id=old_id, key=key, value=value)
+            if old_id is not None:
+                await self.client.delete_variable(old_id)
+            try:
+                created = await self.client.create_variable(Variable(key=key, value=value))
+            except httpx.HTTPError:
+                if old_id is not None:
+                    restored = await self.client.create_variable(Variable(key=key, value=old_value))
+                    self.ids = {**self.ids, key: restored.id}
+                    self.mark_written(key)
+                raise
+            self.ids = {**self.ids, key: created.id}
+            self.values = {**self.values, key: value}
+            self.mark_written(key)
+        self.publish([(key, old_value, value)])
+        return created
+
+    async def delete(self, key: str) -> bool:
+        """Remove ``key``; returns False when it did not exist."""
+        lock = self.locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            variable_id = self.ids.get(key)
+            if variable_id is None:
+                return False
+            await self.client.delete_variable(variable_id)
+            old_value = self.values.get(key)
+            self.ids = {name: value for name, value in self.ids.items() if name != key}
+            self.values = {name: value for name, value in self.values.items() if name != key}
+            self.mark_written(key)
+        self.publish([(key, old_value, None)])
+        return True
+
+    async def set_many(self, values: Mapping[str, str]) -> None:
+        """Upsert several variables, at most ``concurrency`` at a time."""
+
+        async def upsert(item: Tuple[str, str]) -> None:
+            await self.set(*item)
+
+        await run_bounded(values.items(), upsert, self.concurrency)
+
+    def start(self) -> None:
+        """Refresh every ``interval`` seconds in a background task (inside the running loop)."""
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except httpx.HTTPError as exc:
+                logger.warning("Variable refresh failed: %s", exc)
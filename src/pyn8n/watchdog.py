@@ -0,0 +1,141 @@
+"""
+Blocking-call watchdog for the pyn8n REST API.
+
+A heartbeat coroutine stamps the time on every event-loop turn it gets, and a
+daemon thread checks the stamp. When the loop has not come back for longer
+than ``threshold`` seconds, the thread grabs the loop thread's current Python
+stack (the code that is blocking) and the request being served by the running
+task, so a spike in ``pyn8n_event_loop_lag_seconds`` can be traced to the
+exact route, node and line. Each stall is logged once, with its full duration
+once the loop recovers, and kept for ``GET /debug/blocking``.
+
+Enable it with ``PYN8N_WATCHDOG_ENABLED=1``; the threshold is
+``PYN8N_WATCHDOG_THRESHOLD`` (seconds).
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from typing import Any, Deque, List, MutableMapping, Optional
+
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings
+
+logger = logging.getLogger(__name__)
+
+
+class WatchdogSettings(BaseSettings):
+    """Watchdog configuration, read from ``PYN8N_WATCHDOG_*`` environment variables."""
+
+    enabled: bool = False
+    threshold: float = 0.1
+    history: int = 100
+
+    class Config:
+        env_prefix = "PYN8N_WATCHDOG_"
+
+
+class BlockEvent(BaseModel):
+    started: float = Field(..., description="Unix time at which the loop stopped responding.")
+    duration: Optional[float] = Field(None, description="Seconds the loop was blocked; None while still blocked.")
+    route: Optional[str] = Field(None, description="Method and route template of the request that blocked.")
+    endpoint: Optional[str] = Field(None, description="Qualified name of the endpoint (or node) function.")
+    stack: List[str] = Field(default_factory=list, description="Loop thread stack when the block was detected.")
+
+
+class Watchdog:
+    """Detects event-loop stalls longer than ``threshold`` and records who caused them."""
+
+    def __init__(self, threshold: float = 0.1, history: int = 100):
+        self.threshold = threshold
+        self.events: Deque[BlockEvent] = deque(maxlen=history)
+        self.requests: "weakref.WeakKeyDictionary[asyncio.Task, MutableMapping[str, Any]]" = weakref.WeakKeyDictionary()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[int] = None
+        self.beat = time.monotonic()
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.heartbeat_task: Optional[asyncio.Task] = None
+
+    def track(self, scope: MutableMapping[str, Any]) -> None:
+        """Associate the running task with the ASGI ``scope`` it serves."""
+        task = asyncio.current_task()
+        if task is not None:
+            self.requests[task] = scope
+
+    async def heartbeat(self) -> None:
+        interval = self.threshold / 4
+        while True:
+            self.beat = time.monotonic()
+            await asyncio.sleep(interval)
+
+    def start(self) -> None:
+        """Start watching the running event loop; call from inside it."""
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread = threading.get_ident()
+        self.beat = time.monotonic()
+        self.heartbeat_task = self.loop.create_task(self.heartbeat())
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.watch, name="pyn8n-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.heartbeat_task is not None:
+            self.heartbeat_task.cancel()
+        if self.thread is not None:
+            self.thread.join()
+
+    def watch(self) -> None:
+        current: Optional[BlockEvent] = None
+        stalled_since = 0.0
+        while not self.stop_event.wait(self.threshold / 4):
+            now, beat = time.monotonic(), self.beat
+            if current is None and now - beat > self.threshold:
+                stalled_since = beat
+                current = self.capture(time.time() - (now - beat))
+                logger.warning("Event loop blocked for over %.0fms by %s", self.threshold * 1000, current.route or "?")
+            elif current is not None and beat > stalled_since:
+                current.duration = beat - stalled_since
+                logger.warning(
+                    "Event loop was blocked for %.0fms by %s (%s)\n%s",
+                    current.duration * 1000,
+                    current.route or "?",
+                    current.endpoint or "unknown endpoint",
+                    "".join(current.stack),
+                )
+                current = None
+
+    def capture(self, started: float) -> BlockEvent:
+        event = BlockEvent(started=started)
+        frame = sys._current_frames().get(self.loop_thread)
+        if frame is not None:
+            event.stack = traceback.format_stack(frame)
+        task = asyncio.current_task(self.loop)
+        scope = self.requests.get(task) if task is not None else None
+        if scope is not None:
+            route = scope.get("route")
+            event.route = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+            endpoint = scope.get("endpoint")
+            endpoint = getattr(endpoint, "__wrapped__", endpoint)
+            if endpoint is not None:
+                event.endpoint = f"{endpoint.__module__}.{endpoint.__qualname__}"
+        self.events.append(event)
+        return event
+
+
+class WatchdogMiddleware:
+    """ASGI middleware that lets the watchdog attribute stalls to the request being served."""
+
+    def __init__(self, app, watchdog: Watchdog):
+        self.app = app
+        self.watchdog = watchdog
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http":
+            self.watchdog.track(scope)
+        await self.app(scope, receive, send)
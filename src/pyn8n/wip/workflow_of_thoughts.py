@@ -49,12 +49,15 @@ class WorkflowPattern(AgentModel):
 
 
 async def main():
-    wf = await WorkflowPattern.from_prompt(
-        prompt="Create a workflow pattern for parallel processing.",
-        model="groq:llama3-groq-8b-8192-tool-use-preview"
-    )
+    from pyn8n.generation import GenerationService
 
-    print("Workflow pattern created successfully.", wf)
+    prompts = [
+        f"Create a workflow pattern for {pattern}."
+        for pattern in ("parallel processing", "exclusive choice", "multi-instance processing")
+    ]
+    # Cached on disk: rerunning only generates patterns whose prompt changed.
+    for wf in await GenerationService().generate_many(WorkflowPattern, prompts):
+        print("Workflow pattern created successfully.", wf)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,139 @@
+"""
+Generate, validate, repair and upload workflows.
+
+LLM-generated workflows are often structurally wrong (connections to missing
+nodes, no trigger, missing parameters). Instead of discovering that one
+``create_workflow`` 400 at a time, ``WorkflowPipeline`` checks each generated
+workflow in-process with ``pyn8n.validator`` and, when it has errors,
+re-prompts with the workflow and exactly those errors. Only valid workflows
+are uploaded.
+
+Prompts run concurrently and generations go through ``GenerationService``, so
+rerunning a batch reuses every cached generation and repair.
+"""
+import logging
+from typing import Iterable, List, Optional, Set
+
+import httpx
+from pydantic import BaseModel, Field, ValidationError
+
+from pyn8n.canonical import canonical_json
+from pyn8n.concurrency import run_bounded
+from pyn8n.generation import GenerationService
+from pyn8n.models import Workflow
+from pyn8n.n8n_client import N8nClient
+from pyn8n.validator import ValidationIssue, validate_workflow
+
+logger = logging.getLogger(__name__)
+
+# Issues that block an upload whatever their severity: n8n accepts these
+# workflows but silently drops the affected edges.
+BLOCKING_CODES = frozenset({"connection-by-id", "malformed-connection"})
+
+
+class WorkflowOutcome(BaseModel):
+    prompt: str = Field(..., description="The original prompt.")
+    workflow: Optional[Workflow] = Field(None, description="The last generated workflow.")
+    issues: List[ValidationIssue] = Field(default_factory=list, description="Errors left in the last attempt.")
+    attempts: int = Field(0, description="Number of generations made.")
+    uploaded: Optional[Workflow] = Field(None, description="The workflow as created on the server.")
+    error: Optional[str] = Field(None, description="Generation or upload failure.")
+
+    @property
+    def valid(self) -> bool:
+        return self.workflow is not None and not self.issues
+
+
+def workflow_json(workflow: Workflow) -> str:
+    """Canonical JSON, or the workflow as generated when its connections are too malformed to canonicalise."""
+    try:
+        return canonical_json(workflow)
+    except (AttributeError, KeyError, TypeError):
+        return workflow.model_dump_json(exclude_none=True)
+
+
+def repair_prompt(prompt: str, workflow: Optional[Workflow], issues: List[ValidationIssue]) -> str:
+    """The follow-up prompt asking the model to fix ``issues`` in ``workflow``."""
+    problems = "\n".join(
+        f"- {issue.code}{f' (node {issue.node})' if issue.node else ''}: {issue.message}" for issue in issues
+    )
+    previous = f"\n\nYour previous workflow was:\n{workflow_json(workflow)}" if workflow is not None else ""
+    return (
+        f"{prompt}{previous}\n\nIt has these problems:\n{problems}\n\n"
+        "Return the complete corrected workflow. Connections are keyed by node name."
+    )
+
+
+def schema_issues(exc: ValidationError) -> List[ValidationIssue]:
+    return [
+        ValidationIssue(code="schema", message=f"{'.'.join(map(str, error['loc'])) or 'workflow'}: {error['msg']}")
+        for error in exc.errors()
+    ]
+
+
+class WorkflowPipeline:
+    """Turns prompts into valid, uploaded workflows."""
+
+    def __init__(
+        self,
+        client: Optional[N8nClient] = None,
+        generation: Optional[GenerationService] = None,
+        max_attempts: int = 3,
+        concurrency: int = 8,
+        known_credentials: Optional[Set[str]] = None,
+    ):
+        self.client = client
+        self.generation = generation or GenerationService()
+        self.max_attempts = max_attempts
+        self.concurrency = concurrency
+        self.known_credentials = known_credentials
+
+    def check(self, workflow: Workflow) -> List[ValidationIssue]:
+        """
+        Blocking issues only; other warnings do not cost a repair round-trip.
+        A workflow the validator cannot even read is a ``schema`` issue.
+        """
+        try:
+            issues = validate_workflow(workflow, known_credentials=self.known_credentials)
+        except Exception as exc:
+            return [ValidationIssue(code="schema", message=f"workflow could not be validated: {exc!r}")]
+        return [issue for issue in issues if issue.severity == "error" or issue.code in BLOCKING_CODES]
+
+    async def produce(self, prompt: str) -> WorkflowOutcome:
+        """Generate and repair until valid (or out of attempts), then upload when a client is set."""
+        outcome = WorkflowOutcome(prompt=prompt)
+        current = prompt
+        while outcome.attempts < self.max_attempts:
+            outcome.attempts += 1
+            try:
+                outcome.workflow = await self.generation.generate(Workflow, current)
+            except ValidationError as exc:
+                outcome.issues = schema_issues(exc)
+            except Exception as exc:
+                outcome.error = f"generation failed: {exc}"
+                return outcome
+            else:
+                outcome.issues = self.check(outcome.workflow)
+            if not outcome.issues:
+                break
+            logger.debug("Repairing %d issue(s) in workflow for %r", len(outcome.issues), prompt)
+            current = repair_prompt(prompt, outcome.workflow, outcome.issues)
+
+        if outcome.valid and self.client is not None:
+            try:
+                outcome.uploaded = await self.client.create_workflow(outcome.workflow)
+            except httpx.HTTPError as exc:
+                outcome.error = f"upload failed: {exc}"
+        return outcome
+
+    async def run(self, prompts: Iterable[str]) -> List[WorkflowOutcome]:
+        """Outcomes for every prompt, in order."""
+        prompts = list(prompts)
+        outcomes: List[Optional[WorkflowOutcome]] = [None] * len(prompts)
+
+        async def work(item) -> None:
+            index, prompt = item
+            outcomes[index] = await self.produce(prompt)
+
+        await run_bounded(enumerate(prompts), work, self.concurrency)
+        return outcomes  # type: ignore[return-value]
@@ -0,0 +1,19 @@
+"""Shared fixtures: a fresh fake n8n instance and a client served by it."""
+
+import pytest
+
+from pyn8n.bench import fake_client
+from pyn8n.fake_n8n import FakeN8n
+from pyn8n.n8n_client import N8nClient
+
+
+@pytest.fixture
+def n8n_state() -> FakeN8n:
+    """An empty fake n8n instance; tests seed what they need."""
+    return FakeN8n()
+
+
+@pytest.fixture
+def n8n_client(n8n_state: FakeN8n) -> N8nClient:
+    """A client for ``n8n_state`` over an in-process ASGI transport."""
+    return fake_client(n8n_state)
@@ -0,0 +1,90 @@
+"""Test the local execution-analytics store."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+import respx
+
+from pyn8n.analytics import ExecutionStore
+from pyn8n.bench import BASE_URL, fake_client
+from pyn8n.fake_n8n import FakeN8n
+from pyn8n.models import Execution
+from pyn8n.n8n_client import N8nClient
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def execution(execution_id, workflow_id="1", seconds=1.0, status="success", **extra):
+    started = START + timedelta(minutes=int(execution_id))
+    return {
+        "id": str(execution_id),
+        "finished": status == "success",
+        "mode": "trigger",
+        "status": status,
+        "startedAt": started.isoformat(),
+        "stoppedAt": None if status == "running" else (started + timedelta(seconds=seconds)).isoformat(),
+        "workflowId": workflow_id,
+        **extra,
+    }
+
+
+def test_aggregations():
+    store = ExecutionStore()
+    store.add(Execution(**execution(i, seconds=i)) for i in range(1, 101))
+    store.add([Execution(**execution(200, workflow_id="2", status="error"))])
+
+    percentiles = store.duration_percentiles(percentiles=(0.5, 0.95))
+    assert percentiles["1"] == {0.5: pytest.approx(50.0, rel=0.02), 0.95: pytest.approx(95.0, rel=0.02)}
+
+    rates = store.status_rates()
+    assert rates["1"].success_rate == 1.0
+    assert rates["2"].error_rate == 1.0
+
+    assert store.status_rates(since=START + timedelta(hours=2)).keys() == {"2"}
+    assert sum(count for _, count in store.throughput(bucket=timedelta(hours=1))["1"]) == 100
+
+
+def test_ingest_is_incremental():
+    store = ExecutionStore()
+    store.add([Execution(**execution(1, status="running")), Execution(**execution(2))])
+
+    with respx.mock(base_url=BASE_URL) as mock:
+        listing = mock.get("/executions").respond(
+            json={"data": [execution(4), execution(3), execution(2)], "nextCursor": "more"}
+        )
+        mock.get("/executions/1").respond(json=execution(1, seconds=5))
+
+        assert asyncio.run(store.ingest(N8nClient(base_url=BASE_URL))) == 2
+        assert listing.call_count == 1
+
+    assert store.unfinished_ids() == []
+    assert store.duration_percentiles(percentiles=(1.0,))["1"] == {1.0: pytest.approx(5.0, rel=0.02)}
+    assert store.status_rates()["1"].total == 4
+
+
+def test_interrupted_backfill_resumes_below_what_it_stored():
+    state = FakeN8n()
+    state.seed(workflows=2, executions=100)
+    client = fake_client(state)
+    store = ExecutionStore()
+    original, pages = client.get_executions, []
+
+    async def flaky(**params):
+        pages.append(params.get("cursor"))
+        if len(pages) == 3:
+            raise httpx.ConnectError("connection lost")
+        return await original(**params)
+
+    client.get_executions = flaky
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(store.ingest(client, page_size=20))
+    assert store.count() == 40
+
+    for _ in range(5):
+        state.add_execution("1")
+    client.get_executions = original
+    assert asyncio.run(store.ingest(client, page_size=20)) == 65
+    assert store.count() == 105
+    assert asyncio.run(store.ingest(client, page_size=20)) == 0
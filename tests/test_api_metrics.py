@@ -0,0 +1,44 @@
+"""Test the REST API metrics middleware and /metrics endpoint."""
+
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+
+from pyn8n.api import app
+from pyn8n.api_metrics import ApiMetrics, monitor_loop_lag
+from pyn8n.metrics import MetricsRegistry
+
+client = TestClient(app)
+
+
+def test_metrics_labels_requests_by_node_route():
+    assert client.post("/nodes/compute_factorial", json={"number": 5}).status_code == 200
+    assert client.post("/nodes/compute_factorial", json={"number": -1}).status_code == 422
+    client.get("/does-not-exist")
+
+    text = client.get("/metrics").text
+
+    assert 'pyn8n_http_requests_total{route="/nodes/compute_factorial",method="POST",status="200"}' in text
+    assert 'pyn8n_http_requests_total{route="/nodes/compute_factorial",method="POST",status="422"}' in text
+    assert 'pyn8n_http_requests_total{route="unmatched",method="GET",status="404"}' in text
+    assert 'pyn8n_node_handler_seconds_count{node="compute_factorial"}' in text
+    assert 'pyn8n_node_validation_seconds_count{node="compute_factorial"}' in text
+    assert "pyn8n_http_requests_in_flight 1.0" in text  # the /metrics request itself
+
+
+def test_loop_lag_monitor_records_blocking():
+    api_metrics = ApiMetrics(MetricsRegistry())
+
+    async def run():
+        monitor = asyncio.create_task(monitor_loop_lag(0.01, api_metrics))
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # block the loop
+        await asyncio.sleep(0.03)
+        monitor.cancel()
+
+    asyncio.run(run())
+
+    lag = api_metrics.loop_lag_histogram.labels()
+    assert lag.count >= 2
+    assert lag.quantile(1.0) >= 0.05
@@ -0,0 +1,62 @@
+"""Tests for the client benchmark suite and its baseline comparison."""
+import asyncio
+import json
+
+from pyn8n.bench import BenchResult, compare, make_workflow, run_benchmarks, summarize, write_results
+
+
+def result(name: str, p50_ms: float, ops_per_second: float) -> BenchResult:
+    return BenchResult(
+        name=name, operations=10, seconds=1.0, ops_per_second=ops_per_second, p50_ms=p50_ms, p95_ms=p50_ms, p99_ms=p50_ms
+    )
+
+
+def test_summarize_percentiles():
+    summary = summarize("op", [i / 1000 for i in range(1, 101)], seconds=2.0)
+
+    assert summary.operations == 100
+    assert summary.ops_per_second == 50
+    assert summary.p50_ms == 51
+    assert summary.p99_ms == 100
+
+
+def test_make_workflow_chains_nodes():
+    workflow = make_workflow(100)
+
+    assert len(workflow.nodes) == 100
+    assert len(workflow.connections) == 99
+    assert workflow.connections["Node 98"]["main"][0][0]["node"] == "Node 99"
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"results": {"a": {"p50_ms": 10.0, "ops_per_second": 100.0}, "b": {"p50_ms": 10.0, "ops_per_second": 100.0}}}
+    current = [result("a", 11.0, 95.0), result("b", 13.0, 70.0), result("new", 1.0, 1.0)]
+
+    regressions = compare(current, baseline, tolerance=0.2)
+
+    assert len(regressions) == 2
+    assert all(regression.startswith("b:") for regression in regressions)
+
+
+def test_run_benchmarks_and_write_results(tmp_path):
+    results = asyncio.run(run_benchmarks(iterations=10, workflows=20))
+    path = tmp_path / "bench.json"
+    write_results(results, path)
+
+    baseline = json.loads(path.read_text())
+    assert set(baseline["results"]) == {result.name for result in results}
+    assert {"get_workflows[limit=100]", "create_workflow[nodes=1000]", "get_workflow[concurrency=64]"} <= set(
+        baseline["results"]
+    )
+    by_name = {result.name: result for result in results}
+    assert by_name["get_workflows[limit=10]"].operations == 10
+    assert by_name["create_workflow[nodes=1000]"].operations == 5
+    for result in results:
+        assert result.ops_per_second > 0 and 0 < result.p50_ms <= result.p95_ms <= result.p99_ms
+
+    # A baseline twice as fast as this run flags every scenario; one twice as slow flags none.
+    faster = {"results": {r.name: {"p50_ms": r.p50_ms / 2, "ops_per_second": r.ops_per_second * 2} for r in results}}
+    slower = {"results": {r.name: {"p50_ms": r.p50_ms * 2, "ops_per_second": r.ops_per_second / 2} for r in results}}
+    flagged = {regression.split(":")[0] for regression in compare(results, faster)}
+    assert flagged == set(by_name)
+    assert compare(results, slower) == []
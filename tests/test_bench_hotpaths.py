@@ -0,0 +1,64 @@
+"""pytest-benchmark versions of the client and builder hot paths; skipped when pytest-benchmark is absent."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pyn8n.bench import fake_client, make_workflow  # noqa: E402
+from pyn8n.builder import WorkflowBuilder  # noqa: E402
+from pyn8n.fake_n8n import FakeN8n  # noqa: E402
+from pyn8n.models import Workflow  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    state = FakeN8n()
+    state.seed(workflows=300, nodes_per_workflow=10)
+    loop = asyncio.new_event_loop()
+    client = fake_client(state)
+    yield loop, client
+    loop.run_until_complete(client.shutdown())
+    loop.close()
+
+
+@pytest.mark.parametrize("page_size", [10, 100, 250])
+def test_get_workflows(benchmark, client, page_size):
+    loop, client = client
+    page = benchmark(lambda: loop.run_until_complete(client.get_workflows(limit=page_size)))
+    assert len(page.data) == page_size
+
+
+@pytest.mark.parametrize("node_count", [10, 100, 1000])
+def test_create_workflow(benchmark, client, node_count):
+    loop, client = client
+    workflow = make_workflow(node_count)
+    created = benchmark(lambda: loop.run_until_complete(client.create_workflow(workflow)))
+    assert len(created.nodes) == node_count
+
+
+def test_get_workflow_fan_out(benchmark, client):
+    loop, client = client
+
+    async def fan_out():
+        return await asyncio.gather(*(client.get_workflow(str(i)) for i in range(1, 65)))
+
+    assert len(benchmark(lambda: loop.run_until_complete(fan_out()))) == 64
+
+
+@pytest.mark.parametrize("node_count", [10, 100, 1000])
+def test_parse_workflow(benchmark, node_count):
+    payload = make_workflow(node_count).model_dump()
+    assert len(benchmark(Workflow.model_validate, payload).nodes) == node_count
+
+
+@pytest.mark.benchmark(group="builder")
+def test_build_ten_thousand_nodes(benchmark):
+    wf = WorkflowBuilder("Large")
+    handle = wf.add("n8n-nodes-base.manualTrigger")
+    for index in range(9_999):
+        handle = handle.then("n8n-nodes-base.set", parameters={"value": index})
+    workflow = benchmark(wf.build)
+
+    assert len(workflow.nodes) == 10_000
+    assert len({node.id for node in workflow.nodes}) == 10_000
@@ -0,0 +1,60 @@
+"""Test the fluent workflow builder."""
+
+import pytest
+
+from pyn8n.builder import WorkflowBuildError, WorkflowBuilder
+from pyn8n.models import WorkflowNode
+
+
+def test_branch_and_merge_produce_n8n_connections():
+    wf = WorkflowBuilder("Branching")
+    check = wf.add("n8n-nodes-base.manualTrigger").then("n8n-nodes-base.if")
+    yes, no = check.branch("n8n-nodes-base.set", "n8n-nodes-base.set")
+    merged = wf.merge(yes, no).then("n8n-nodes-base.noOp")
+    workflow = wf.build()
+
+    assert [node.name for node in workflow.nodes] == ["ManualTrigger", "If", "Set", "Set1", "Merge", "NoOp"]
+    assert workflow.connections["If"]["main"] == [
+        [{"node": "Set", "type": "main", "index": 0}],
+        [{"node": "Set1", "type": "main", "index": 0}],
+    ]
+    assert workflow.connections["Set1"]["main"] == [[{"node": "Merge", "type": "main", "index": 1}]]
+    assert merged.name == "NoOp"
+
+    positions = {node.name: node.position for node in workflow.nodes}
+    assert positions["ManualTrigger"][0] < positions["If"][0] < positions["Set"][0] == positions["Set1"][0]
+    assert positions["Set"][1] != positions["Set1"][1]
+    assert positions["Merge"][0] < positions["NoOp"][0]
+    assert len({node.id for node in workflow.nodes}) == 6
+
+
+def test_explicit_nodes_and_positions_are_kept():
+    webhook = WorkflowNode(name="Hook", type="n8n-nodes-base.webhook", typeVersion=2, position=[40, 40])
+    wf = WorkflowBuilder("Explicit")
+    wf.add(webhook).then("n8n-nodes-base.set", name="Store", position=[400, 40])
+    workflow = wf.build()
+
+    assert [node.position for node in workflow.nodes] == [[40, 40], [400, 40]]
+    assert workflow.nodes[0].typeVersion == 2
+
+
+def test_invalid_graphs_are_rejected():
+    wf = WorkflowBuilder("Broken")
+    wf.add("n8n-nodes-base.set", name="A")
+    with pytest.raises(WorkflowBuildError, match="duplicate node name"):
+        wf.add("n8n-nodes-base.set", name="A")
+
+    wf.connect("A", "Missing")
+    with pytest.raises(WorkflowBuildError, match="unknown node: Missing"):
+        wf.build()
+    with pytest.raises(WorkflowBuildError):
+        WorkflowBuilder("Empty").build()
+
+
+def test_cycles_are_laid_out():
+    wf = WorkflowBuilder("Loop")
+    start = wf.add("n8n-nodes-base.manualTrigger")
+    loop = start.then("n8n-nodes-base.splitInBatches")
+    loop.then("n8n-nodes-base.set").then(loop)
+
+    assert len(wf.build().nodes) == 3
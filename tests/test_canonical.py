@@ -0,0 +1,70 @@
+"""Test workflow canonicalisation, hashing and diffing."""
+
+from pyn8n.builder import WorkflowBuilder
+from pyn8n.canonical import canonical, diff_workflows, invalidate, same_workflow, workflow_hash
+from pyn8n.models import Workflow
+
+
+def sample() -> Workflow:
+    wf = WorkflowBuilder("Sample")
+    check = wf.add("n8n-nodes-base.manualTrigger").then("n8n-nodes-base.if", parameters={"value": 1})
+    check.branch("n8n-nodes-base.set", "n8n-nodes-base.noOp")
+    return wf.build()
+
+
+def server_copy(workflow: Workflow) -> Workflow:
+    """What the API returns: ids, timestamps, reordered nodes and explicit defaults."""
+    data = workflow.model_dump()
+    data["id"] = "42"
+    data["createdAt"] = "2024-01-01T00:00:00Z"
+    data["nodes"] = list(reversed(data["nodes"]))
+    data["connections"]["Set"] = {"main": [[]]}
+    return Workflow(**data)
+
+
+def test_read_only_fields_and_ordering_are_ignored():
+    local = sample()
+    remote = server_copy(local)
+
+    assert canonical(local) == canonical(remote)
+    assert same_workflow(local, remote)
+    assert not diff_workflows(local, remote)
+
+
+def test_hash_is_cached_until_invalidated():
+    workflow = sample()
+    first = workflow_hash(workflow)
+    workflow.nodes[1].parameters["value"] = 2
+
+    assert workflow_hash(workflow) == first
+    invalidate(workflow)
+    assert workflow_hash(workflow) != first
+
+
+def test_diff_reports_minimal_changes():
+    old = sample()
+    new = server_copy(old)
+    new.nodes = [node for node in new.nodes if node.name != "NoOp"]
+    new.connections["If"]["main"] = new.connections["If"]["main"][:1]
+    next(node for node in new.nodes if node.name == "If").parameters["value"] = 2
+    new.name = "Renamed sample"
+
+    changes = [(change.op, change.path, change.old, change.new) for change in diff_workflows(old, new)]
+
+    assert ("change", "name", "Sample", "Renamed sample") in changes
+    assert ("change", "nodes.If.parameters.value", 1, 2) in changes
+    assert ("remove", "connections", ["If", "main", 1, "NoOp", 0], None) in changes
+    assert [change[:2] for change in changes if change[1].startswith("nodes.NoOp")] == [("remove", "nodes.NoOp")]
+    assert len(changes) == 4
+
+
+def test_renamed_node_is_matched_by_id():
+    old = sample()
+    new = old.model_copy(deep=True)
+    node = next(node for node in new.nodes if node.name == "Set")
+    node.name = "Store"
+    new.connections["If"]["main"][0][0]["node"] = "Store"
+
+    changes = [(change.op, change.path) for change in diff_workflows(old, new)]
+
+    assert changes == [("rename", "nodes.Set")]
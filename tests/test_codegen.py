@@ -0,0 +1,65 @@
+"""Test template rendering, the bytecode cache and change-only batch writes."""
+
+from pyn8n.codegen import RenderJob, environment, render, render_batch
+from pyn8n.node_renderer import (
+    FieldTemplate,
+    FunctionDataTemplate,
+    InputModelTemplate,
+    OutputModelTemplate,
+    node_context,
+    render_node,
+)
+
+
+def node(index: int, factor: int = 2):
+    return (
+        InputModelTemplate(name=f"Node{index}", fields=[FieldTemplate(name="value", type="int", description="Input")]),
+        OutputModelTemplate(name=f"Node{index}Output", fields=[FieldTemplate(name="result", type="int", description="Output")]),
+        FunctionDataTemplate(
+            function_name=f"node_{index}",
+            function_description=f"Node number {index}.",
+            implementation=f"result = body.value * {factor}",
+            return_fields="result=result",
+        ),
+    )
+
+
+def test_rendered_node_is_valid_python(tmp_path):
+    source = render_node(*node(1), import_list=["import math"], env=environment(str(tmp_path)))
+    compile(source, "node_1.py", "exec")
+    assert "import math" in source
+    assert "def node_1(body: Node1Input) -> Node1Output:" in source
+
+
+def test_templates_do_not_depend_on_the_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert "def node_1(" in render("node.j2", environment(None), **node_context(*node(1)))
+
+
+def test_batch_writes_only_changed_outputs(tmp_path):
+    cache = tmp_path / "cache"
+    jobs = [
+        RenderJob(template="node.j2", context=node_context(*node(index)), path=tmp_path / "nodes" / f"node_{index}.py")
+        for index in range(6)
+    ]
+
+    first = render_batch(jobs, workers=2, bytecode_cache=cache)
+    assert [result.path for result in first] == [job.path for job in jobs]
+    assert all(result.written for result in first)
+    assert list(cache.iterdir()), "compiled templates are cached on disk"
+
+    mtime = jobs[0].path.stat().st_mtime_ns
+    jobs[3] = RenderJob(template="node.j2", context=node_context(*node(3, factor=3)), path=jobs[3].path)
+    second = render_batch(jobs, workers=2, bytecode_cache=cache)
+    assert [result.written for result in second] == [False, False, False, True, False, False]
+    assert jobs[0].path.stat().st_mtime_ns == mtime
+    assert "body.value * 3" in jobs[3].path.read_text()
+    assert first[0].sha256 == second[0].sha256 != second[3].sha256
+
+
+def test_job_from_model(tmp_path):
+    data = node(2)[2]
+    job = RenderJob.from_model("node.j2", data, tmp_path / "node.py", **node_context(*node(2)))
+    assert job.context["function_name"] == "node_2"
+    [result] = render_batch([job], bytecode_cache=tmp_path / "cache")
+    assert result.written and "def node_2(" in job.path.read_text()
@@ -0,0 +1,77 @@
+"""Test the credential schema cache, local validation and bulk provisioning."""
+
+import asyncio
+
+from pyn8n.credentials import (
+    CredentialSchemaCache,
+    CredentialSettings,
+    CredentialSpec,
+    provision_credentials,
+    resolve_secrets,
+    schema_errors,
+)
+
+GROQ = {
+    "additionalProperties": False,
+    "type": "object",
+    "properties": {"apiKey": {"type": "string"}},
+    "required": ["apiKey"],
+}
+
+HTTP_AUTH = {
+    "type": "object",
+    "properties": {"auth": {"type": "string", "enum": ["basic", "token"]}, "user": {"type": "string"}, "token": {"type": "string"}},
+    "required": ["auth"],
+    "allOf": [{"if": {"properties": {"auth": {"enum": ["token"]}}}, "then": {"required": ["token"]}, "else": {"required": ["user"]}}],
+}
+
+
+def test_schema_errors():
+    assert schema_errors(GROQ, {"apiKey": "k"}) == []
+    assert schema_errors(GROQ, {}) == ["data is missing required property 'apiKey'"]
+    assert schema_errors(GROQ, {"apiKey": 1, "other": True}) == ["data.apiKey must be string", "data has unknown property 'other'"]
+    assert schema_errors(HTTP_AUTH, {"auth": "token", "token": "t"}) == []
+    assert schema_errors(HTTP_AUTH, {"auth": "token"}) == ["data is missing required property 'token'"]
+    assert schema_errors(HTTP_AUTH, {"auth": "basic"}) == ["data is missing required property 'user'"]
+    assert schema_errors(HTTP_AUTH, {"auth": "oauth", "user": "u"}) == ["data.auth must be one of ['basic', 'token']"]
+
+
+def test_secrets_come_from_env_and_files(tmp_path):
+    secret = tmp_path / "token"
+    secret.write_text("from-file\n")
+    data = {"apiKey": {"env": "KEY"}, "nested": {"token": {"file": str(secret)}}, "plain": "x"}
+    assert resolve_secrets(data, {"KEY": "from-env"}) == {"apiKey": "from-env", "nested": {"token": "from-file"}, "plain": "x"}
+
+
+def test_provision_validates_locally_and_creates_concurrently(n8n_state, n8n_client, tmp_path):
+    n8n_state.credential_schemas.update(groqApi=GROQ, httpAuth=HTTP_AUTH)
+    settings = CredentialSettings(schema_cache=tmp_path / "schemas.json")
+    specs = [CredentialSpec(name=f"groq {index}", type="groqApi", data={"apiKey": {"env": "GROQ_KEY"}}) for index in range(20)]
+    specs += [
+        CredentialSpec(name="typo", type="groqApi", data={"apikey": "x"}),
+        CredentialSpec(name="no secret", type="groqApi", data={"apiKey": {"env": "MISSING"}}),
+        CredentialSpec(name="token", type="httpAuth", data={"auth": "token", "token": {"env": "GROQ_KEY"}}),
+        CredentialSpec(name="unknown type", type="nope", data={}),
+    ]
+
+    schemas = CredentialSchemaCache(n8n_client, settings)
+    report = asyncio.run(provision_credentials(n8n_client, specs, schemas, concurrency=6, environ={"GROQ_KEY": "secret"}))
+
+    assert report.created == 21
+    assert [(result.name, result.status) for result in report.failed] == [
+        ("typo", "invalid"),
+        ("no secret", "invalid"),
+        ("unknown type", "failed"),
+    ]
+    assert report.failed[0].errors[0] == "data is missing required property 'apiKey'"
+    assert len(n8n_state.credentials.items) == 21
+    assert all(item["data"] == {"apiKey": "secret"} for item in list(n8n_state.credentials.items.values())[:20])
+    assert schemas.fetched == 2, "one schema request per known type"
+
+    # A new process reuses the schemas from disk.
+    cached = CredentialSchemaCache(n8n_client, settings)
+    asyncio.run(cached.get("groqApi"))
+    assert cached.fetched == 0
+    stale = CredentialSchemaCache(n8n_client, CredentialSettings(schema_cache=settings.schema_cache, schema_max_age=0))
+    asyncio.run(stale.get("groqApi"))
+    assert stale.fetched == 1
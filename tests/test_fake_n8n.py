@@ -0,0 +1,83 @@
+"""Test the in-memory n8n API stand-in."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from pyn8n.bench import fake_client
+from pyn8n.fake_n8n import FakeN8n, Throttle, create_app
+from pyn8n.models import Tag, Workflow
+from pyn8n.n8n_client import paginate
+
+
+def test_workflow_and_tag_round_trip(n8n_state, n8n_client):
+    async def scenario():
+        tag = await n8n_client.create_tag(Tag(name="billing"))
+        with pytest.raises(httpx.HTTPStatusError) as conflict:
+            await n8n_client.create_tag(Tag(name="billing"))
+        assert conflict.value.response.status_code == 409
+
+        workflow = await n8n_client.create_workflow(Workflow(name="wf", nodes=[], connections={}, settings={}))
+        await n8n_client.update_workflow_tags(workflow.id, [{"id": tag.id}])
+        await n8n_client.activate_workflow(workflow.id)
+        return await n8n_client.get_workflow(workflow.id)
+
+    workflow = asyncio.run(scenario())
+    assert workflow.tags[0].name == "billing"
+    assert n8n_state.workflows.get(workflow.id)["active"] is True
+
+
+def test_execution_pagination_survives_deletes(n8n_state, n8n_client):
+    n8n_state.seed(workflows=2, executions=25)
+
+    async def drain():
+        ids = []
+        async for execution in paginate(n8n_client.get_executions, limit=10):
+            ids.append(int(execution.id))
+            await n8n_client.delete_execution(execution.id)
+        return ids
+
+    ids = asyncio.run(drain())
+    assert ids == sorted(ids, reverse=True)
+    assert len(ids) == 25
+    assert n8n_state.executions.items == {}
+
+
+def test_offset_pagination_shifts_when_items_disappear(n8n_state, n8n_client):
+    n8n_state.seed(workflows=25)
+
+    async def drain():
+        seen = []
+        async for workflow in paginate(n8n_client.get_workflows, limit=10):
+            seen.append(workflow.id)
+            await n8n_client.delete_workflow(workflow.id)
+        return seen
+
+    seen = asyncio.run(drain())
+    assert len(seen) < 25, "like n8n, deleting while paging by offset skips items"
+    assert len(n8n_state.workflows.items) == 25 - len(seen)
+
+
+def test_fault_injection():
+    state = FakeN8n()
+    client = fake_client(state, app=create_app(state, rate_limit=2, api_key="secret"))
+
+    async def hammer():
+        return [await client.client.get("/tags", headers={"X-N8N-API-KEY": "secret"}) for _ in range(4)]
+
+    statuses = [response.status_code for response in asyncio.run(hammer())]
+    assert statuses[:2] == [200, 200]
+    assert 429 in statuses
+
+    failing = fake_client(state, app=create_app(state, error_rate=1.0))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(failing.get_tags())
+
+
+def test_throttle_below_one_request_per_second_still_admits_requests():
+    throttle = Throttle(0.5)
+    assert throttle.allow()
+    assert not throttle.allow()
+    throttle.updated -= 2
+    assert throttle.allow()
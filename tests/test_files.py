@@ -0,0 +1,22 @@
+"""Test the shared file helpers."""
+
+import pytest
+
+from pyn8n.files import atomic_write
+
+
+def test_atomic_write_replaces_and_leaves_no_temporary(tmp_path):
+    path = tmp_path / "cache" / "entry.json"
+    atomic_write(path, "old")
+    atomic_write(path, b"new")
+    assert path.read_text() == "new"
+    assert [child.name for child in path.parent.iterdir()] == ["entry.json"]
+
+
+def test_failed_atomic_write_keeps_the_old_content(tmp_path):
+    path = tmp_path / "entry.json"
+    atomic_write(path, "old")
+    with pytest.raises(TypeError):
+        atomic_write(path, ["not", "data"])
+    assert path.read_text() == "old"
+    assert [child.name for child in tmp_path.iterdir()] == ["entry.json"]
@@ -0,0 +1,89 @@
+"""Test the cached, deduplicating generation service."""
+
+import asyncio
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from pyn8n.generation import GenerationService, GenerationSettings
+
+
+class Pattern(BaseModel):
+    name: str
+
+
+class PatternV2(BaseModel):
+    name: str
+    category: str = "control"
+
+
+class FakeModel:
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, cls, prompt, model):
+        self.prompts.append((cls.__name__, prompt, model))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if prompt == "fail":
+                raise RuntimeError("model error")
+            return cls(name=f"{model}:{prompt}")
+        finally:
+            self.active -= 1
+
+
+def service(tmp_path, llm, **settings):
+    return GenerationService(GenerationSettings(cache_dir=tmp_path, model="test", **settings), generate=llm)
+
+
+def test_only_changed_prompts_are_regenerated(tmp_path):
+    llm = FakeModel()
+    prompts = [f"pattern {index}" for index in range(20)]
+
+    first = asyncio.run(service(tmp_path, llm, concurrency=4).generate_many(Pattern, prompts))
+    assert [item.name for item in first] == [f"test:{prompt}" for prompt in prompts]
+    assert llm.peak == 4
+
+    prompts[3] = "pattern changed"
+    again = service(tmp_path, llm)
+    second = asyncio.run(again.generate_many(Pattern, prompts))
+    assert second[0] == first[0] and second[3].name == "test:pattern changed"
+    assert (again.calls, again.hits) == (1, 19)
+
+    asyncio.run(again.generate(PatternV2, prompts[0]))
+    asyncio.run(again.generate(Pattern, prompts[0], model="other"))
+    assert again.calls == 3, "schema and model are part of the cache key"
+
+
+def test_identical_prompts_in_flight_are_generated_once(tmp_path):
+    llm = FakeModel(delay=0.05)
+    results = asyncio.run(service(tmp_path, llm).generate_many(Pattern, ["same"] * 10))
+    assert len(llm.prompts) == 1
+    assert {item.name for item in results} == {"test:same"}
+
+
+def test_failures_are_not_cached(tmp_path):
+    llm = FakeModel()
+    gen = service(tmp_path, llm)
+    results = asyncio.run(gen.generate_many(Pattern, ["fail", "fail", "ok"], return_exceptions=True))
+    assert isinstance(results[0], RuntimeError) and isinstance(results[1], RuntimeError)
+    assert results[2].name == "test:ok"
+    with pytest.raises(RuntimeError):
+        asyncio.run(gen.generate(Pattern, "fail"))
+    assert len(llm.prompts) == 3
+
+
+def test_rate_limit_per_model(tmp_path):
+    llm = FakeModel(delay=0)
+    gen = service(tmp_path, llm, rate_limits={"test": 20.0})
+    gen.limiter("test").capacity = gen.limiter("test").tokens = 1
+    started = time.monotonic()
+    asyncio.run(gen.generate_many(Pattern, [f"p{index}" for index in range(5)]))
+    assert time.monotonic() - started >= 0.15
+    assert gen.limiter("unlimited") is None
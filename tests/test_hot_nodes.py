@@ -0,0 +1,83 @@
+"""Test deploying generated nodes into a running API."""
+
+import sys
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pyn8n.hot_nodes import CodeCache, HotNodeSettings, NodeDeployer
+from pyn8n.n8n_decorator import n8n_nodes_registry
+from pyn8n.node_renderer import FieldTemplate, FunctionDataTemplate, InputModelTemplate, OutputModelTemplate, render_node
+
+MODULE = "generated_hot_nodes.scale"
+
+
+def scale_node(factor: int, name: str = "hot_scale"):
+    return (
+        InputModelTemplate(name="Scale", fields=[FieldTemplate(name="value", type="int", description="Input")]),
+        OutputModelTemplate(name="ScaleOutput", fields=[FieldTemplate(name="result", type="int", description="Output")]),
+        FunctionDataTemplate(
+            function_name=name,
+            function_description=f"Multiply by {factor}.",
+            implementation=f"result = body.value * {factor}",
+            return_fields="result=result",
+        ),
+    )
+
+
+@pytest.fixture
+def deployer(tmp_path):
+    app = FastAPI()
+    yield NodeDeployer(app, HotNodeSettings(bytecode_cache=tmp_path / "code"))
+    for name in [name for name, node in n8n_nodes_registry.items() if node["function"].__module__ == MODULE]:
+        del n8n_nodes_registry[name]
+    sys.modules.pop(MODULE, None)
+
+
+def test_deploy_replace_and_remove(deployer):
+    client = TestClient(deployer.app)
+    assert client.post("/nodes/hot_scale", json={"value": 2}).status_code == 404
+
+    (spec,) = deployer.render_and_deploy(MODULE, *scale_node(2))
+    assert spec.name == "hot_scale" and spec.description == "Multiply by 2."
+    assert client.post("/nodes/hot_scale", json={"value": 2}).json() == {"result": 4}
+    assert client.post("/nodes/hot_scale", json={"wrong": 2}).status_code == 422
+
+    running = n8n_nodes_registry["hot_scale"]
+    deployer.render_and_deploy(MODULE, *scale_node(3))
+    assert client.post("/nodes/hot_scale", json={"value": 2}).json() == {"result": 6}
+    assert running["function"](running["input_model"](value=2)).result == 4, "in-flight calls keep their version"
+    assert len([route for route in deployer.app.routes if route.path == "/nodes/hot_scale"]) == 1
+
+    deployer.render_and_deploy(MODULE, *scale_node(5, name="hot_scale_v2"))
+    assert client.post("/nodes/hot_scale", json={"value": 2}).status_code == 404
+    assert client.post("/nodes/hot_scale_v2", json={"value": 2}).json() == {"result": 10}
+    assert "/nodes/hot_scale_v2" in client.get("/openapi.json").json()["paths"]
+
+    assert deployer.remove(MODULE) == ["hot_scale_v2"]
+    assert client.post("/nodes/hot_scale_v2", json={"value": 2}).status_code == 404
+
+
+def test_failed_deploy_keeps_previous_version(deployer):
+    client = TestClient(deployer.app)
+    deployer.render_and_deploy(MODULE, *scale_node(2))
+
+    broken = render_node(*scale_node(3)) + "\nraise RuntimeError('boom')\n"
+    with pytest.raises(RuntimeError):
+        deployer.deploy(MODULE, broken)
+    with pytest.raises(SyntaxError):
+        deployer.deploy(MODULE, "def (")
+    assert client.post("/nodes/hot_scale", json={"value": 2}).json() == {"result": 4}
+
+
+def test_compiled_code_is_cached_on_disk(tmp_path, monkeypatch):
+    source = render_node(*scale_node(2))
+    first = CodeCache(tmp_path).compile(source, "<node>")
+    assert len(list(tmp_path.glob("*.pyc"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("compiled again")
+
+    monkeypatch.setattr("builtins.compile", fail)
+    assert CodeCache(tmp_path).compile(source, "<node>") == first
@@ -0,0 +1,63 @@
+"""Test the queued, structured logging setup."""
+
+import io
+import json
+import logging
+
+import pytest
+
+from pyn8n.log import LoggingSettings, configure_logging, flush_logging
+
+
+@pytest.fixture
+def configure():
+    stream = io.StringIO()
+
+    def install(**settings):
+        handler = configure_logging(LoggingSettings(**settings), stream=stream)
+        return handler, stream
+
+    yield install
+    flush_logging()
+    logging.getLogger().handlers.clear()
+
+
+def lines(stream):
+    flush_logging()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_are_written_as_json_with_extras(configure):
+    _, stream = configure()
+    logger = logging.getLogger("pyn8n.test_log")
+
+    logger.info("hello %s", "world", extra={"node": "factorial"})
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("boom")
+
+    hello, boom = lines(stream)
+    assert hello["message"] == "hello world" and hello["node"] == "factorial" and hello["level"] == "INFO"
+    assert boom["level"] == "ERROR" and "ZeroDivisionError" in boom["exception"]
+
+
+def test_sampling_and_module_levels(configure):
+    _, stream = configure(sample_rate=0.0, levels={"pyn8n.noisy": "ERROR"})
+
+    logging.getLogger("pyn8n.requests").info("per request", extra={"sample": True})
+    logging.getLogger("pyn8n.noisy").warning("suppressed")
+    logging.getLogger("pyn8n.requests").info("kept")
+
+    assert [line["message"] for line in lines(stream)] == ["kept"]
+    logging.getLogger("pyn8n.noisy").setLevel(logging.NOTSET)
+
+
+def test_full_queue_drops_instead_of_blocking(configure):
+    handler, _ = configure(queue_size=1)
+    flush_logging()  # stop the writer so the queue cannot drain
+
+    for index in range(5):
+        logging.getLogger("pyn8n.test_log").warning("record %d", index)
+
+    assert handler.dropped == 4
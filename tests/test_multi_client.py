@@ -0,0 +1,91 @@
+"""Test routing, fan-out and read failover across several fake n8n instances."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from pyn8n.fake_n8n import FakeN8n, create_app
+from pyn8n.models import Tag
+from pyn8n.multi_client import FleetSettings, InstanceConfig, MultiN8nClient
+
+
+def fleet(down=(), **options):
+    eu, us = FakeN8n(), FakeN8n()
+    eu.seed(workflows=3, executions=300)
+    us.seed(workflows=2, executions=120)
+    states = {"eu": eu, "us": us, "eu-standby": eu}
+    instances = [
+        InstanceConfig(name="eu", base_url="http://eu/api/v1", tenants=["acme"], fallbacks=["eu-standby"], default=True),
+        InstanceConfig(name="us", base_url="http://us/api/v1", tenants=["globex"], projects=["p-us"]),
+        InstanceConfig(name="eu-standby", base_url="http://eu-standby/api/v1"),
+    ]
+    transports = {
+        name: httpx.ASGITransport(app=create_app(state, error_rate=1.0 if name in down else 0.0))
+        for name, state in states.items()
+    }
+    return states, MultiN8nClient(instances, transports=transports, **options)
+
+
+def test_routing():
+    _, client = fleet()
+    assert client.route(tenant="acme") == "eu"
+    assert client.route(tenant="globex") == "us"
+    assert client.route(tenant="acme", project="p-us") == "us"
+    assert client.route(tenant="unknown") == "eu"
+    with pytest.raises(KeyError):
+        client.route(instance="mars")
+
+    async def run():
+        await client.call("create_tag", Tag(name="routed"), tenant="globex")
+        return await client.call("get_tags", tenant="globex")
+
+    assert [tag.name for tag in asyncio.run(run()).data] == ["routed"]
+
+
+def test_fan_out_merges_paginated_results():
+    states, client = fleet()
+
+    async def run():
+        errors = {}
+        items = await client.collect("get_executions", limit=50, instances=["eu", "us"], errors=errors)
+        counts = await client.fan_out("get_workflows", instances=["eu", "us"])
+        await client.shutdown()
+        return items, errors, counts
+
+    items, errors, counts = asyncio.run(run())
+    assert not errors
+    assert len(items) == 420
+    assert {name for name, _ in items} == {"eu", "us"}
+    assert len({execution.id for name, execution in items if name == "eu"}) == 300
+    assert {name: len(result.data) for name, result in counts.items()} == {"eu": 3, "us": 2}
+
+
+def test_reads_fail_over_and_fleet_calls_report_down_instances():
+    _, client = fleet(down={"eu"}, failure_threshold=1, cooldown=60)
+
+    async def run():
+        workflows = await client.call("get_workflows", tenant="acme")
+        assert not client.healthy("eu")
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.call("create_tag", Tag(name="x"), tenant="acme")
+        errors = {}
+        items = await client.collect("get_workflows", errors=errors)
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.collect("get_workflows", instances=["eu"])
+        return workflows, errors, items
+
+    workflows, errors, items = asyncio.run(run())
+    assert len(workflows.data) == 3, "served by the standby replica"
+    assert set(errors) == {"eu"}
+    assert sorted({name for name, _ in items}) == ["eu-standby", "us"]
+
+
+def test_instances_from_settings(monkeypatch):
+    monkeypatch.setenv(
+        "PYN8N_FLEET_INSTANCES",
+        '[{"name": "a", "base_url": "http://a/api/v1", "tenants": ["t"]}, {"name": "b", "base_url": "http://b/api/v1"}]',
+    )
+    client = MultiN8nClient.from_settings(FleetSettings(cooldown=5))
+    assert client.route(tenant="t") == "a" and client.cooldown == 5
+    assert client.clients["b"].base_url == "http://b/api/v1"
@@ -0,0 +1,99 @@
+"""Test node discovery, the registry snapshot and lazy node loading."""
+
+import sys
+import textwrap
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from pyn8n.n8n_decorator import n8n_nodes_registry
+from pyn8n.node_registry import add_node_schemas, discover, register_routes, scan_directory
+
+NODE_MODULE = '''
+from pydantic import BaseModel
+from pyn8n.n8n_decorator import n8n_node
+
+class Options(BaseModel):
+    shout: bool = True
+
+class EchoInput(BaseModel):
+    text: str
+    options: Options = Options()
+
+class EchoOutput(BaseModel):
+    text: str
+
+@n8n_node(node_name="{name}", input_model=EchoInput, output_model=EchoOutput)
+def echo(body: EchoInput) -> EchoOutput:
+    """Echo the text back."""
+    return EchoOutput(text=body.text.upper())
+'''
+
+
+@pytest.fixture
+def node_package(tmp_path, monkeypatch):
+    package = tmp_path / "lazy_nodes_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "echo_nodes.py").write_text(textwrap.dedent(NODE_MODULE.format(name="lazy_echo")))
+    (package / "helpers.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for module in [name for name in sys.modules if name.startswith("lazy_nodes_pkg")]:
+        del sys.modules[module]
+    for name in [name for name, node in n8n_nodes_registry.items() if node["function"].__module__.startswith("lazy_nodes_pkg")]:
+        del n8n_nodes_registry[name]
+
+
+def test_scan_directory_finds_node_modules(node_package):
+    assert scan_directory(node_package) == ["lazy_nodes_pkg.echo_nodes"]
+
+
+def test_snapshot_lets_workers_boot_without_importing_nodes(node_package, tmp_path):
+    snapshot = tmp_path / "registry.json"
+
+    (spec,) = discover(directories=[node_package], snapshot=snapshot, entry_point_group=None)
+    assert spec.name == "lazy_echo" and spec.description == "Echo the text back."
+    assert snapshot.exists()
+
+    del sys.modules["lazy_nodes_pkg.echo_nodes"]
+    specs = discover(directories=[node_package], snapshot=snapshot, entry_point_group=None)
+    assert specs == [spec]
+    assert "lazy_nodes_pkg.echo_nodes" not in sys.modules
+
+
+def test_routes_import_node_module_on_first_call(node_package, tmp_path):
+    specs = discover(directories=[node_package], snapshot=tmp_path / "registry.json", entry_point_group=None)
+    del sys.modules["lazy_nodes_pkg.echo_nodes"]
+    del n8n_nodes_registry["lazy_echo"]
+
+    router = APIRouter()
+    register_routes(router, specs)
+    app = FastAPI()
+    app.include_router(router, prefix="/nodes")
+    add_node_schemas(app)
+    client = TestClient(app)
+
+    assert "lazy_nodes_pkg.echo_nodes" not in sys.modules
+    assert client.post("/nodes/lazy_echo", json={"text": "hi"}).json() == {"text": "HI"}
+    assert "lazy_nodes_pkg.echo_nodes" in sys.modules
+    assert client.post("/nodes/lazy_echo", json={"wrong": 1}).status_code == 422
+    assert client.post("/nodes/lazy_echo", content=b"{").status_code == 422
+    document = client.get("/openapi.json").json()
+    schema = document["paths"]["/nodes/lazy_echo"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    assert schema["title"] == "EchoInput" and "$defs" not in schema
+    assert schema["properties"]["options"]["$ref"] == "#/components/schemas/Options"
+    assert document["components"]["schemas"]["Options"]["properties"]["shout"]["type"] == "boolean"
+    assert len([route for route in router.routes if route.path == "/lazy_echo"]) == 1
+
+
+def test_changed_module_is_reinspected(node_package, tmp_path):
+    snapshot = tmp_path / "registry.json"
+    discover(directories=[node_package], snapshot=snapshot, entry_point_group=None)
+
+    del sys.modules["lazy_nodes_pkg.echo_nodes"]
+    (node_package / "echo_nodes.py").write_text(textwrap.dedent(NODE_MODULE.format(name="renamed_echo_node")))
+    specs = discover(directories=[node_package], snapshot=snapshot, entry_point_group=None)
+
+    assert [spec.name for spec in specs] == ["renamed_echo_node"]
@@ -0,0 +1,182 @@
+"""Test the mutation outbox against a fake n8n server that can be taken down."""
+
+import asyncio
+
+import httpx
+
+from pyn8n.bench import BASE_URL, fake_client
+from pyn8n.fake_n8n import FakeN8n, create_app
+from pyn8n.models import Tag, Variable, Workflow
+from pyn8n.outbox import Outbox
+
+
+def server():
+    """A fake n8n whose ``down`` flag makes every request answer 503."""
+    state = FakeN8n()
+    state.seed(workflows=2)
+    app = create_app(state)
+    status = {"down": False, "requests": 0}
+
+    async def maintenance(scope, receive, send):
+        if scope["type"] == "http":
+            status["requests"] += 1
+            if status["down"]:
+                await send({"type": "http.response.start", "status": 503, "headers": []})
+                await send({"type": "http.response.body", "body": b"restarting"})
+                return
+        await app(scope, receive, send)
+
+    return state, status, fake_client(state, app=maintenance)
+
+
+def test_writes_queued_during_downtime_are_delivered(tmp_path):
+    state, status, client = server()
+    outbox = Outbox(tmp_path / "outbox.sqlite3", client, backoff=0.01)
+    writer = outbox.proxy()
+    status["down"] = True
+
+    async def run():
+        keys = [writer.create_variable(Variable(key=f"k{i}", value=str(i))) for i in range(5)]
+        keys.append(writer.activate_workflow("1"))
+        outbox.start()
+        await asyncio.sleep(0.05)
+        assert outbox.counts()["pending"] == 6
+        status["down"] = False
+        entries = await asyncio.gather(*(outbox.wait(key, timeout=5) for key in keys))
+        await outbox.stop()
+        return entries
+
+    entries = asyncio.run(run())
+    assert all(entry.status == "done" and entry.attempts > 1 for entry in entries)
+    assert sorted(variable["key"] for variable in state.variables.items.values()) == [f"k{i}" for i in range(5)]
+    assert state.workflows.get("1")["active"]
+    assert entries[0].result["data"]["key"] == "k0"
+
+
+def test_idempotency_keys_and_restart(tmp_path):
+    state, status, client = server()
+    path = tmp_path / "outbox.sqlite3"
+    first = Outbox(path, client)
+    writer = first.proxy()
+    assert writer.create_tag(Tag(name="once"), key="tag-once") == "tag-once"
+    assert writer.create_tag(Tag(name="once"), key="tag-once") == "tag-once"
+    first.close()
+
+    # A new process picks up what the previous one queued.
+    second = Outbox(path, client)
+    asyncio.run(second.stop(flush=True))
+    assert second.counts() == {"pending": 0, "sending": 0, "done": 1, "failed": 0}
+    sent = status["requests"]
+    second.enqueue("create_tag", Tag(name="once"), key="tag-once")
+    asyncio.run(second.stop(flush=True))
+    assert status["requests"] == sent, "a delivered key is never resent"
+    assert [tag["name"] for tag in state.tags.items.values()].count("once") == 1
+
+
+def test_client_errors_fail_without_retry_and_groups_keep_order(tmp_path):
+    state, status, client = server()
+    outbox = Outbox(tmp_path / "outbox.sqlite3", client, batch_size=10)
+    writer = outbox.proxy(group="workflow-1")
+    order = []
+    original = client.deactivate_workflow, client.activate_workflow
+
+    async def deactivate(workflow_id):
+        order.append("deactivate")
+        return await original[0](workflow_id)
+
+    async def activate(workflow_id):
+        order.append("activate")
+        return await original[1](workflow_id)
+
+    client.deactivate_workflow, client.activate_workflow = deactivate, activate
+    writer.deactivate_workflow("1")
+    writer.activate_workflow("1")
+    outbox.enqueue("create_variable", Variable(key="dup", value="a"), key="first")
+    outbox.enqueue("create_variable", Variable(key="dup", value="b"), key="second")
+
+    assert asyncio.run(outbox.drain_once()) == 3, "the group's second entry waits for its first"
+    assert asyncio.run(outbox.drain_once()) == 1
+    assert order == ["deactivate", "activate"] and state.workflows.get("1")["active"]
+    failed = outbox.entry("second")
+    assert failed.status == "failed" and failed.attempts == 1 and "409" in failed.error
+    assert outbox.counts() == {"pending": 0, "sending": 0, "done": 3, "failed": 1}
+
+
+def test_flush_while_draining_sends_each_entry_once(tmp_path):
+    state, status, client = server()
+    outbox = Outbox(tmp_path / "outbox.sqlite3", client, batch_size=5, concurrency=2)
+    writer = outbox.proxy()
+
+    async def run():
+        keys = [writer.create_tag(Tag(name=f"t{i}")) for i in range(20)]
+        outbox.start()
+        await asyncio.sleep(0)
+        await outbox.stop(flush=True)
+        return keys
+
+    keys = asyncio.run(run())
+    assert all(outbox.entry(key).attempts == 1 for key in keys)
+    names = [tag["name"] for tag in state.tags.items.values()]
+    assert sorted(names) == sorted(f"t{i}" for i in range(20))
+
+
+def test_cancelled_batch_keeps_completed_outcomes(tmp_path):
+    state, status, client = server()
+    path = tmp_path / "outbox.sqlite3"
+    outbox = Outbox(path, client, concurrency=3)
+    original = client.create_tag
+
+    async def create_tag(tag):
+        if tag.name == "slow":
+            await asyncio.Event().wait()
+        return await original(tag)
+
+    client.create_tag = create_tag
+    for name in ("a", "slow", "b"):
+        outbox.enqueue("create_tag", Tag(name=name), key=name)
+
+    async def run():
+        task = asyncio.create_task(outbox.drain_once())
+        while outbox.counts()["done"] < 2:
+            await asyncio.sleep(0.01)
+        assert outbox.counts()["sending"] == 1
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+    assert outbox.counts() == {"pending": 1, "sending": 0, "done": 2, "failed": 0}
+    outbox.close()
+
+    client.create_tag = original
+    reopened = Outbox(path, client)
+    asyncio.run(reopened.stop(flush=True))
+    assert sorted(tag["name"] for tag in state.tags.items.values()) == ["a", "b", "slow"]
+
+
+def test_a_failed_entry_blocks_the_rest_of_its_group(tmp_path):
+    state, status, client = server()
+    outbox = Outbox(tmp_path / "outbox.sqlite3", client)
+    writer = outbox.proxy(group="workflow-1")
+    state.workflows.get("1")["active"] = True
+
+    async def reject(workflow_id, workflow):
+        request = httpx.Request("PUT", f"{BASE_URL}/workflows/{workflow_id}")
+        raise httpx.HTTPStatusError("400 Bad Request", request=request, response=httpx.Response(400, request=request))
+
+    client.update_workflow = reject
+    writer.deactivate_workflow("1", key="deactivate")
+    writer.update_workflow("1", Workflow(name="broken", nodes=[], connections={}), key="update")
+    writer.activate_workflow("1", key="activate")
+    outbox.enqueue("create_tag", Tag(name="elsewhere"), key="other")
+
+    async def run():
+        waiting = asyncio.ensure_future(outbox.wait("activate"))
+        while await outbox.drain_once():
+            pass
+        return await waiting
+
+    activate = asyncio.run(run())
+    assert outbox.entry("update").status == "failed" and "400" in outbox.entry("update").error
+    assert activate.status == "failed" and activate.error == "blocked by update" and activate.attempts == 0
+    assert not state.workflows.get("1")["active"], "the old version is not re-activated"
+    assert outbox.entry("other").status == "done"
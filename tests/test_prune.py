@@ -0,0 +1,86 @@
+"""Test execution pruning."""
+
+import asyncio
+from datetime import timedelta
+
+import respx
+from httpx import ConnectError, ReadTimeout, Response
+
+from pyn8n.bench import BASE_URL
+from pyn8n.n8n_client import N8nClient
+from pyn8n.prune import PruneFilter, prune_executions
+
+
+def execution(execution_id, started_at):
+    return {
+        "id": execution_id,
+        "finished": True,
+        "mode": "trigger",
+        "startedAt": started_at,
+        "workflowId": "1",
+    }
+
+
+PAGES = [
+    {"data": [execution("3", "2999-01-01T00:00:00Z"), execution("2", "2020-01-02T00:00:00Z")], "nextCursor": "c1"},
+    {"data": [execution("1", "2020-01-01T00:00:00Z")], "nextCursor": None},
+]
+
+
+def mock_pages(mock):
+    def page(request):
+        return Response(200, json=PAGES[1] if request.url.params.get("cursor") == "c1" else PAGES[0])
+
+    return mock.get("/executions").mock(side_effect=page)
+
+
+def test_prune_dry_run_counts_old_executions():
+    with respx.mock(base_url=BASE_URL) as mock:
+        route = mock_pages(mock)
+        report = asyncio.run(
+            prune_executions(
+                N8nClient(base_url=BASE_URL), PruneFilter(status="error", older_than=timedelta(days=30)), dry_run=True
+            )
+        )
+
+    assert report.matched == 2
+    assert report.deleted == 0
+    assert route.calls[0].request.url.params["status"] == "error"
+
+
+def test_prune_deletes_and_retries_throttled_requests():
+    with respx.mock(base_url=BASE_URL) as mock:
+        mock_pages(mock)
+        mock.delete("/executions/2").mock(
+            side_effect=[Response(429), Response(200, json=execution("2", "2020-01-02T00:00:00Z"))]
+        )
+        mock.delete("/executions/1").respond(404)
+
+        progress = []
+        report = asyncio.run(
+            prune_executions(
+                N8nClient(base_url=BASE_URL),
+                PruneFilter(older_than=timedelta(days=30)),
+                rate=1000,
+                on_progress=progress.append,
+                progress_every=1,
+            )
+        )
+
+    assert (report.matched, report.deleted, report.missing, report.failed) == (2, 1, 1, 0)
+    assert len(progress) == 2
+
+
+def test_prune_retries_transport_and_server_errors_and_carries_on():
+    with respx.mock(base_url=BASE_URL) as mock:
+        mock_pages(mock)
+        mock.delete("/executions/2").mock(
+            side_effect=[ReadTimeout("slow"), Response(500), Response(200, json=execution("2", "2020-01-02T00:00:00Z"))]
+        )
+        mock.delete("/executions/1").mock(side_effect=ConnectError("refused"))
+
+        report = asyncio.run(
+            prune_executions(N8nClient(base_url=BASE_URL), PruneFilter(older_than=timedelta(days=30)), rate=1000, max_retries=2)
+        )
+
+    assert (report.matched, report.deleted, report.missing, report.failed) == (2, 1, 0, 1)
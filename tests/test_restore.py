@@ -0,0 +1,132 @@
+"""Test restoring export archives."""
+
+import asyncio
+import json
+
+import httpx
+import respx
+
+from pyn8n.bench import BASE_URL
+from pyn8n.n8n_client import N8nClient
+from pyn8n.restore import Checkpoint, restore_archive
+
+WORKFLOW = {
+    "id": "42",
+    "name": "Nightly",
+    "nodes": [],
+    "connections": {},
+    "active": True,
+    "tags": [{"id": "3", "name": "billing"}],
+    "projectId": "p1",
+}
+
+
+def write_archive(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+
+def mock_instance(mock):
+    mock.post("/tags", name="create_tag").respond(json={"id": "t-new", "name": "billing"})
+    mock.post("/projects", name="create_project").respond(json={"id": "p-new", "name": "Finance"})
+    mock.post("/variables").respond(json={"id": "v-new", "key": "region", "value": "eu"})
+    mock.post("/workflows", name="create_workflow").respond(json={**WORKFLOW, "id": "w-new", "tags": []})
+    mock.put("/workflows/w-new/tags", name="tags").respond(json=[{"id": "t-new", "name": "billing"}])
+    mock.put("/workflows/w-new/transfer", name="transfer").respond(json={})
+    mock.post("/workflows/w-new/activate", name="activate").respond(json={**WORKFLOW, "id": "w-new", "tags": []})
+
+
+def test_restore_remaps_ids_and_checkpoints(tmp_path):
+    archive = tmp_path / "export.jsonl"
+    checkpoint = tmp_path / "restore.checkpoint"
+    write_archive(archive, [
+        {"type": "workflow", "data": WORKFLOW},
+        {"type": "tag", "data": {"id": "3", "name": "billing"}},
+        {"type": "project", "data": {"id": "p1", "name": "Finance"}},
+        {"type": "variable", "data": {"id": "7", "key": "region", "value": "eu"}},
+    ])
+
+    with respx.mock(base_url=BASE_URL) as mock:
+        mock_instance(mock)
+        report = asyncio.run(restore_archive(N8nClient(base_url=BASE_URL), archive, checkpoint))
+
+        assert report.errors == []
+        assert report.created == {
+            "tag": 1, "project": 1, "variable": 1, "workflow": 1, "workflow_tags": 1, "transfer": 1, "activate": 1
+        }
+        assert mock["activate"].called
+        assert json.loads(mock["tags"].calls.last.request.content) == [{"id": "t-new"}]
+        assert json.loads(mock["transfer"].calls.last.request.content) == {"destinationProjectId": "p-new"}
+
+    assert Checkpoint(checkpoint).get("workflow", "42") == "w-new"
+
+
+def test_restore_resumes_from_checkpoint(tmp_path):
+    archive = tmp_path / "export.jsonl"
+    checkpoint = tmp_path / "restore.checkpoint"
+    write_archive(archive, [
+        {"type": "tag", "data": {"id": "3", "name": "billing"}},
+        {"type": "workflow", "data": {**WORKFLOW, "active": False, "projectId": None}},
+    ])
+    checkpoint.write_text(json.dumps({"kind": "tag", "old": "3", "new": "t-new"}) + "\n{\"kind\": \"wor")
+
+    with respx.mock(base_url=BASE_URL, assert_all_called=False) as mock:
+        mock_instance(mock)
+        report = asyncio.run(restore_archive(N8nClient(base_url=BASE_URL), archive, checkpoint))
+
+        assert not mock["create_tag"].called
+        assert not mock["activate"].called
+        assert report.skipped == {"tag": 1}
+        assert report.created == {"workflow": 1, "workflow_tags": 1}
+
+    assert Checkpoint(checkpoint).get("workflow", "42") == "w-new"
+
+
+def test_resume_retries_failed_follow_up_steps_without_recreating(tmp_path):
+    archive = tmp_path / "export.jsonl"
+    checkpoint = tmp_path / "restore.checkpoint"
+    write_archive(archive, [
+        {"type": "tag", "data": {"id": "3", "name": "billing"}},
+        {"type": "project", "data": {"id": "p1", "name": "Finance"}},
+        {"type": "workflow", "data": WORKFLOW},
+    ])
+
+    with respx.mock(base_url=BASE_URL, assert_all_called=False) as mock:
+        mock_instance(mock)
+        mock["transfer"].side_effect = [httpx.Response(500, text="busy"), httpx.Response(200, json={})]
+
+        first = asyncio.run(restore_archive(N8nClient(base_url=BASE_URL), archive, checkpoint))
+        assert [error.kind for error in first.errors] == ["transfer"]
+        assert not mock["activate"].called, "activation waits for the transfer"
+
+        second = asyncio.run(restore_archive(N8nClient(base_url=BASE_URL), archive, checkpoint))
+        assert second.errors == []
+        assert second.created == {"transfer": 1, "activate": 1}
+        assert mock["create_workflow"].call_count == 1
+        assert mock["tags"].call_count == 1
+
+
+def test_unmapped_references_are_errors_until_resolved(tmp_path):
+    archive = tmp_path / "export.jsonl"
+    checkpoint = tmp_path / "restore.checkpoint"
+    write_archive(archive, [
+        {"type": "project", "data": {"id": "p1", "name": "Finance"}},
+        {"type": "workflow", "data": {**WORKFLOW, "tags": []}},
+        {"type": "workflow", "data": {"id": "43", "name": "No nodes", "connections": {}}},
+    ])
+
+    with respx.mock(base_url=BASE_URL, assert_all_called=False) as mock:
+        mock_instance(mock)
+        mock["create_project"].side_effect = [httpx.ConnectError("refused"), httpx.Response(200, json={"id": "p-new", "name": "Finance"})]
+
+        first = asyncio.run(restore_archive(N8nClient(base_url=BASE_URL), archive, checkpoint))
+        assert sorted((error.kind, error.old_id) for error in first.errors) == [
+            ("project", "p1"), ("transfer", "42"), ("workflow", "43")
+        ]
+        assert "not restored" in next(error.message for error in first.errors if error.kind == "transfer")
+        assert not mock["transfer"].called and not mock["activate"].called
+
+        second = asyncio.run(restore_archive(N8nClient(base_url=BASE_URL), archive, checkpoint))
+        assert [error.old_id for error in second.errors] == ["43"], "a malformed record fails on its own"
+        assert second.created == {"project": 1, "transfer": 1, "activate": 1}
+        assert json.loads(mock["transfer"].calls.last.request.content) == {"destinationProjectId": "p-new"}
+        assert mock["create_workflow"].call_count == 1
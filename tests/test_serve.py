@@ -0,0 +1,23 @@
+"""Test the gunicorn configuration behind `pyn8n serve`."""
+
+from pyn8n.serve import NodeServer, NodeWorker, default_workers, gunicorn_options
+
+
+def test_options_scale_with_cores_and_preload():
+    options = gunicorn_options(port=9000, backlog=4096, keepalive=10)
+
+    assert options["workers"] == default_workers() >= 1
+    assert options["bind"] == "0.0.0.0:9000"
+    assert options["preload_app"] is True and options["reload"] is False
+    assert gunicorn_options(reload=True)["preload_app"] is False
+
+
+def test_server_applies_settings_and_loads_app():
+    server = NodeServer("pyn8n.api:app", gunicorn_options(workers=3, backlog=4096, keepalive=10))
+
+    assert server.cfg.workers == 3
+    assert server.cfg.backlog == 4096
+    assert server.cfg.keepalive == 10
+    assert server.cfg.worker_class is NodeWorker
+    assert NodeServer("pyn8n.api:app", gunicorn_options(reload=True)).load().title == "FastAPI"
+    assert NodeWorker.CONFIG_KWARGS["loop"] == "uvloop"
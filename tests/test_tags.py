@@ -0,0 +1,103 @@
+"""Test the tag index and bulk retagging against the fake n8n server."""
+
+import asyncio
+
+from pyn8n.bench import fake_client
+from pyn8n.fake_n8n import FakeN8n
+from pyn8n.tags import TagIndex, WorkflowFilter
+
+
+def seeded(workflows: int = 40):
+    state = FakeN8n()
+    state.seed(workflows=workflows, tags=3, nodes_per_workflow=1)
+    # Every other workflow already carries tag-0 ("1"), every third one tag-1 ("2").
+    for index, workflow_id in enumerate(sorted(state.workflows.items, key=int)):
+        tags = (["1"] if index % 2 == 0 else []) + (["2"] if index % 3 == 0 else [])
+        state.workflow_tags[str(workflow_id)] = tags
+    return state, fake_client(state)
+
+
+def counting(client, monkeypatch):
+    calls = []
+    original = client.update_workflow_tags
+
+    async def update(workflow_id, tag_ids):
+        calls.append(workflow_id)
+        return await original(workflow_id, tag_ids)
+
+    monkeypatch.setattr(client, "update_workflow_tags", update)
+    return calls
+
+
+def test_index_follows_create_rename_delete():
+    state, client = seeded(0)
+
+    async def run():
+        index = await TagIndex(client).load()
+        assert index.id_of("tag-1") == "2" and index.name_of("3") == "tag-2"
+        created = await index.create("fresh")
+        assert index.id_of("fresh") == created.id
+        state.tags.add({"name": "racing"})
+        assert (await index.create("racing")).name == "racing", "a 409 resolves to the existing tag"
+        await index.rename(created.id, "renamed")
+        assert index.id_of("fresh") is None and index.name_of(created.id) == "renamed"
+        await index.delete(created.id)
+        assert index.name_of(created.id) is None and len(index) == 4
+
+    asyncio.run(run())
+
+
+def test_retag_only_updates_workflows_that_change(monkeypatch):
+    state, client = seeded()
+    calls = counting(client, monkeypatch)
+    index = TagIndex(client, concurrency=4)
+
+    report = asyncio.run(index.retag(add=["tag-0", "new-tag"], remove=["tag-1", "missing"]))
+    assert report.matched == 40 and report.created_tags == ["new-tag"]
+    assert report.updated == 40 and report.unchanged == 0 and not report.errors
+    assert len(calls) == 40
+    new_id = index.id_of("new-tag")
+    assert all(tags == ["1", new_id] for tags in state.workflow_tags.values())
+
+    calls.clear()
+    again = asyncio.run(index.retag(add=["tag-0", "new-tag"], remove=["tag-1"]))
+    assert (again.updated, again.unchanged, again.created_tags) == (0, 40, [])
+    assert calls == []
+
+
+def test_retag_filter_and_dry_run(monkeypatch):
+    state, client = seeded()
+    calls = counting(client, monkeypatch)
+    index = TagIndex(client)
+
+    dry = asyncio.run(index.retag(WorkflowFilter(tags=["tag-1"]), remove=["tag-1"], dry_run=True))
+    assert dry.matched == 14 and dry.updated == 14 and calls == []
+
+    picked = {"1", "2", "3"}
+    report = asyncio.run(index.retag(WorkflowFilter(ids=picked), add=["tag-2"]))
+    assert report.matched == 3 and len(calls) == 3
+    assert all("3" in state.workflow_tags[workflow_id] for workflow_id in picked)
+
+
+def test_retag_removing_the_filtered_tag_reaches_every_page():
+    state, client = seeded(900)
+    report = asyncio.run(TagIndex(client).retag(WorkflowFilter(tags=["tag-1"]), remove=["tag-1"]))
+    assert report.matched == report.updated == 300
+    assert not any("2" in tags for tags in state.workflow_tags.values())
+
+
+def test_ensure_reloads_once_for_concurrent_conflicts(monkeypatch):
+    state, client = seeded(0)
+    index = asyncio.run(TagIndex(client).load())
+    for name in ("x", "y", "z"):
+        state.tags.add({"name": name})
+    loads = []
+    original = index.load
+
+    async def load():
+        loads.append(1)
+        return await original()
+
+    monkeypatch.setattr(index, "load", load)
+    tags = asyncio.run(index.ensure(["x", "y", "z", "new"]))
+    assert [tag.name for tag in tags] == ["x", "y", "z", "new"] and len(loads) == 1
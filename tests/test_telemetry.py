@@ -0,0 +1,102 @@
+"""Tests for N8nClient telemetry hooks and the metric primitives behind them."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from pyn8n.bench import fake_client
+from pyn8n.fake_n8n import FakeN8n
+from pyn8n.metrics import MetricsRegistry
+from pyn8n.telemetry import PHASES, InProcessCollector, PrometheusExporter, Span, Telemetry
+
+
+def instrumented_client(*exporters):
+    state = FakeN8n()
+    state.seed(workflows=5)
+    return fake_client(state, telemetry=Telemetry(*exporters))
+
+
+def test_spans_record_phases_and_payload_sizes():
+    collector = InProcessCollector()
+
+    async def run():
+        client = instrumented_client(collector)
+        try:
+            await client.get_workflows(limit=5)
+            await client.get_workflow("1")
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_workflow("999")
+        finally:
+            await client.shutdown()
+
+    asyncio.run(run())
+
+    listing, found, missing = collector.spans
+    assert [listing.endpoint, found.endpoint, missing.endpoint] == ["get_workflows", "get_workflow", "get_workflow"]
+    assert listing.status_code == 200 and listing.attempts == 1 and listing.retries == 0
+    assert listing.response_bytes > found.response_bytes > 0
+    assert listing.phases["decode"] > 0 and listing.phases["validate"] > 0
+    assert sum(listing.phases.values()) <= listing.duration
+    assert missing.status_code == 404 and missing.error == "HTTPStatusError"
+    assert missing.phases["validate"] == 0
+
+    summary = collector.summary()
+    assert summary["get_workflow"]["calls"] == 2 and summary["get_workflow"]["errors"] == 1
+
+
+def test_trace_events_split_connect_and_server_time():
+    span = Span("get_tags")
+
+    async def replay():
+        for event in (
+            "connection.connect_tcp.started",
+            "connection.retry.started",
+            "connection.connect_tcp.complete",
+            "http11.send_request_headers.started",
+            "http11.receive_response_headers.complete",
+        ):
+            await span.trace(event, {})
+
+    asyncio.run(replay())
+
+    assert span.retries == 1
+    assert span.phases["connect"] > 0 and span.phases["server"] > 0
+    assert span.headers_received
+
+
+def test_disabled_telemetry_installs_nothing(n8n_client):
+    assert n8n_client.telemetry is None
+    assert n8n_client.client.event_hooks == {"request": [], "response": []}
+    assert "get_workflows" not in vars(n8n_client)
+
+
+def test_prometheus_exporter_renders_histograms():
+    registry = MetricsRegistry()
+    exporter = PrometheusExporter(registry)
+
+    async def run():
+        client = instrumented_client(exporter)
+        try:
+            await client.get_tags()
+            await client.get_tags()
+        finally:
+            await client.shutdown()
+
+    asyncio.run(run())
+    text = exporter.render()
+
+    assert 'pyn8n_client_requests_total{endpoint="get_tags",status="200"} 2.0' in text
+    assert 'pyn8n_client_request_duration_seconds_count{endpoint="get_tags"} 2' in text
+    assert 'pyn8n_client_phase_duration_seconds_bucket{endpoint="get_tags",phase="decode",le="+Inf"} 2' in text
+    assert len([line for line in text.splitlines() if "phase_duration_seconds_count" in line]) == len(PHASES)
+
+
+def test_registry_rejects_conflicting_families():
+    registry = MetricsRegistry()
+    registry.counter("calls_total", "Calls.", ["endpoint"])
+
+    with pytest.raises(ValueError):
+        registry.gauge("calls_total", "Calls.", ["endpoint"])
+    with pytest.raises(ValueError):
+        registry.counter("calls_total", "Calls.", ["endpoint"]).labels("a", "b")
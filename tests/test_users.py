@@ -0,0 +1,103 @@
+"""Test bulk user provisioning against the fake n8n server."""
+
+import asyncio
+import json
+
+from pyn8n.bench import fake_client
+from pyn8n.fake_n8n import FakeN8n, create_app
+from pyn8n.users import UserInvite, provision_users
+
+
+def rejecting(app, marker: bytes):
+    """Answer 400 to any POST /users whose body contains ``marker``, like n8n does for a bad address."""
+
+    async def wrapped(scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not scope["path"].endswith("/users"):
+            return await app(scope, receive, send)
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        wrapped.posts.append(len(json.loads(body)))
+        if marker in body:
+            await send({"type": "http.response.start", "status": 400, "headers": []})
+            return await send({"type": "http.response.body", "body": b"invalid email"})
+
+        pending = [{"type": "http.request", "body": body, "more_body": False}]
+
+        async def replay():
+            return pending.pop() if pending else await receive()
+
+        return await app(scope, replay, send)
+
+    wrapped.posts = []
+    return wrapped
+
+
+def losing_responses(app, failures: int):
+    """Let the first ``failures`` POST /users reach the server but answer 503, as if the response was lost."""
+
+    async def wrapped(scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not scope["path"].endswith("/users"):
+            return await app(scope, receive, send)
+        wrapped.posts += 1
+        if wrapped.posts > failures:
+            return await app(scope, receive, send)
+
+        async def discard(message):
+            pass
+
+        await app(scope, receive, discard)
+        await send({"type": "http.response.start", "status": 503, "headers": []})
+        await send({"type": "http.response.body", "body": b"upstream timeout"})
+
+    wrapped.posts = 0
+    return wrapped
+
+
+def test_provision_creates_reconciles_and_changes_roles(n8n_state, n8n_client):
+    for email, role in [("keep@example.com", "global:member"), ("promote@example.com", "global:member")]:
+        n8n_state.users.add({"email": email, "role": role})
+
+    invites = [UserInvite(email=f"user{index}@example.com") for index in range(23)]
+    invites += [UserInvite(email="KEEP@example.com"), UserInvite(email="promote@example.com", role="global:admin")]
+    report = asyncio.run(provision_users(n8n_client, invites, batch_size=5, concurrency=3))
+
+    assert [result.email.lower() for result in report.results] == [invite.email.lower() for invite in invites]
+    assert report.counts() == {"created": 23, "role-changed": 1, "unchanged": 1, "failed": 0}
+    assert len(n8n_state.users.items) == 25
+    assert n8n_state.users.find(lambda user: user["email"] == "promote@example.com")["role"] == "global:admin"
+    assert all(result.id for result in report.results)
+
+    again = asyncio.run(provision_users(n8n_client, invites, batch_size=5))
+    assert again.counts()["unchanged"] == 25
+
+
+def test_rejected_chunks_are_split_down_to_the_bad_invite():
+    state = FakeN8n()
+    app = rejecting(create_app(state), b"not-an-email")
+    client = fake_client(state, app=app)
+
+    invites = [UserInvite(email=f"user{index}@example.com") for index in range(8)]
+    invites[5] = UserInvite(email="not-an-email")
+    report = asyncio.run(provision_users(client, invites, batch_size=8))
+
+    assert report.counts() == {"created": 7, "role-changed": 0, "unchanged": 0, "failed": 1}
+    (failed,) = report.failed
+    assert failed.email == "not-an-email" and failed.error.startswith("400")
+    assert app.posts[0] == 8 and len(app.posts) < 8
+
+
+def test_server_errors_resend_the_chunk_and_reconcile_against_the_listing():
+    state = FakeN8n()
+    app = losing_responses(create_app(state), failures=1)
+    client = fake_client(state, app=app)
+
+    invites = [UserInvite(email=f"user{index}@example.com") for index in range(6)]
+    report = asyncio.run(provision_users(client, invites, batch_size=6, backoff=0))
+
+    assert app.posts == 2, "the same chunk is resent once, not split"
+    assert report.counts() == {"created": 6, "role-changed": 0, "unchanged": 0, "failed": 0}
+    assert all(result.id for result in report.results) and len(state.users.items) == 6
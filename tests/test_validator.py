@@ -0,0 +1,104 @@
+"""Test offline workflow validation."""
+
+import json
+
+from pyn8n.builder import WorkflowBuilder
+from pyn8n.models import CredentialReference, Workflow, WorkflowNode
+from pyn8n.validator import validate_directory, validate_file, validate_workflow
+
+
+def valid_workflow() -> Workflow:
+    wf = WorkflowBuilder("Valid")
+    wf.add("n8n-nodes-base.webhook", parameters={"path": "hook"}).then(
+        "n8n-nodes-base.httpRequest", parameters={"url": "https://example.com"}
+    )
+    return wf.build()
+
+
+def codes(issues):
+    return sorted(issue.code for issue in issues)
+
+
+def test_valid_workflow_has_no_issues():
+    assert validate_workflow(valid_workflow()) == []
+
+
+def test_structural_problems_are_reported():
+    node = dict(type="n8n-nodes-base.set", typeVersion=1, position=[0, 0])
+    workflow = Workflow(
+        name="Broken",
+        nodes=[
+            WorkflowNode(id="1", name="A", **node),
+            WorkflowNode(id="1", name="A", **node),
+            WorkflowNode(id="2", name="Fetch", type="n8n-nodes-base.httpRequest", typeVersion=4, position=[0, 0]),
+        ],
+        connections={
+            "A": {"main": [[{"node": "Ghost", "type": "main", "index": 0}]]},
+            "2": {"main": [[{"node": "A", "type": "main", "index": 0}]]},
+        },
+    )
+
+    issues = validate_workflow(workflow)
+
+    assert codes(issues) == [
+        "connection-by-id", "duplicate-id", "duplicate-name", "missing-parameter", "no-trigger", "unknown-target"
+    ]
+    assert next(issue for issue in issues if issue.code == "connection-by-id").severity == "error"
+
+
+def test_connection_targets_must_be_node_names():
+    workflow = valid_workflow()
+    source = next(iter(workflow.connections))
+    target = workflow.connections[source]["main"][0][0]
+    target["node"] = next(node.id for node in workflow.nodes if node.name == target["node"])
+
+    issues = validate_workflow(workflow)
+
+    assert codes(issues) == ["connection-by-id"]
+    assert issues[0].node == source and issues[0].severity == "error"
+
+
+def test_malformed_connections_are_reported_not_raised(tmp_path):
+    workflow = valid_workflow()
+    source = next(iter(workflow.connections))
+    target = workflow.connections[source]["main"][0][0]["node"]
+
+    workflow.connections = {source: {"main": [[target]]}}
+    issues = validate_workflow(workflow)
+    assert codes(issues) == ["malformed-connection"] and issues[0].node == source
+
+    workflow.connections = {source: [[{"node": target}]]}
+    assert codes(validate_workflow(workflow)) == ["malformed-connection"]
+
+    path = tmp_path / "bad.json"
+    path.write_text(workflow.model_dump_json())
+    assert codes(validate_directory(tmp_path, workers=1)[str(path)]) == ["malformed-connection"]
+
+
+def test_credential_references_and_custom_rules():
+    workflow = valid_workflow()
+    workflow.nodes[1].credentials = {"httpBasicAuth": CredentialReference(id="7", name="Basic")}
+
+    assert validate_workflow(workflow, known_credentials={"Basic"}) == []
+    assert codes(validate_workflow(workflow, known_credentials={"8"})) == ["unknown-credential"]
+    assert codes(validate_workflow(workflow, required_parameters={"n8n-nodes-base.webhook": ["httpMethod"]})) == [
+        "missing-parameter"
+    ]
+
+
+def test_directory_batch_on_process_pool(tmp_path):
+    for index in range(6):
+        (tmp_path / f"wf{index}.json").write_text(valid_workflow().model_dump_json())
+    broken = valid_workflow().model_dump()
+    broken["nodes"][0]["type"] = "n8n-nodes-base.set"
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "broken.json").write_text(json.dumps(broken))
+    (tmp_path / "garbage.json").write_text("{not json")
+
+    results = validate_directory(tmp_path, workers=2)
+
+    assert len(results) == 8
+    assert codes(results[str(tmp_path / "nested" / "broken.json")]) == ["no-trigger"]
+    assert codes(results[str(tmp_path / "garbage.json")]) == ["invalid-file"]
+    assert sum(bool(issues) for issues in results.values()) == 2
+    assert validate_file(tmp_path / "wf0.json")[1] == []
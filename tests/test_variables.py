@@ -0,0 +1,76 @@
+"""Test the in-memory variable store against the fake n8n server."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from pyn8n.fake_n8n import FakeN8n
+from pyn8n.variables import VariableStore
+
+
+def server_values(state: FakeN8n):
+    return {item["key"]: item["value"] for item in state.variables.items.values()}
+
+
+def test_load_get_upsert_and_callbacks(n8n_state, n8n_client):
+    for index in range(300):
+        n8n_state.variables.add({"key": f"k{index}", "value": str(index), "type": "string"})
+    changes = []
+
+    async def run():
+        store = VariableStore(n8n_client, interval=None, concurrency=4)
+        async with store:
+            assert len(store) == 300 and store.get("k299") == "299" and store.get("nope", "x") == "x"
+            store.on_change(lambda key, old, new: changes.append((key, old, new)))
+
+            await store.set_many({"k1": "one", "k2": "2", "fresh": "new"})
+            assert store["k1"] == "one" and store["fresh"] == "new"
+            assert await store.delete("k3") and not await store.delete("k3")
+        return store
+
+    asyncio.run(run())
+    assert sorted(changes) == [("fresh", None, "new"), ("k1", "1", "one"), ("k3", "3", None)]
+    values = server_values(n8n_state)
+    assert values["k1"] == "one" and values["fresh"] == "new" and "k3" not in values and len(values) == 300
+
+
+def test_background_refresh_publishes_remote_changes(n8n_state, n8n_client):
+    n8n_state.variables.add({"key": "mode", "value": "a", "type": "string"})
+    changes = []
+
+    async def run():
+        async with VariableStore(n8n_client, interval=0.01) as store:
+            store.on_change(lambda key, old, new: changes.append((key, old, new)))
+            n8n_state.variables.items[1]["value"] = "b"
+            n8n_state.variables.add({"key": "added", "value": "x", "type": "string"})
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if len(changes) >= 2:
+                    break
+            return store.snapshot()
+
+    assert asyncio.run(run()) == {"mode": "b", "added": "x"}
+    assert sorted(changes) == [("added", None, "x"), ("mode", "a", "b")]
+
+
+def test_failed_replace_restores_the_old_value(n8n_state, n8n_client, monkeypatch):
+    n8n_state.variables.add({"key": "mode", "value": "a", "type": "string"})
+    create = n8n_client.create_variable
+
+    async def flaky(variable):
+        if variable.value == "b":
+            raise httpx.ConnectError("down")
+        return await create(variable)
+
+    async def run():
+        store = VariableStore(n8n_client, interval=None)
+        await store.refresh()
+        monkeypatch.setattr(n8n_client, "create_variable", flaky)
+        with pytest.raises(httpx.ConnectError):
+            await store.set("mode", "b")
+        return store
+
+    store = asyncio.run(run())
+    assert store.get("mode") == "a"
+    assert server_values(n8n_state) == {"mode": "a"}
@@ -0,0 +1,100 @@
+"""Test following executions with N8nClient.watch_executions."""
+
+import asyncio
+
+import respx
+from httpx import Response
+
+from pyn8n.bench import BASE_URL
+from pyn8n.n8n_client import N8nClient
+
+
+def execution(execution_id, finished=True):
+    return {
+        "id": str(execution_id),
+        "finished": finished,
+        "mode": "trigger",
+        "startedAt": "2024-01-01T00:00:00Z",
+        "stoppedAt": "2024-01-01T00:00:01Z" if finished else None,
+        "workflowId": "1",
+    }
+
+
+def test_watch_yields_new_and_completed_executions():
+    def listing(request):
+        if request.url.params.get("status") in ("waiting", "running"):
+            return Response(200, json={"data": []})
+        return Response(200, json={"data": [execution(3, finished=False), execution(2), execution(1)]})
+
+    async def watch():
+        seen = []
+        async for item in N8nClient(base_url=BASE_URL).watch_executions(since_id=1, min_interval=0, max_interval=0):
+            seen.append((item.id, item.finished))
+            if len(seen) == 3:
+                break
+        return seen
+
+    with respx.mock(base_url=BASE_URL) as mock:
+        mock.get("/executions").mock(side_effect=listing)
+        refetch = mock.get("/executions/3").respond(json=execution(3))
+        seen = asyncio.run(watch())
+
+        assert refetch.call_count == 1
+
+    assert seen == [("2", True), ("3", False), ("3", True)]
+
+
+def test_watch_starts_at_newest_execution():
+    async def first():
+        watcher = N8nClient(base_url=BASE_URL).watch_executions(min_interval=0, max_interval=0)
+        return await anext(watcher)
+
+    with respx.mock(base_url=BASE_URL) as mock:
+        mock.get("/executions").mock(
+            side_effect=[
+                Response(200, json={"data": [execution(5)]}),
+                Response(200, json={"data": [execution(5)]}),
+                Response(200, json={"data": [execution(6), execution(5)], "nextCursor": "c"}),
+            ]
+        )
+        assert asyncio.run(first()).id == "6"
+
+
+def test_watch_refetches_only_executions_that_left_the_unfinished_listings():
+    started = [execution(execution_id, finished=False) for execution_id in (2, 3, 4, 5)]
+    polls = {"count": 0}
+
+    def listing(request):
+        status = request.url.params.get("status")
+        if status is None:
+            polls["count"] += 1
+            return Response(200, json={"data": started[::-1]})
+        if polls["count"] > 1 and status == "running":
+            return Response(200, json={"data": [execution(5, finished=False)]})
+        if polls["count"] > 1 and status == "waiting" and not request.url.params.get("cursor"):
+            # Paged: the waiting execution is only on the second page.
+            return Response(200, json={"data": [], "nextCursor": "next"})
+        if polls["count"] > 1 and status == "waiting":
+            return Response(200, json={"data": [execution(4, finished=False), execution(1, finished=False)]})
+        return Response(200, json={"data": []})
+
+    async def watch():
+        seen = []
+        async for item in N8nClient(base_url=BASE_URL).watch_executions(since_id=1, min_interval=0, max_interval=0):
+            seen.append((item.id, item.finished))
+            if len(seen) == 5:
+                break
+        return seen
+
+    with respx.mock(base_url=BASE_URL, assert_all_called=False) as mock:
+        mock.get("/executions").mock(side_effect=listing)
+        done = mock.get("/executions/2").respond(json=execution(2))
+        deleted = mock.get("/executions/3").respond(404, json={"message": "not found"})
+        waiting = mock.get("/executions/4").respond(json=execution(4, finished=False))
+        running = mock.get("/executions/5").respond(json=execution(5, finished=False))
+        seen = asyncio.run(watch())
+
+        assert done.call_count == 1 and deleted.call_count == 1
+        assert not waiting.called and not running.called
+
+    assert seen == [("2", False), ("3", False), ("4", False), ("5", False), ("2", True)]
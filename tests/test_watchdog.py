@@ -0,0 +1,49 @@
+"""Test the event-loop watchdog."""
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from pyn8n.watchdog import Watchdog, WatchdogMiddleware
+
+
+def blocking_node(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def test_watchdog_captures_stack_of_blocking_coroutine():
+    watchdog = Watchdog(threshold=0.05)
+
+    async def run():
+        watchdog.start()
+        await asyncio.sleep(0.05)
+        blocking_node(0.3)
+        await asyncio.sleep(0.1)
+        watchdog.stop()
+
+    asyncio.run(run())
+
+    (event,) = watchdog.events
+    assert event.duration is not None and event.duration >= 0.25
+    assert any("blocking_node" in line for line in event.stack)
+
+
+def test_watchdog_attributes_block_to_route():
+    watchdog = Watchdog(threshold=0.05)
+    app = FastAPI(on_startup=[watchdog.start], on_shutdown=[watchdog.stop])
+    app.add_middleware(WatchdogMiddleware, watchdog=watchdog)
+
+    @app.get("/slow/{seconds}")
+    async def slow(seconds: float):
+        blocking_node(seconds)
+        return {}
+
+    with TestClient(app) as client:
+        client.get("/slow/0.3")
+        time.sleep(0.1)
+
+    (event,) = watchdog.events
+    assert event.route == "GET /slow/{seconds}"
+    assert event.endpoint.endswith("test_watchdog_attributes_block_to_route.<locals>.slow")
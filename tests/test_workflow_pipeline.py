@@ -0,0 +1,91 @@
+"""Test the generate, validate, repair and upload pipeline."""
+
+import asyncio
+
+from pyn8n.bench import fake_client
+from pyn8n.builder import WorkflowBuilder
+from pyn8n.fake_n8n import FakeN8n
+from pyn8n.generation import GenerationService, GenerationSettings
+from pyn8n.workflow_pipeline import WorkflowPipeline, repair_prompt
+
+
+def broken(name: str):
+    workflow = WorkflowBuilder(name)
+    workflow.add("n8n-nodes-base.webhook", parameters={"path": name}).then("n8n-nodes-base.set")
+    workflow.connect("Set", "Missing")
+    workflow.add("n8n-nodes-base.noOp", name="Missing")
+    built = workflow.build()
+    built.nodes = built.nodes[:2]
+    return built
+
+
+def valid(name: str):
+    workflow = WorkflowBuilder(name)
+    workflow.add("n8n-nodes-base.webhook", parameters={"path": name}).then("n8n-nodes-base.set")
+    return workflow.build()
+
+
+class FakeLLM:
+    def __init__(self):
+        self.prompts = []
+
+    async def __call__(self, cls, prompt, model):
+        self.prompts.append(prompt)
+        name = prompt.splitlines()[0]
+        if name == "hopeless" or "unknown-target" not in prompt:
+            return broken(name)
+        return valid(name)
+
+
+def test_invalid_generations_are_repaired_before_upload(tmp_path):
+    state = FakeN8n()
+    llm = FakeLLM()
+    generation = GenerationService(GenerationSettings(cache_dir=tmp_path, model="test"), generate=llm)
+    pipeline = WorkflowPipeline(fake_client(state), generation, max_attempts=3, concurrency=4)
+
+    outcomes = asyncio.run(pipeline.run([f"flow {index}" for index in range(5)] + ["hopeless"]))
+
+    for outcome in outcomes[:5]:
+        assert outcome.valid and outcome.attempts == 2
+        assert outcome.uploaded is not None and outcome.uploaded.id
+    assert [outcome.prompt for outcome in outcomes] == [f"flow {index}" for index in range(5)] + ["hopeless"]
+    hopeless = outcomes[5]
+    assert not hopeless.valid and hopeless.attempts == 3 and hopeless.uploaded is None
+    assert [issue.code for issue in hopeless.issues] == ["unknown-target"]
+    assert len(state.workflows.items) == 5
+
+    repair = llm.prompts[-1]
+    assert "Missing" in repair and "Your previous workflow was" in repair
+
+
+def test_repair_prompt_lists_only_the_errors():
+    workflow = broken("demo")
+    prompt = repair_prompt("demo", workflow, WorkflowPipeline(generation=GenerationService()).check(workflow))
+    assert prompt.startswith("demo\n")
+    assert "- unknown-target (node Set): connection to unknown node 'Missing'" in prompt
+    assert "no-trigger" not in prompt
+
+
+def test_unreadable_or_id_keyed_connections_are_repaired(tmp_path):
+    shapes = iter(["malformed", "by-id", "valid"])
+    prompts = []
+
+    async def llm(cls, prompt, model):
+        prompts.append(prompt)
+        workflow = valid("flow")
+        source = next(iter(workflow.connections))
+        target = workflow.connections[source]["main"][0][0]["node"]
+        shape = next(shapes)
+        if shape == "malformed":
+            workflow.connections = {source: {"main": [[target]]}}
+        elif shape == "by-id":
+            workflow.connections[source]["main"][0][0]["node"] = workflow.nodes[1].id
+        return workflow
+
+    generation = GenerationService(GenerationSettings(cache_dir=tmp_path, model="test"), generate=llm)
+    pipeline = WorkflowPipeline(generation=generation, max_attempts=3)
+
+    outcome = asyncio.run(pipeline.produce("flow"))
+
+    assert outcome.valid and outcome.attempts == 3 and outcome.error is None
+    assert "malformed-connection" in prompts[1] and "connection-by-id" in prompts[2]